@@ -5,6 +5,7 @@
 import machine
 import ssd1306
 from time import sleep
+from icon import Icon
 
 # Inicializa la interfaz I2C
 i2c = machine.SoftI2C(
@@ -24,8 +25,8 @@ oled_alto = 64
 # Inicializa la pantalla OLED
 oled = ssd1306.SSD1306_I2C(oled_ancho, oled_alto, i2c)
 
-# Matriz de puntos para el ícono
-ICONO = [
+# Matriz de puntos para el ícono, Icon la empaqueta una sola vez en bits
+ICONO = Icon([
     [0, 0, 1, 0, 0, 0, 1, 0, 0],
     [0, 0, 1, 0, 0, 0, 1, 0, 0],
     [0, 1, 1, 1, 1, 1, 1, 1, 0],
@@ -35,23 +36,19 @@ ICONO = [
     [1, 0, 1, 1, 1, 1, 1, 0, 1],
     [0, 0, 1, 1, 0, 1, 1, 0, 0],
     [0, 1, 1, 1, 0, 1, 1, 1, 0],
-]
+])
 
 # aquí lo que hacemos es que cuando detecta un 1 dibuja de tal forma que si es 2 por ejemplo se dibuja un cuadrado de 2x2 y si es 3 un cuadrado de 3x3 etc
-def dibujar_icono(oled, matriz, x0=0, y0=0, escala=1):
-    # Dibuja una matriz de icono en la pantalla OLED con un factor de escala.
+def dibujar_icono(oled, icono, x0=0, y0=0, escala=1):
+    # Dibuja un icono en la pantalla OLED con un factor de escala.
 
     # oled   -> objeto SSD1306
-    # matriz -> lista de listas con 0 y 1
+    # icono  -> Icon creado a partir de la matriz de 0 y 1
     # x0, y0 -> posición inicial en pantalla
     # escala -> tamaño de escalado (1 = normal, 2 = doble, etc.)
-    
-    for y, fila in enumerate(matriz):
-        for x, c in enumerate(fila):
-            if c:  # Solo dibuja si es un "1"
-                for dy in range(escala):
-                    for dx in range(escala):
-                        oled.pixel(x0 + x*escala + dx, y0 + y*escala + dy, 1)
+    # la primera vez se dibuja la version escalada con un fill_rect por cada
+    # tramo de unos de cada fila y se guarda; despues es un solo blit
+    icono.blit(oled, x0, y0, escala)
 
     oled.show()
     
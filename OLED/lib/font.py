@@ -0,0 +1,139 @@
+# Scaled bitmap fonts with a glyph atlas and allocation-free numbers.
+#
+#   BIG = Font(2)                               # digits, space, '.', '-'
+#   BIG.number(oled, score, 24, 0, 2)           # right aligned in 2 cells
+#   BIG.number(oled, decivolts, 52, 0, 3, 1)    # 33 -> " 3.3"
+#   Font(1, "ABC").text(oled, "CAB", 0, 16)
+#
+# The 5x7 font is stored packed, five column bytes per glyph (bit 0 on
+# top) for ASCII 0x20-0x7E. A Font renders the characters it is given once,
+# at its scale, into one bytearray atlas; each glyph is a MONO_VLSB
+# FrameBuffer over its own slice of the atlas. A cell is (5 + spacing) *
+# scale wide and 8 * scale tall (whole pages when y is a multiple of 8) and
+# is blitted with its background, so new digits overwrite the old ones
+# without a fill_rect first.
+#
+# number() takes an int (scale floats to fixed point once, e.g. volts * 10)
+# and picks the digits with // and %, so nothing is allocated per frame;
+# text() is for labels. Both mark the drawn cells dirty once.
+
+import framebuf
+
+FIRST = 0x20
+DIGITS = "0123456789 .-"
+
+_5X7 = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x5f\x00\x00\x00\x07\x00\x07\x00\x14"
+    b"\x7f\x14\x7f\x14\x24\x2a\x7f\x2a\x12\x23\x13\x08\x64\x62\x36\x49"
+    b"\x56\x20\x50\x00\x00\x07\x00\x00\x00\x1c\x22\x41\x00\x00\x41\x22"
+    b"\x1c\x00\x2a\x1c\x7f\x1c\x2a\x08\x08\x3e\x08\x08\x00\x50\x30\x00"
+    b"\x00\x08\x08\x08\x08\x08\x00\x60\x60\x00\x00\x20\x10\x08\x04\x02"
+    b"\x3e\x51\x49\x45\x3e\x00\x42\x7f\x40\x00\x42\x61\x51\x49\x46\x21"
+    b"\x41\x45\x4b\x31\x18\x14\x12\x7f\x10\x27\x45\x45\x45\x39\x3c\x4a"
+    b"\x49\x49\x30\x01\x71\x09\x05\x03\x36\x49\x49\x49\x36\x06\x49\x49"
+    b"\x29\x1e\x00\x36\x36\x00\x00\x00\x56\x36\x00\x00\x08\x14\x22\x41"
+    b"\x00\x14\x14\x14\x14\x14\x00\x41\x22\x14\x08\x02\x01\x51\x09\x06"
+    b"\x32\x49\x79\x41\x3e\x7e\x11\x11\x11\x7e\x7f\x49\x49\x49\x36\x3e"
+    b"\x41\x41\x41\x22\x7f\x41\x41\x22\x1c\x7f\x49\x49\x49\x41\x7f\x09"
+    b"\x09\x09\x01\x3e\x41\x49\x49\x7a\x7f\x08\x08\x08\x7f\x00\x41\x7f"
+    b"\x41\x00\x20\x40\x41\x3f\x01\x7f\x08\x14\x22\x41\x7f\x40\x40\x40"
+    b"\x40\x7f\x02\x0c\x02\x7f\x7f\x04\x08\x10\x7f\x3e\x41\x41\x41\x3e"
+    b"\x7f\x09\x09\x09\x06\x3e\x41\x51\x21\x5e\x7f\x09\x19\x29\x46\x46"
+    b"\x49\x49\x49\x31\x01\x01\x7f\x01\x01\x3f\x40\x40\x40\x3f\x1f\x20"
+    b"\x40\x20\x1f\x3f\x40\x38\x40\x3f\x63\x14\x08\x14\x63\x07\x08\x70"
+    b"\x08\x07\x61\x51\x49\x45\x43\x00\x7f\x41\x41\x00\x02\x04\x08\x10"
+    b"\x20\x00\x41\x41\x7f\x00\x04\x02\x01\x02\x04\x40\x40\x40\x40\x40"
+    b"\x00\x01\x02\x04\x00\x20\x54\x54\x54\x78\x7f\x48\x44\x44\x38\x38"
+    b"\x44\x44\x44\x20\x38\x44\x44\x48\x7f\x38\x54\x54\x54\x18\x08\x7e"
+    b"\x09\x01\x02\x0c\x52\x52\x52\x3e\x7f\x08\x04\x04\x78\x00\x44\x7d"
+    b"\x40\x00\x20\x40\x44\x3d\x00\x7f\x10\x28\x44\x00\x00\x41\x7f\x40"
+    b"\x00\x7c\x04\x18\x04\x78\x7c\x08\x04\x04\x78\x38\x44\x44\x44\x38"
+    b"\x7c\x14\x14\x14\x08\x08\x14\x14\x18\x7c\x7c\x08\x04\x04\x08\x48"
+    b"\x54\x54\x54\x20\x04\x3f\x44\x40\x20\x3c\x40\x40\x20\x7c\x1c\x20"
+    b"\x40\x20\x1c\x3c\x40\x30\x40\x3c\x44\x28\x10\x28\x44\x0c\x50\x50"
+    b"\x50\x3c\x44\x64\x54\x4c\x44\x00\x08\x36\x41\x00\x00\x00\x7f\x00"
+    b"\x00\x00\x41\x36\x08\x00\x08\x04\x08\x10\x08"
+)
+
+
+class Font:
+    def __init__(self, scale=1, chars=DIGITS, spacing=1):
+        self.scale = scale
+        self.w = (5 + spacing) * scale
+        self.h = 8 * scale
+        cell = self.w * scale
+        self.atlas = bytearray(cell * len(chars))
+        mv = memoryview(self.atlas)
+        # glyph number + 1 by character code, 0 for characters not rendered
+        self._index = bytearray(128)
+        self._glyphs = []
+        for i, ch in enumerate(chars):
+            fb = framebuf.FrameBuffer(mv[i * cell:(i + 1) * cell], self.w, self.h, framebuf.MONO_VLSB)
+            self._render(fb, ord(ch))
+            self._glyphs.append(fb)
+            self._index[ord(ch)] = i + 1
+
+    def _render(self, fb, code):
+        if not FIRST <= code < FIRST + len(_5X7) // 5:
+            return
+        s = self.scale
+        base = (code - FIRST) * 5
+        for c in range(5):
+            bits = _5X7[base + c]
+            r = 0
+            # one fill_rect per vertical run of set pixels
+            while bits:
+                if bits & 1:
+                    r0 = r
+                    while bits & 1:
+                        bits >>= 1
+                        r += 1
+                    fb.fill_rect(c * s, r0 * s, s, (r - r0) * s, 1)
+                else:
+                    bits >>= 1
+                    r += 1
+
+    def glyph(self, code):
+        i = self._index[code] if code < 128 else 0
+        return self._glyphs[i - 1] if i else None
+
+    def _put(self, oled, code, x, y):
+        g = self.glyph(code)
+        if g is None:
+            oled.fill_rect(x, y, self.w, self.h, 0)
+        else:
+            oled.blit_raw(g, x, y)
+
+    def text(self, oled, s, x, y):
+        # characters missing from the atlas are drawn as blanks
+        x0 = x
+        for ch in s:
+            self._put(oled, ord(ch), x, y)
+            x += self.w
+        oled.mark_dirty(x0, y, x - x0, self.h)
+        return x
+
+    def number(self, oled, value, x, y, digits, decimals=0):
+        # digits cells (plus one for the point), leading blanks and the
+        # '-' next to the first digit; digits that do not fit are cut
+        cells = digits + (1 if decimals else 0)
+        # the point and at least one digit before it are always drawn
+        fixed = decimals + 2 if decimals else 1
+        neg = value < 0
+        if neg:
+            value = -value
+        cx = x + (cells - 1) * self.w
+        for i in range(cells):
+            if decimals and i == decimals:
+                code = 0x2E
+            elif value or i < fixed:
+                code = 0x30 + value % 10
+                value //= 10
+            elif neg:
+                code = 0x2D
+                neg = False
+            else:
+                code = 0x20
+            self._put(oled, code, cx, y)
+            cx -= self.w
+        oled.mark_dirty(x, y, cells * self.w, self.h)
@@ -0,0 +1,67 @@
+# Scaled drawing of small 0/1 matrix icons.
+#
+#   ICONO = Icon([[0, 1, 0], [1, 1, 1]])
+#   ICONO.blit(oled, 10, 5, escala=4)   # pre-scaled FrameBuffer, cached
+#   ICONO.draw(oled, 10, 5, escala=4)   # fill_rect per run, nothing cached
+#
+# The matrix is packed once into MONO_HLSB rows and merged into horizontal
+# runs of set cells, so draw() makes one fill_rect call per run instead of
+# escala * escala pixel() calls per cell. blit() renders each scale once
+# into a MONO_VLSB FrameBuffer kept in an ImageCache (OLED/lib/imagecache.py)
+# and then costs a single blit; only set pixels are drawn, like draw().
+# Scale 1 blits the packed rows directly.
+
+import framebuf
+from imagecache import ImageCache
+
+
+class Icon:
+    def __init__(self, matrix, cache=None):
+        self.h = len(matrix)
+        self.w = len(matrix[0]) if matrix else 0
+        stride = (self.w + 7) >> 3
+        self.stride = stride
+        self.data = bytearray(stride * self.h)
+        # (x, y, length) for every horizontal run of set cells
+        runs = []
+        for y, fila in enumerate(matrix):
+            x = 0
+            while x < self.w:
+                if fila[x]:
+                    x0 = x
+                    while x < self.w and fila[x]:
+                        self.data[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+                        x += 1
+                    runs.append((x0, y, x - x0))
+                else:
+                    x += 1
+        self.runs = tuple(runs)
+        self.cache = cache if cache is not None else ImageCache(budget=2048)
+        self._keys = {}
+        # scale 1 draws from the packed rows themselves
+        self._fb1 = framebuf.FrameBuffer(self.data, self.w, self.h, framebuf.MONO_HLSB)
+
+    def draw(self, fbuf, x0=0, y0=0, escala=1, c=1):
+        for x, y, n in self.runs:
+            fbuf.fill_rect(x0 + x * escala, y0 + y * escala, n * escala, escala, c)
+
+    def framebuffer(self, escala=1):
+        if escala == 1:
+            return self._fb1
+        key = self._keys.get(escala)
+        if key is None:
+            key = self._keys[escala] = (id(self), escala)
+            w = self.w * escala
+            h = self.h * escala
+
+            def render():
+                buf = bytearray(w * ((h + 7) >> 3))
+                self.draw(framebuf.FrameBuffer(buf, w, h, framebuf.MONO_VLSB), 0, 0, escala)
+                return buf
+
+            self.cache.add(key, render, w, h)
+        return self.cache.get(key)
+
+    def blit(self, oled, x0=0, y0=0, escala=1):
+        # key 0: unset pixels leave the screen as it was
+        oled.blit(self.framebuffer(escala), x0, y0, 0)
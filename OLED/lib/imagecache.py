@@ -0,0 +1,72 @@
+# FrameBuffer cache for images drawn from callbacks and interrupt paths.
+#
+#   imagenes = ImageCache(budget=2048)
+#   imagenes.add("logo", LOGO, 128, 64)            # bytes, MONO_VLSB
+#   imagenes.add("icono", leer_icono, 32, 32, framebuf.MONO_HLSB)
+#   imagenes.get("logo")                           # build it now, not in the IRQ
+#   ...
+#   oled.blit(imagenes.get("logo"), -5, 0)
+#
+# Each image is turned into a bytearray and a FrameBuffer the first time it
+# is requested and the same object is handed out afterwards, so a handler
+# that draws it allocates nothing. The bytearrays of all cached images stay
+# under budget bytes: the least recently used ones are dropped (and rebuilt
+# on their next get()) to make room. A source is either bytes-like image
+# data or a function returning a writable buffer, e.g. a file reader.
+
+import framebuf
+
+
+class ImageCache:
+    def __init__(self, budget=4096):
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._src = {}
+        # name -> [FrameBuffer, buffer size, last use]
+        self._fb = {}
+        self._tick = 0
+
+    def add(self, name, source, w, h, fmt=framebuf.MONO_VLSB):
+        self.drop(name)
+        self._src[name] = (source, w, h, fmt)
+
+    def __contains__(self, name):
+        return name in self._src
+
+    def get(self, name):
+        self._tick += 1
+        e = self._fb.get(name)
+        if e is not None:
+            e[2] = self._tick
+            self.hits += 1
+            return e[0]
+        self.misses += 1
+        source, w, h, fmt = self._src[name]
+        if callable(source):
+            buf = source()
+            self._evict(len(buf))
+        else:
+            # make room first so the old buffers can be collected before the copy
+            self._evict(len(source))
+            buf = bytearray(source)
+        fb = framebuf.FrameBuffer(buf, w, h, fmt)
+        self._fb[name] = [fb, len(buf), self._tick]
+        self.used += len(buf)
+        return fb
+
+    def _evict(self, need):
+        fbs = self._fb
+        while fbs and self.used + need > self.budget:
+            old = min(fbs, key=lambda k: fbs[k][2])
+            self.used -= fbs.pop(old)[1]
+
+    def drop(self, name):
+        e = self._fb.pop(name, None)
+        if e is not None:
+            self.used -= e[1]
+
+    def clear(self):
+        self._fb.clear()
+        self.used = 0
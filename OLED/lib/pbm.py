@@ -0,0 +1,120 @@
+# PBM (P4) and PGM (P5) images from the filesystem.
+#
+#   import pbm
+#   pbm.blit(oled, "img/CAE.pbm", 35, 10)       # streamed from the file
+#   icono = pbm.icon(imagenes, "img/ok.pbm")    # FrameBuffer via ImageCache
+#
+# blit() reads the header and then _ROWS rows at a time with readinto()
+# into one module-level buffer, wrapping each chunk in a small MONO_HLSB
+# FrameBuffer and blitting it, so an image of any size (larger than free
+# RAM, or than the screen) is drawn with a few hundred bytes. Rows below
+# the screen are not read. PGM pixels darker than half scale are lit, the
+# same as set PBM bits; PGM needs maxval < 256.
+#
+# icon() is for small images that are drawn often: the whole file is read
+# once into a FrameBuffer kept in an ImageCache (OLED/lib/imagecache.py),
+# which evicts the least recently used icons to stay in its budget.
+
+from micropython import const
+import framebuf
+
+_ROWS = const(8)
+
+# chunk buffer shared by all calls, grown when a wider image needs it
+_buf = bytearray(16 * _ROWS)
+_gray = bytearray(0)
+
+
+def _header(f):
+    # magic, width, height and maxval (1 for PBM); comments are skipped
+    vals = []
+    need = 3
+    while len(vals) < need:
+        line = f.readline()
+        if not line:
+            raise ValueError("truncated PBM header")
+        for t in line.split(b"#")[0].split():
+            vals.append(t)
+        if vals and vals[0] == b"P5":
+            need = 4
+    magic = vals[0]
+    if magic not in (b"P4", b"P5"):
+        raise ValueError("only P4 and P5 images are supported")
+    maxval = int(vals[3]) if magic == b"P5" else 1
+    if maxval > 255:
+        raise ValueError("16-bit PGM is not supported")
+    return magic, int(vals[1]), int(vals[2]), maxval
+
+
+def size(path):
+    with open(path, "rb") as f:
+        _, w, h, _ = _header(f)
+    return w, h
+
+
+def _chunk(nbytes):
+    global _buf
+    if len(_buf) < nbytes:
+        _buf = bytearray(nbytes)
+    return memoryview(_buf)[:nbytes]
+
+
+def _gray_rows(f, dst, w, n, stride, maxval):
+    # threshold n PGM rows into MONO_HLSB rows of dst
+    global _gray
+    if len(_gray) < w:
+        _gray = bytearray(w)
+    g = memoryview(_gray)[:w]
+    half = maxval >> 1
+    for r in range(n):
+        f.readinto(g)
+        o = r * stride
+        for i in range(stride):
+            dst[o + i] = 0
+        for x in range(w):
+            if _gray[x] <= half:
+                dst[o + (x >> 3)] |= 0x80 >> (x & 7)
+
+
+def blit(oled, path, x=0, y=0):
+    with open(path, "rb") as f:
+        magic, w, h, maxval = _header(f)
+        stride = (w + 7) >> 3
+        bottom = min(h, oled.height - y)
+        buf = _chunk(stride * _ROWS)
+        fb = framebuf.FrameBuffer(buf, w, _ROWS, framebuf.MONO_HLSB)
+        r = 0
+        while r < bottom:
+            n = min(_ROWS, h - r)
+            if n < _ROWS:
+                # last chunk: a FrameBuffer of exactly n rows so stale
+                # rows are not drawn below the image
+                buf = _chunk(stride * n)
+                fb = framebuf.FrameBuffer(buf, w, n, framebuf.MONO_HLSB)
+            if magic == b"P4":
+                f.readinto(buf)
+            else:
+                _gray_rows(f, buf, w, n, stride, maxval)
+            oled.blit_raw(fb, x, y + r)
+            r += n
+    oled.mark_dirty(x, y, w, bottom)
+
+
+def read(path):
+    # the whole image as (MONO_HLSB bytearray, w, h)
+    with open(path, "rb") as f:
+        magic, w, h, maxval = _header(f)
+        stride = (w + 7) >> 3
+        data = bytearray(stride * h)
+        if magic == b"P4":
+            f.readinto(data)
+        else:
+            _gray_rows(f, data, w, h, stride, maxval)
+    return data, w, h
+
+
+def icon(cache, path):
+    if path not in cache:
+        w, h = size(path)
+        cache.add(path, lambda: read(path)[0], w, h, framebuf.MONO_HLSB)
+    return cache.get(path)
@@ -0,0 +1,59 @@
+# Run-length compressed 1-bit images (PackBits over the SSD1306 page
+# layout), made by host/img2py.py --rle.
+#
+#   from rle import blit
+#   blit(oled, LOGO_RLE)        # full screen
+#   blit(oled, ICON_RLE, 40, 8) # y in whole pages
+#
+# Format: width, height, then for each 8-pixel page row a PackBits stream
+# of its width MONO_VLSB column bytes. A header byte n < 128 is followed by
+# n + 1 literal bytes, n > 128 by one byte repeated 257 - n times. Runs
+# never cross a page row.
+#
+# blit() decodes straight into oled.buffer, one page row at a time, so no
+# bytearray or FrameBuffer the size of the image is built. Mostly empty
+# logos shrink to a fraction of their 1 KB and zero runs are copied from a
+# shared block instead of byte by byte. The image must fit on the screen.
+
+import micropython
+
+_ZEROS = memoryview(bytearray(128))
+_ONES = memoryview(b"\xff" * 128)
+
+
+@micropython.native
+def blit(oled, data, x=0, y=0):
+    buf = oled.buffer
+    src = memoryview(data)
+    width = oled.width
+    w = data[0]
+    pages = (data[1] + 7) >> 3
+    i = 2
+    for p in range((y >> 3), (y >> 3) + pages):
+        o = p * width + x
+        end = o + w
+        while o < end:
+            n = data[i]
+            i += 1
+            if n < 128:
+                n += 1
+                buf[o:o + n] = src[i:i + n]
+                i += n
+                o += n
+            elif n > 128:
+                n = 257 - n
+                v = data[i]
+                i += 1
+                if v == 0:
+                    buf[o:o + n] = _ZEROS[:n]
+                elif v == 0xFF:
+                    buf[o:o + n] = _ONES[:n]
+                else:
+                    for k in range(o, o + n):
+                        buf[k] = v
+                o += n
+    oled.mark_dirty(x, y & ~7, w, pages << 3)
+
+
+def size(data):
+    return data[0], data[1]
@@ -2,6 +2,7 @@
 
 from micropython import const
 import framebuf
+import time
 
 
 # register definitions
@@ -22,21 +23,186 @@ SET_DISP_CLK_DIV = const(0xD5)
 SET_PRECHARGE = const(0xD9)
 SET_VCOM_DESEL = const(0xDB)
 SET_CHARGE_PUMP = const(0x8D)
+SET_HSCROLL_RIGHT = const(0x26)
+SET_HSCROLL_LEFT = const(0x27)
+SET_SCROLL_OFF = const(0x2E)
+SET_SCROLL_ON = const(0x2F)
+
+# horizontal scroll step interval codes, speed 0 (every 256 frames) to 7
+# (every 2 frames)
+_SCROLL_SPEED = b"\x03\x02\x01\x06\x00\x05\x04\x07"
+
+# shadow mode: unchanged columns shorter than this are resent rather than
+# paying for another address window
+_GAP = const(8)
+
+
+def _async_sleep_ms():
+    # asyncio is only imported by the async methods; CPython's asyncio (the
+    # host tools) has no sleep_ms
+    try:
+        import uasyncio as asyncio
+    except ImportError:
+        import asyncio
+    if hasattr(asyncio, "sleep_ms"):
+        return asyncio.sleep_ms
+    return lambda ms: asyncio.sleep(ms / 1000)
+
 
 # Subclassing FrameBuffer provides support for graphics primitives
 # http://docs.micropython.org/en/latest/pyboard/library/framebuf.html
 class SSD1306(framebuf.FrameBuffer):
-    def __init__(self, width, height, external_vcc):
+    def __init__(self, width, height, external_vcc, shadow=False, double_buffer=False):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        self._mv = memoryview(self.buffer)
+        # dirty column range per page, x0 > x1 means the page is clean
+        self._dx0 = bytearray(self.pages)
+        self._dx1 = bytearray(self.pages)
+        # copy of the last transmitted frame, compared page by page in show()
+        self._shadow = bytearray(len(self.buffer)) if shadow else None
+        self._synced = False
+        self._scrolling = False
+        self.bytes_sent = 0
+        self.bytes_skipped = 0
+        self._win = bytearray(6)
+        self._col = bytearray(self.pages)
+        self._colmv = memoryview(self._col)
+        self._colslice = self._colmv
+        # front buffer handed to the transmitter by swap(), allocated here in
+        # double buffer mode or on first use otherwise
+        self._tx = None
+        self._busy = False
+        if double_buffer:
+            self._alloc_tx()
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
+    # dirty region tracking, fed by the drawing primitives below
+    def mark_dirty(self, x=0, y=0, w=None, h=None):
+        # call after writing to self.buffer directly
+        if w is None:
+            w = self.width - x
+        if h is None:
+            h = self.height - y
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        if x + w > self.width:
+            w = self.width - x
+        if y + h > self.height:
+            h = self.height - y
+        if w <= 0 or h <= 0:
+            return
+        x1 = x + w - 1
+        dx0 = self._dx0
+        dx1 = self._dx1
+        for p in range(y >> 3, ((y + h - 1) >> 3) + 1):
+            if x < dx0[p]:
+                dx0[p] = x
+            if x1 > dx1[p]:
+                dx1[p] = x1
+
+    def _clean(self):
+        for p in range(self.pages):
+            self._dx0[p] = 0xFF
+            self._dx1[p] = 0
+
+    def fill(self, c):
+        super().fill(c)
+        self.mark_dirty()
+
+    def pixel(self, x, y, *c):
+        if c:
+            self.mark_dirty(x, y, 1, 1)
+        return super().pixel(x, y, *c)
+
+    def hline(self, x, y, w, c):
+        super().hline(x, y, w, c)
+        self.mark_dirty(x, y, w, 1)
+
+    def vline(self, x, y, h, c):
+        super().vline(x, y, h, c)
+        self.mark_dirty(x, y, 1, h)
+
+    def fill_rect(self, x, y, w, h, c):
+        super().fill_rect(x, y, w, h, c)
+        self.mark_dirty(x, y, w, h)
+
+    def rect(self, x, y, w, h, c, *f):
+        # an outline with w or h below 1 would draw its far edge at x - 1
+        # or y - 1, outside the marked area; FrameBuffer draws nothing
+        # inside it either
+        if w < 1 or h < 1:
+            return
+        super().rect(x, y, w, h, c, *f)
+        self.mark_dirty(x, y, w, h)
+
+    def line(self, x1, y1, x2, y2, c):
+        super().line(x1, y1, x2, y2, c)
+        if x2 < x1:
+            x1, x2 = x2, x1
+        if y2 < y1:
+            y1, y2 = y2, y1
+        self.mark_dirty(x1, y1, x2 - x1 + 1, y2 - y1 + 1)
+
+    def ellipse(self, x, y, xr, yr, c, *f):
+        super().ellipse(x, y, xr, yr, c, *f)
+        self.mark_dirty(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+
+    def poly(self, x, y, coords, c, *f):
+        super().poly(x, y, coords, c, *f)
+        self.mark_dirty()
+
+    def text(self, s, x, y, *c):
+        super().text(s, x, y, *c)
+        self.mark_dirty(x, y, len(s) << 3, 8)
+
+    def blit(self, fbuf, x, y, *args):
+        super().blit(fbuf, x, y, *args)
+        # FrameBuffer does not expose its size, assume it reaches the corner
+        self.mark_dirty(x, y)
+
+    def scroll(self, xstep, ystep):
+        super().scroll(xstep, ystep)
+        self.mark_dirty()
+
+    # the same primitives without dirty marking, for code that sends or
+    # marks the area itself (a ColumnRing column, a streamed image);
+    # FrameBuffer's methods cannot be called unbound on this subclass on
+    # the board
+    def pixel_raw(self, x, y, c):
+        super().pixel(x, y, c)
+
+    def hline_raw(self, x, y, w, c):
+        super().hline(x, y, w, c)
+
+    def vline_raw(self, x, y, h, c):
+        super().vline(x, y, h, c)
+
+    def blit_raw(self, fbuf, x, y, *args):
+        super().blit(fbuf, x, y, *args)
+
+    def buffer_view(self):
+        # memoryview of self.buffer for in-place copies without allocating;
+        # mark_dirty() the area written through it
+        return self._mv
+
+    def load(self, image):
+        # full-screen page-ordered (MONO_VLSB) image, e.g. a bytes constant
+        # from host/img2py.py: copied straight into the buffer, no FrameBuffer
+        self._mv[:] = image
+        self.mark_dirty()
+
     def init_display(self):
-        for cmd in (
+        self._synced = False
+        self.write_cmds(bytes((
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -66,9 +232,8 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        )))
         self.fill(0)
         self.show()
 
@@ -79,49 +244,443 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds(bytes((SET_CONTRAST, contrast)))
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    # hardware scrolling; the controller cannot take RAM writes while a
+    # scroll is active, so show() and send() keep the frame until
+    # hw_scroll_stop(), after which the buffer is resent in full
+    def hw_scroll_left(self, pages=None, speed=7):
+        self._hw_scroll(SET_HSCROLL_LEFT, pages, speed)
+
+    def hw_scroll_right(self, pages=None, speed=7):
+        self._hw_scroll(SET_HSCROLL_RIGHT, pages, speed)
+
+    def _hw_scroll(self, cmd, pages, speed):
+        p0, p1 = pages if pages else (0, self.pages - 1)
+        self.write_cmds(bytes((
+            SET_SCROLL_OFF,
+            cmd,
+            0x00,
+            p0,
+            _SCROLL_SPEED[speed],
+            p1,
+            0x00,
+            0xFF,
+            SET_SCROLL_ON,
+        )))
+        self._scrolling = True
+
+    def hw_scroll_stop(self):
+        self.write_cmd(SET_SCROLL_OFF)
+        self._scrolling = False
+        # the scroll moved the RAM under the shadow copy, resend everything
+        self._synced = False
+        self.mark_dirty()
+
+    def set_start_line(self, line):
+        # RAM row shown on the top row of the panel, wraps around vertically
+        self.write_cmd(SET_DISP_START_LINE | (line % self.height))
+
+    def show_column(self, x, p0=0, p1=None):
+        # send a single column of pages p0..p1 in one window
+        if p1 is None:
+            p1 = self.pages - 1
+        if self._scrolling or self._busy:
+            # ColumnRing draws unmarked, keep the column for a later show()
+            self.mark_dirty(x, p0 << 3, 1, (p1 - p0 + 1) << 3)
+            return
+        w = self.width
+        buf = self.buffer
+        col = self._col
+        dx0 = self._dx0
+        dx1 = self._dx1
+        n = 0
+        for p in range(p0, p1 + 1):
+            col[n] = buf[p * w + x]
+            if self._shadow is not None:
+                self._shadow[p * w + x] = col[n]
+            if dx0[p] == x and dx1[p] == x:
+                dx0[p] = 0xFF
+                dx1[p] = 0
+            n += 1
+        self._window(x, x, p0, p1)
+        # reuse the slice for the same page count, no allocation per column
+        if len(self._colslice) != n:
+            self._colslice = self._colmv[:n]
+        self.write_data(self._colslice)
+        self.bytes_sent += n
+        self.bytes_skipped += len(buf) - n
+
+    def write_cmds(self, cmds):
+        # backends override this to send the whole sequence in one transfer
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
+    def _window(self, x0, x1, p0, p1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        win = self._win
+        win[0] = SET_COL_ADDR
+        win[1] = x0
+        win[2] = x1
+        win[3] = SET_PAGE_ADDR
+        win[4] = p0
+        win[5] = p1
+        self.write_cmds(win)
+
+    def _send_diff(self, p, x0, x1):
+        # send the runs of columns in page p that differ from the shadow copy
+        buf = self.buffer
+        sh = self._shadow
+        base = p * self.width
+        sent = 0
+        s = -1
+        last = -1
+        for i in range(base + x0, base + x1 + 1):
+            if buf[i] != sh[i]:
+                if s < 0:
+                    s = i
+                elif i - last > _GAP:
+                    sent += self._send_run(p, s, last)
+                    s = i
+                last = i
+        if s >= 0:
+            sent += self._send_run(p, s, last)
+        return sent
+
+    def _send_run(self, p, s, e):
+        base = p * self.width
+        self._window(s - base, e - base, p, p)
+        self.write_data(self._mv[s : e + 1])
+        self._shadow[s : e + 1] = self._mv[s : e + 1]
+        return e - s + 1
+
+    def reset_counters(self):
+        self.bytes_sent = 0
+        self.bytes_skipped = 0
+
+    def show(self):
+        # only send the dirty column range of each page; runs of pages that
+        # are dirty across the full width go out as a single window; while
+        # send_async() has the bus the frame stays dirty for the next swap()
+        if self._scrolling or self._busy:
+            return
+        w = self.width
+        last = w - 1
+        dx0 = self._dx0
+        dx1 = self._dx1
+        shadow = self._shadow if self._synced else None
+        sent = 0
+        if shadow is None or self.buffer != shadow:
+            p = 0
+            while p < self.pages:
+                x0 = dx0[p]
+                x1 = dx1[p]
+                if x0 > x1:
+                    p += 1
+                    continue
+                if shadow is not None:
+                    # compared in place, a page that is dirty but unchanged
+                    # sends nothing
+                    sent += self._send_diff(p, x0, x1)
+                    p += 1
+                    continue
+                p1 = p
+                if x0 == 0 and x1 == last:
+                    while p1 + 1 < self.pages and dx0[p1 + 1] == 0 and dx1[p1 + 1] == last:
+                        p1 += 1
+                a = p * w + x0
+                b = p1 * w + x1 + 1
+                self._window(x0, x1, p, p1)
+                self.write_data(self._mv[a:b])
+                if self._shadow is not None:
+                    self._shadow[a:b] = self._mv[a:b]
+                sent += b - a
+                p = p1 + 1
+        self._synced = True
+        self.bytes_sent += sent
+        self.bytes_skipped += len(self.buffer) - sent
+        self._clean()
+
+    def _alloc_tx(self):
+        self._tx = bytearray(len(self.buffer))
+        self._txmv = memoryview(self._tx)
+        self._tx0 = bytearray(self.pages)
+        self._tx1 = bytearray(self.pages)
+        for p in range(self.pages):
+            self._tx0[p] = 0xFF
+            self._tx1[p] = 0
+
+    def swap(self):
+        # Hand the frame drawn so far to the transmitter and keep drawing in
+        # self.buffer. Returns False, leaving the frame in place, while the
+        # previous one is still being sent by send_async().
+        if self._busy:
+            return False
+        if self._tx is None:
+            self._alloc_tx()
+        self._tx[:] = self.buffer
+        # merge with the windows of a frame that was swapped but never sent
+        tx0 = self._tx0
+        tx1 = self._tx1
+        dx0 = self._dx0
+        dx1 = self._dx1
+        for p in range(self.pages):
+            if dx0[p] < tx0[p]:
+                tx0[p] = dx0[p]
+            if dx1[p] > tx1[p]:
+                tx1[p] = dx1[p]
+        self._clean()
+        return True
+
+    def _front_window(self, p):
+        # address the pending window of page p, returns its buffer slice
+        x0 = self._tx0[p]
+        x1 = self._tx1[p]
+        if x0 > x1:
+            return 0, 0
+        self._tx0[p] = 0xFF
+        self._tx1[p] = 0
+        a = p * self.width + x0
+        b = p * self.width + x1 + 1
+        self._window(x0, x1, p, p)
+        if self._shadow is not None:
+            self._shadow[a:b] = self._txmv[a:b]
+        return a, b
+
+    def _sent(self, sent):
+        self._synced = True
+        self.bytes_sent += sent
+        self.bytes_skipped += len(self.buffer) - sent
+
+    def send(self):
+        # transmit the frame handed over by the last swap()
+        if self._tx is None or self._scrolling:
+            return
+        sent = 0
+        for p in range(self.pages):
+            a, b = self._front_window(p)
+            if a < b:
+                self.write_data(self._txmv[a:b])
+                sent += b - a
+        self._sent(sent)
+
+    async def send_async(self, chunk=128):
+        # like send(), in chunks of `chunk` bytes, yielding to the scheduler
+        # in between so other tasks keep running during the transfer
+        sleep_ms = _async_sleep_ms()
+        if self._tx is None or self._scrolling:
+            return
+        self._busy = True
+        sent = 0
+        try:
+            for p in range(self.pages):
+                a, b = self._front_window(p)
+                sent += b - a
+                while a < b:
+                    n = min(chunk, b - a)
+                    self.write_data(self._txmv[a : a + n])
+                    a += n
+                    await sleep_ms(0)
+        finally:
+            self._busy = False
+        self._sent(sent)
+
+    async def show_async(self, chunk=128):
+        # Non-blocking show(): the frame is swapped to the front buffer and
+        # sent with send_async(), so drawing the next frame can go on while
+        # this one is on the bus. show() and show_column() do nothing
+        # during the transfer.
+        sleep_ms = _async_sleep_ms()
+        while not self.swap():
+            await sleep_ms(0)
+        await self.send_async(chunk)
+
+
+# Ring-buffer column mode for strip charts: the columns x0..x1 of pages
+# p0..p1 are reused in a circle instead of scrolling the buffer. next()
+# returns the cleared column for the new sample; show() sends only that
+# column plus the blank cursor column ahead of it.
+class ColumnRing:
+    def __init__(self, oled, x0, x1, p0=0, p1=None):
+        self.oled = oled
+        self.x0 = x0
+        self.x1 = x1
+        self.p0 = p0
+        self.p1 = oled.pages - 1 if p1 is None else p1
+        self.x = x0
+
+    def _clear(self, x):
+        w = self.oled.width
+        buf = self.oled.buffer
+        for p in range(self.p0, self.p1 + 1):
+            buf[p * w + x] = 0
+
+    def _ahead(self, x):
+        return x + 1 if x < self.x1 else self.x0
+
+    def next(self):
+        x = self.x
+        self.x = self._ahead(x)
+        self._clear(x)
+        self._clear(self.x)
+        return x
+
+    def show(self):
+        # the column returned by the last next() and the cursor after it
+        o = self.oled
+        x = self.x
+        o.show_column(x, self.p0, self.p1)
+        o.show_column(self.x1 if x == self.x0 else x - 1, self.p0, self.p1)
+
+
+# Frame pacing: wait() sleeps until the next frame deadline, so the time
+# spent drawing and on the bus is subtracted from the frame period. When a
+# frame overruns by more than a period the schedule restarts from now
+# instead of rushing to catch up.
+class FramePacer:
+    def __init__(self, fps):
+        self.period = 1000 // fps
+        self.deadline = time.ticks_add(time.ticks_ms(), self.period)
+        self.late = 0
+
+    def _next(self):
+        now = time.ticks_ms()
+        wait = time.ticks_diff(self.deadline, now)
+        if wait < -self.period:
+            self.late += 1
+            self.deadline = time.ticks_add(now, self.period)
+            return 0
+        self.deadline = time.ticks_add(self.deadline, self.period)
+        return wait if wait > 0 else 0
+
+    def wait(self):
+        wait = self._next()
+        if wait:
+            time.sleep_ms(wait)
+
+    async def wait_async(self):
+        await _async_sleep_ms()(self._next())
+
+
+# Opt-in bus instrumentation: BusStats(oled) wraps the instance's
+# write_cmd/write_cmds/write_data with ticks_us timing and closes a frame
+# on every show() or send(). The last frame is in transactions, bytes,
+# bus_us and show_us (whole show() including the dirty/diff work), the
+# sums since reset() in the total_* fields; report() prints both.
+# remove() takes the wrappers off again.
+class BusStats:
+    def __init__(self, oled):
+        self.oled = oled
+        self.reset()
+        self._orig = {}
+        for name in ("write_cmd", "write_cmds", "write_data"):
+            fn = getattr(oled, name)
+            self._orig[name] = fn
+            setattr(oled, name, self._timed(fn, name == "write_cmd"))
+        self._show = self._orig["show"] = oled.show
+        self._sent = self._orig["_sent"] = oled._sent
+        oled.show = self._timed_show
+        oled._sent = self._timed_sent
+
+    def reset(self):
+        self.frames = 0
+        self.transactions = 0
+        self.bytes = 0
+        self.bus_us = 0
+        self.show_us = 0
+        self.max_us = 0
+        self.total_transactions = 0
+        self.total_bytes = 0
+        self.total_us = 0
+        self._n = 0
+        self._b = 0
+        self._us = 0
+
+    def _timed(self, fn, single):
+        def timed(arg):
+            t = time.ticks_us()
+            fn(arg)
+            self._us += time.ticks_diff(time.ticks_us(), t)
+            self._n += 1
+            self._b += 1 if single else len(arg)
+
+        return timed
+
+    def _timed_show(self):
+        t = time.ticks_us()
+        self._show()
+        self._frame(time.ticks_diff(time.ticks_us(), t))
+
+    def _timed_sent(self, sent):
+        # send()/send_async(): the frame is closed, show_us stays 0
+        self._sent(sent)
+        self._frame(0)
+
+    def _frame(self, show_us):
+        self.frames += 1
+        self.transactions = self._n
+        self.bytes = self._b
+        self.bus_us = self._us
+        self.show_us = show_us
+        if self._us > self.max_us:
+            self.max_us = self._us
+        self.total_transactions += self._n
+        self.total_bytes += self._b
+        self.total_us += self._us
+        self._n = 0
+        self._b = 0
+        self._us = 0
+
+    def report(self):
+        n = self.frames or 1
+        print("bus: last frame %d tx %d B %d us (show %d us), avg %d tx %d B %d us, max %d us over %d frames" % (
+            self.transactions, self.bytes, self.bus_us, self.show_us,
+            self.total_transactions // n, self.total_bytes // n, self.total_us // n,
+            self.max_us, self.frames))
+
+    def remove(self):
+        # drop the wrappers, the class methods show through again
+        for name in self._orig:
+            delattr(self.oled, name)
 
 
 class SSD1306_I2C(SSD1306):
-    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False, shadow=False, double_buffer=False):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
-        super().__init__(width, height, external_vcc)
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
+        super().__init__(width, height, external_vcc, shadow, double_buffer)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80  # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, cmds):
+        # with Co=0 every following byte of the transaction is a command
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    # Set shared=True when other devices on the same SPI bus may change its
+    # settings; the bus is then reconfigured before every transfer instead
+    # of only once here.
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, shadow=False, double_buffer=False, shared=False):
         self.rate = 10 * 1024 * 1024
+        self.shared = shared
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
         cs.init(cs.OUT, value=1)
@@ -129,6 +688,8 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.cmd_buf = bytearray(1)
+        spi.init(baudrate=self.rate, polarity=0, phase=0)
         import time
 
         self.res(1)
@@ -136,20 +697,28 @@ class SSD1306_SPI(SSD1306):
         self.res(0)
         time.sleep_ms(10)
         self.res(1)
-        super().__init__(width, height, external_vcc)
+        super().__init__(width, height, external_vcc, shadow, double_buffer)
 
-    def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+    def _select(self, dc):
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
-        self.dc(0)
+        self.dc(dc)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+
+    def write_cmd(self, cmd):
+        self._select(0)
+        self.cmd_buf[0] = cmd
+        self.spi.write(self.cmd_buf)
         self.cs(1)
 
-    def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+    def write_cmds(self, cmds):
+        # the whole sequence in a single CS assertion
+        self._select(0)
+        self.spi.write(cmds)
         self.cs(1)
-        self.dc(1)
-        self.cs(0)
+
+    def write_data(self, buf):
+        self._select(1)
         self.spi.write(buf)
         self.cs(1)
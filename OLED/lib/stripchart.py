@@ -0,0 +1,375 @@
+# Streaming strip chart for the SSD1306 driver, replaces plot_time().
+#
+#   chart = StripChart(oled, 0, 4095, ("0.0", "3.3"))
+#   while True:
+#       chart.plot(pot.read())
+#
+# Samples are kept in a preallocated array('h') ring; plot() draws only the
+# new column and sends it with ColumnRing (sweep mode), so a sample costs a
+# couple of columns on the bus and no heap allocation when given ints.
+# With scroll=True the history scrolls left like plot_time() did; that
+# redraws and resends the whole plot area on every sample.
+#
+# The plot area must cover whole pages (y and h multiples of 8): the sweep
+# clears the full column bytes of those pages.
+#
+# Values map to rows with a 16.16 fixed-point factor computed when the
+# range is set, so a sample costs a multiply and a shift. With
+# autoscale=True the range follows the data: it widens as soon as a sample
+# falls outside it and narrows once per sweep when the data uses less than
+# half of it; each change recomputes the factor and label text and redraws
+# the history in one pass. Labels are then fmt(lo) and fmt(hi).
+#
+# MultiChart overlays up to three series with their own ranges and dash
+# patterns, and decimates fast sampling: add() keeps the running min/max of
+# per_column samples and draws the column as that envelope, so a signal
+# sampled at hundreds of Hz is shown faithfully at the display's pace.
+
+from array import array
+from micropython import const
+import framebuf
+from ssd1306 import ColumnRing
+
+# dash patterns: a series is drawn in column x when bit (x & 7) is set
+SOLID = const(0xFF)
+DASHED = const(0xF0)
+DOTTED = const(0xAA)
+
+
+def _factor(lo, hi, top, bottom):
+    # rows per unit in 16.16 fixed point
+    return ((bottom - top) << 16) // (hi - lo)
+
+
+def _row(v, lo, k, top, bottom):
+    # value to screen row, clamped to the plot area
+    y = bottom - ((v - lo) * k >> 16)
+    if y < top:
+        return top
+    if y > bottom:
+        return bottom
+    return y
+
+
+def _refit(lo, hi, dlo, dhi, wrapped):
+    # new (lo, hi) for data spanning dlo..dhi, or None to keep the range;
+    # the eighth of margin keeps slow drifts from rescaling every sample
+    if dlo >= lo and dhi <= hi and not (wrapped and (dhi - dlo) * 2 < hi - lo):
+        return None
+    m = (dhi - dlo) >> 3 or 1
+    if dlo - m == lo and dhi + m == hi:
+        return None  # narrowing again to the same range, nothing to redraw
+    return dlo - m, dhi + m
+
+
+class StripChart:
+    def __init__(self, oled, lo, hi, labels=None, x=None, y=16, w=None, h=40,
+                 scroll=False, autoscale=False, fmt=str):
+        self.oled = oled
+        self.autoscale = autoscale
+        self.fmt = fmt
+        if autoscale and not labels:
+            labels = (fmt(lo), fmt(hi))
+        if x is None:
+            # room for the longest label left of the axis, autoscaled labels
+            # get at least four characters
+            x = max(len(t) for t in labels) * 8 + 1 if labels else 0
+            if autoscale and x < 33:
+                x = 33
+        if w is None:
+            w = oled.width - 1 - x
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.bottom = y + h - 1
+        self.scroll = scroll
+        self._alloc(w)
+        self.n = 0
+        self.head = 0
+        self._prev = self.bottom
+        self._ring = ColumnRing(oled, x + 1, x + w, y >> 3, self.bottom >> 3)
+        # labels are rendered when the range changes and blitted on redraw
+        self._labels = []
+        if labels and x:
+            for ly in (self.bottom - 5, y):
+                self._labels.append((framebuf.FrameBuffer(bytearray(x - 1), x - 1, 8, framebuf.MONO_VLSB), ly))
+            self._render_labels(labels)
+        self._set_range(lo, hi)
+
+    def _alloc(self, w):
+        # sample history, one per column
+        self.samples = array("h", bytes(2 * w))
+
+    def _render_labels(self, texts):
+        for (fb, ly), text in zip(self._labels, texts):
+            fb.fill(0)
+            fb.text(text, 0, 0, 1)
+
+    def _set_range(self, lo, hi):
+        if hi <= lo:
+            hi = lo + 1
+        self.lo = lo
+        self.hi = hi
+        self._f = _factor(lo, hi, self.y, self.bottom)
+        if self.autoscale and self._labels:
+            self._render_labels((self.fmt(lo), self.fmt(hi)))
+
+    def _y(self, v):
+        return _row(v, self.lo, self._f, self.y, self.bottom)
+
+    def _seg(self, col, y0, y1):
+        # vertical segment joining two samples, drawn without dirty marking
+        if y1 < y0:
+            y0, y1 = y1, y0
+        self.oled.vline_raw(col, y0, y1 - y0 + 1, 1)
+
+    def _rescale(self, v):
+        # only a sample out of range or a completed sweep costs a pass
+        # over the history
+        wrapped = self.head == 0 and self.n == self.w
+        if self.lo <= v <= self.hi and not wrapped:
+            return False
+        s = self.samples
+        dlo = dhi = v
+        for i in range(self.n):
+            if s[i] < dlo:
+                dlo = s[i]
+            elif s[i] > dhi:
+                dhi = s[i]
+        r = _refit(self.lo, self.hi, dlo, dhi, wrapped)
+        if r is None:
+            return False
+        self._set_range(r[0], r[1])
+        return True
+
+    def plot(self, v):
+        # store a sample, draw it and send it to the display
+        self.samples[self.head] = v
+        self.head = self.head + 1 if self.head + 1 < self.w else 0
+        if self.n < self.w:
+            self.n += 1
+        if self.autoscale and self._rescale(v):
+            # the whole history is redrawn with the new scale
+            if not self.scroll:
+                self._ring.next()
+            self._prev = self._y(v)
+            self.redraw()
+            return
+        y = self._y(v)
+        if self.scroll:
+            self._prev = y
+            self._draw_history()
+            self.oled.show()
+            return
+        o = self.oled
+        ring = self._ring
+        col = ring.next()
+        # the first sample has nothing to join to
+        self._seg(col, y if self.n == 1 else self._prev, y)
+        o.pixel_raw(col, self.bottom, 1)
+        o.pixel_raw(ring.x, self.bottom, 1)
+        ring.show()
+        self._prev = y
+
+    def _draw_history(self):
+        # scroll mode: oldest sample on the left edge of the plot area
+        o = self.oled
+        o.fill_rect(self.x + 1, self.y, self.w, self.h, 0)
+        s = self.samples
+        i = self.head - self.n
+        if i < 0:
+            i += self.w
+        prev = self._y(s[i])
+        for col in range(self.x + 1, self.x + 1 + self.n):
+            y = self._y(s[i])
+            self._seg(col, prev, y)
+            prev = y
+            i = i + 1 if i + 1 < self.w else 0
+        o.hline_raw(self.x, self.bottom, self.w + 1, 1)
+
+    def redraw(self):
+        # full redraw of axes, labels and history, e.g. after oled.fill(0)
+        o = self.oled
+        o.fill_rect(0, self.y, self.x + self.w + 1, self.h, 0)
+        for fb, ly in self._labels:
+            o.blit(fb, 0, ly)
+        o.vline(self.x, self.y, self.h, 1)
+        o.hline(self.x, self.bottom, self.w + 1, 1)
+        if self.scroll:
+            self._draw_history()
+        else:
+            self._draw_sweep()
+        o.show()
+
+    def _draw_sweep(self):
+        # in sweep mode sample i lives in column x + 1 + i
+        s = self.samples
+        prev = self._y(s[0])
+        for i in range(self.n):
+            y = self._y(s[i])
+            if i != self.head:
+                self._seg(self.x + 1 + i, prev, y)
+            prev = y
+
+    def reset(self):
+        # forget the history and start again from the left edge
+        self.n = 0
+        self.head = 0
+        self._prev = self.bottom
+        self._ring.x = self._ring.x0
+        self.redraw()
+
+
+class MultiChart(StripChart):
+    # ranges: one (lo, hi) per series; labels describe the first one
+    def __init__(self, oled, ranges, labels=None, patterns=None, per_column=1,
+                 x=None, y=16, w=None, h=40, autoscale=False, fmt=str):
+        n = len(ranges)
+        self.series = n
+        self._lo = array("i", bytes(4 * n))
+        self._hi = array("i", bytes(4 * n))
+        self._kk = array("i", bytes(4 * n))
+        super().__init__(oled, ranges[0][0], ranges[0][1], labels, x, y, w, h,
+                         autoscale=autoscale, fmt=fmt)
+        for s in range(1, n):
+            self._set_series(s, ranges[s][0], ranges[s][1])
+        self.patterns = patterns or (SOLID, DASHED, DOTTED)[:n]
+        self.per_column = per_column
+        # the column being accumulated
+        self._mn = array("h", bytes(2 * n))
+        self._mx = array("h", bytes(2 * n))
+        # rows of the last drawn column, to join the next one to it
+        self._top = array("h", bytes(2 * n))
+        self._bot = array("h", bytes(2 * n))
+        self._k = 0
+
+    def _alloc(self, w):
+        # envelope history per series instead of the samples array
+        n = self.series
+        self.mins = [array("h", bytes(2 * w)) for _ in range(n)]
+        self.maxs = [array("h", bytes(2 * w)) for _ in range(n)]
+
+    def _set_range(self, lo, hi):
+        # series 0 also drives the labels
+        self._set_series(0, lo, hi)
+
+    def _set_series(self, s, lo, hi):
+        if hi <= lo:
+            hi = lo + 1
+        self._lo[s] = lo
+        self._hi[s] = hi
+        self._kk[s] = _factor(lo, hi, self.y, self.bottom)
+        if s == 0:
+            self.lo = lo
+            self.hi = hi
+            if self.autoscale and self._labels:
+                self._render_labels((self.fmt(lo), self.fmt(hi)))
+
+    def _acc(self, s, v):
+        if self._k == 0:
+            self._mn[s] = v
+            self._mx[s] = v
+        elif v < self._mn[s]:
+            self._mn[s] = v
+        elif v > self._mx[s]:
+            self._mx[s] = v
+
+    def add(self, v0, v1=0, v2=0):
+        # one sample per series; returns True when it completed a column
+        n = self.series
+        self._acc(0, v0)
+        if n > 1:
+            self._acc(1, v1)
+            if n > 2:
+                self._acc(2, v2)
+        self._k += 1
+        if self._k < self.per_column:
+            return False
+        self._k = 0
+        self._column()
+        return True
+
+    plot = add
+
+    def _column(self):
+        o = self.oled
+        i = self.head
+        for s in range(self.series):
+            self.mins[s][i] = self._mn[s]
+            self.maxs[s][i] = self._mx[s]
+        self.head = i + 1 if i + 1 < self.w else 0
+        if self.n < self.w:
+            self.n += 1
+        ring = self._ring
+        col = ring.next()
+        if self.autoscale:
+            changed = False
+            for s in range(self.series):
+                if self._rescale_series(s):
+                    changed = True
+            if changed:
+                self.redraw()
+                return
+        for s in range(self.series):
+            self._envelope(s, col, self._mn[s], self._mx[s], self.n > 1)
+        o.pixel_raw(col, self.bottom, 1)
+        o.pixel_raw(ring.x, self.bottom, 1)
+        ring.show()
+
+    def _rescale_series(self, s):
+        lo = self._lo[s]
+        hi = self._hi[s]
+        dlo = self._mn[s]
+        dhi = self._mx[s]
+        wrapped = self.head == 0 and self.n == self.w
+        if lo <= dlo and dhi <= hi and not wrapped:
+            return False
+        mins = self.mins[s]
+        maxs = self.maxs[s]
+        for i in range(self.n):
+            if mins[i] < dlo:
+                dlo = mins[i]
+            if maxs[i] > dhi:
+                dhi = maxs[i]
+        r = _refit(lo, hi, dlo, dhi, wrapped)
+        if r is None:
+            return False
+        self._set_series(s, r[0], r[1])
+        return True
+
+    def _envelope(self, s, col, mn, mx, join):
+        # vertical line from min to max, stretched to touch the previous column
+        lo = self._lo[s]
+        k = self._kk[s]
+        top = _row(mx, lo, k, self.y, self.bottom)
+        bot = _row(mn, lo, k, self.y, self.bottom)
+        y0 = top
+        y1 = bot
+        if join:
+            if self._bot[s] < y0:
+                y0 = self._bot[s]
+            elif self._top[s] > y1:
+                y1 = self._top[s]
+        self._top[s] = top
+        self._bot[s] = bot
+        if self.patterns[s] >> (col & 7) & 1:
+            self.oled.vline_raw(col, y0, y1 - y0 + 1, 1)
+
+    def _draw_sweep(self):
+        for i in range(self.n):
+            if i != self.head:
+                for s in range(self.series):
+                    self._envelope(s, self.x + 1 + i, self.mins[s][i], self.maxs[s][i], i > 0)
+        # the next column joins to the last one drawn live
+        last = self.head - 1 if self.head else self.n - 1
+        if last >= 0:
+            for s in range(self.series):
+                lo = self._lo[s]
+                k = self._kk[s]
+                self._top[s] = _row(self.maxs[s][last], lo, k, self.y, self.bottom)
+                self._bot[s] = _row(self.mins[s][last], lo, k, self.y, self.bottom)
+
+    def reset(self):
+        self._k = 0
+        super().reset()
@@ -0,0 +1,168 @@
+# Word wrapping and pixel scrolling for strings longer than the screen.
+#
+#   texto = layout(OBJETIVO)             # wrapped once, cached by string
+#   texto.draw(oled, first=0)            # up to 8 lines from line `first`
+#
+#   vs = VScroll(oled, texto)            # whole panel, 1 pixel row per step
+#   pacer = FramePacer(25)
+#   for _ in range(vs.steps):
+#       vs.step()
+#       pacer.wait()
+#   vs.stop()
+#
+#   m = Marquee(oled, "Rodríguez Martínez Cristopher Giovanni", y=8)
+#   m.step()                             # one column to the left
+#
+# wrap() breaks at spaces (and inside words longer than a line) for the
+# 8x8 built-in font; layout() keeps the result per (text, cols), so a
+# message shown again is not wrapped again.
+#
+# VScroll moves the panel's start line (SET_DISP_START_LINE) instead of
+# the buffer: each step only the pixel row that leaves the top is rewritten
+# with the row that enters at the bottom, so show() sends one page. The
+# wrapped text is followed by a blank screen and then starts over. It owns
+# the whole panel until stop().
+#
+# Marquee scrolls one line of text left through a band of 8 rows (y a
+# multiple of 8): the band's bytes are moved one column with a slice copy
+# and only the new right-hand column is drawn, so show() sends that band.
+
+import framebuf
+import micropython
+
+_CACHE = 8
+_cache = {}
+
+
+def wrap(text, cols=16):
+    lines = []
+    for para in text.split("\n"):
+        line = ""
+        for word in para.split():
+            while len(word) > cols:
+                if line:
+                    lines.append(line)
+                    line = ""
+                lines.append(word[:cols])
+                word = word[cols:]
+            if not line:
+                line = word
+            elif len(line) + 1 + len(word) <= cols:
+                line += " " + word
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return tuple(lines)
+
+
+def layout(text, cols=16):
+    key = (text, cols)
+    lay = _cache.get(key)
+    if lay is None:
+        if len(_cache) >= _CACHE:
+            _cache.clear()
+        lay = _cache[key] = Layout(text, cols)
+    return lay
+
+
+class Layout:
+    def __init__(self, text, cols=16):
+        self.cols = cols
+        self.lines = wrap(text, cols)
+        self.height = len(self.lines) << 3
+
+    def draw(self, oled, first=0, x=0, y=0, rows=None):
+        # lines first.. from y down, `rows` of them or as many as fit
+        if rows is None:
+            rows = (oled.height - y) >> 3
+        lines = self.lines
+        for i in range(first, min(first + rows, len(lines))):
+            oled.text(lines[i], x, y)
+            y += 8
+
+
+@micropython.native
+def _put_row(buf, base, line, w, m):
+    # bit m of every column byte of line into buf[base:base + w]
+    keep = m ^ 0xFF
+    for x in range(w):
+        buf[base + x] = (buf[base + x] & keep) | (line[x] & m)
+
+
+class VScroll:
+    def __init__(self, oled, layout):
+        self.oled = oled
+        self.layout = layout
+        # the text, then one blank screen before it repeats
+        self.period = layout.height + oled.height
+        # steps until the last line has left the top
+        self.steps = layout.height
+        self.top = 0
+        self._line = bytearray(oled.width)
+        self._fb = framebuf.FrameBuffer(self._line, oled.width, 8, framebuf.MONO_VLSB)
+        self._k = -1
+        oled.fill(0)
+        layout.draw(oled)
+        oled.set_start_line(0)
+        oled.show()
+
+    def _render(self, k):
+        # text line k of the period into the one-line buffer
+        self._k = k
+        self._fb.fill(0)
+        if k < len(self.layout.lines):
+            self._fb.text(self.layout.lines[k], 0, 0, 1)
+
+    def step(self):
+        o = self.oled
+        h = o.height
+        # the row that leaves the top is reused for the one entering below
+        ram = self.top % h
+        r = (self.top + h) % self.period
+        if r >> 3 != self._k:
+            self._render(r >> 3)
+        _put_row(o.buffer, (ram >> 3) * o.width, self._line, o.width, 1 << (r & 7))
+        o.mark_dirty(0, ram, o.width, 1)
+        self.top = (self.top + 1) % (self.period * h)
+        o.show()
+        o.set_start_line(self.top)
+
+    def stop(self):
+        # blank the RAM before the start line goes back, no stale frame
+        self.oled.fill(0)
+        self.oled.show()
+        self.oled.set_start_line(0)
+
+
+class Marquee:
+    def __init__(self, oled, text, y=0, x=0, w=None, gap=2):
+        if y & 7:
+            raise ValueError("marquee y must be a multiple of 8")
+        self.oled = oled
+        self.text = text
+        self.x = x
+        self.y = y
+        self.w = oled.width - x if w is None else w
+        # columns in one pass: the text plus `gap` blank characters
+        self.period = (len(text) + gap) << 3
+        self.col = 0
+        self._ch = bytearray(8)
+        self._fb = framebuf.FrameBuffer(self._ch, 8, 8, framebuf.MONO_VLSB)
+        oled.fill_rect(x, y, self.w, 8, 0)
+
+    def step(self):
+        o = self.oled
+        c = self.col
+        if c & 7 == 0:
+            i = c >> 3
+            self._fb.fill(0)
+            if i < len(self.text):
+                self._fb.text(self.text[i], 0, 0, 1)
+        a = (self.y >> 3) * o.width + self.x
+        b = a + self.w - 1
+        mv = o.buffer_view()
+        mv[a:b] = mv[a + 1:b + 1]
+        o.buffer[b] = self._ch[c & 7]
+        o.mark_dirty(self.x, self.y, self.w, 8)
+        self.col = c + 1 if c + 1 < self.period else 0
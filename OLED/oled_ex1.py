@@ -1,17 +1,16 @@
 from machine import Pin, I2C
 from utime import sleep_ms
 from ssd1306 import SSD1306_I2C
-import framebuf
+import pbm
+from imagecache import ImageCache
+
+# icons used over and over stay in RAM as FrameBuffers (least recently used
+# ones are dropped past 2 KB); big or one-off images are streamed with
+# pbm.blit() instead of being read whole
+icons = ImageCache(budget=2048)
 
 def open_icon(routh):
-    doc = open(routh, "rb")
-    doc.readline()
-    xy = doc.readline()
-    x = int(xy.split()[0])
-    y = int(xy.split()[1])
-    icon = bytearray(doc.read())
-    doc.close()
-    return framebuf.FrameBuffer(icon, x, y, framebuf.MONO_HLSB)
+    return pbm.icon(icons, routh)
 
 WIDTH = 128
 HEIGHT = 64
@@ -28,7 +27,7 @@ oled.show()
 
 sleep_ms(2000)
 
-oled.blit(open_icon("img/CAE.pbm"),35, 10)
+pbm.blit(oled, "img/CAE.pbm", 35, 10)
 oled.show()
 
 
@@ -112,8 +112,13 @@ def ir_callback(data, addr, ctrl):
 
 #Deberá mostrar qué tecla se presionó
 # Configuración del receptor IR en el GPIO 15
-ir_sensor = NEC_16(Pin(15, Pin.IN), callback=ejecutarOpcion)
-# Loop infinito para mantener la ejecución
+# sin callback: las teclas se guardan en la cola del receptor y los motores
+# y los print se atienden aqui, fuera del Timer que decodifica
+ir_sensor = NEC_16(Pin(15, Pin.IN))
 while True:
-    time.sleep(1)
+    for data, addr, ctrl, t in ir_sensor.events():
+        # los codigos negativos son repeticiones (tecla sostenida) o errores
+        if data >= 0:
+            ejecutarOpcion(data, addr, ctrl)
+    time.sleep_ms(20)
 
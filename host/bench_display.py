@@ -0,0 +1,268 @@
+# Bus benchmark of the repo's display workloads on the host.
+#
+# Runs the voltage strip chart (OLED/oled_ex2.py, sweep and scroll), Pong
+# (juego/codigo.py), the IR menu (infrarojo/infra.py) and the ultrasonic
+# readout loop against SSD1306_Emulated and reports bytes, transactions and
+# bus time per loop iteration, plus the bus-bound frame rate.
+#
+#   python host/bench_display.py --bus i2c --freq 100000 --shadow
+#   python host/bench_display.py --dump /tmp/frames
+#   python host/bench_display.py --check-async
+#   python host/bench_display.py --check-draw
+#
+# --check-async draws the ultrasonic readout with show_async(): each frame
+# is sent in chunks while the next one is being drawn, and the panel RAM
+# must hold exactly the frame that was handed over, also when show() is
+# called while a transfer is on the bus.
+#
+# --check-draw draws random primitives, degenerate sizes and off-screen
+# positions included, and after every show() compares the panel RAM with
+# the buffer, with and without the shadow buffer.
+
+import argparse
+import ast
+import asyncio
+import math
+import os
+import random
+import sys
+import types
+
+from ssd1306_emu import SSD1306_Emulated, FrameStats
+from font import Font  # noqa: E402  (OLED/lib is put on the path by ssd1306_emu)
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def load_defs(relpath, names, namespace):
+    # exec only the named top-level functions/classes of a script, so its
+    # hardware setup and main loop do not run
+    path = os.path.join(ROOT, relpath)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    body = [n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.ClassDef)) and n.name in names]
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), namespace)
+    return namespace
+
+
+class Clock:
+    # just enough of MicroPython's time module for Pong's power-up timers
+    def __init__(self):
+        self.ms = 0
+
+    def ticks_ms(self):
+        return self.ms
+
+    def ticks_diff(self, a, b):
+        return a - b
+
+
+def chart_workload(oled, scroll=False):
+    from stripchart import StripChart
+
+    chart = StripChart(oled, 0, 4095, ("0.0", "3.3"), scroll=scroll)
+    volts = Font(2)
+    chart.redraw()
+    oled.text("Volts:", 0, 4)
+    state = {"i": 0}
+
+    def step():
+        # body of the main loop in OLED/oled_ex2.py
+        i = state["i"]
+        state["i"] = i + 1
+        raw = int(2047 + 1860 * math.sin(i / 10))
+        chart.plot(raw)
+        volts.number(oled, raw * 33 // 4095, 52, 0, 2, 1)
+        oled.show()
+
+    return step
+
+
+def chart_scroll_workload(oled):
+    return chart_workload(oled, scroll=True)
+
+
+def pong_workload(oled):
+    clock = Clock()
+    inputs = {"i": 0}
+    mpu = types.SimpleNamespace(get_tilt=lambda: math.sin(inputs["i"] / 7))
+    joystick = types.SimpleNamespace(read=lambda: int(2047 + 2000 * math.cos(inputs["i"] / 11)))
+    button = types.SimpleNamespace(value=lambda: 1)
+    ns = load_defs("juego/codigo.py", ("Pong",), {
+        "WIDTH": 128, "HEIGHT": 64, "time": clock,
+        "mpu": mpu, "joystick": joystick, "button_p2": button,
+        "MARCADOR": Font(2, "0123456789 "),
+    })
+    pong = ns["Pong"](oled)
+
+    def step():
+        inputs["i"] += 1
+        clock.ms += 40
+        pong.update_paddles()
+        pong.update_ball()
+        pong.draw()
+
+    return step
+
+
+def menu_workload(oled):
+    ns = load_defs("infrarojo/infra.py", ("mostrarMenu",), {"oled": oled})
+    return ns["mostrarMenu"]
+
+
+def ultrasonic_workload(oled):
+    big = Font(3)
+    state = {"i": 0}
+
+    def step():
+        # body of the main loop in sensorUltrasonicoPIR/codigo.py
+        state["i"] += 1
+        distance = 100 + 20 * math.sin(state["i"] / 5)
+        oled.fill(0)
+        big.number(oled, int(distance * 10), 0, 0, 4, 1)
+        oled.text("cm", 96, 16)
+        oled.text("objeto detectado", 0, 40)
+        oled.show()
+
+    return step
+
+
+WORKLOADS = (
+    ("chart", chart_workload),
+    ("chart_scroll", chart_scroll_workload),
+    ("pong", pong_workload),
+    ("menu", menu_workload),
+    ("ultrasonic", ultrasonic_workload),
+)
+
+
+def run(name, factory, args):
+    oled = SSD1306_Emulated(128, 64, bus=args.bus, freq=args.freq, shadow=args.shadow)
+    step = factory(oled)
+    # warm up so the first full-screen refresh is not counted
+    step()
+    oled.reset_stats()
+    for _ in range(args.iterations):
+        step()
+    t = FrameStats()
+    for f in oled.frames:
+        t.add(f)
+    n = args.iterations
+    per = t.bus_time / n
+    print("%-12s %8.1f %8.1f %10.3f %9s" % (
+        name, t.bus_bytes / n, t.transactions / n, per * 1000,
+        "%.1f" % (1 / per) if per else "inf"))
+    if args.dump:
+        os.makedirs(args.dump, exist_ok=True)
+        oled.save_png(os.path.join(args.dump, name + ".png"), scale=4)
+        oled.save_pbm(os.path.join(args.dump, name + ".pbm"))
+
+
+async def _async_frames(oled, n):
+    big = Font(3)
+    bad = 0
+    tx = None
+    expected = None
+    for i in range(n):
+        distance = 100 + 20 * math.sin(i / 5)
+        oled.fill(0)
+        big.number(oled, int(distance * 10), 0, 0, 4, 1)
+        # the previous frame goes on with its transfer in between, a show()
+        # meanwhile must leave it alone
+        await asyncio.sleep(0)
+        oled.show()
+        oled.text("cm", 96, 16)
+        oled.text("objeto detectado" if i & 1 else "libre", 0, 40)
+        if tx is not None:
+            await tx
+            if bytes(oled.ctrl.ram) != expected:
+                bad += 1
+        expected = bytes(oled.buffer)
+        tx = asyncio.ensure_future(oled.show_async(chunk=64))
+        await asyncio.sleep(0)
+    await tx
+    if bytes(oled.ctrl.ram) != expected:
+        bad += 1
+    return bad
+
+
+def check_async(args):
+    oled = SSD1306_Emulated(128, 64, bus=args.bus, freq=args.freq, shadow=args.shadow, double_buffer=True)
+    oled.reset_stats()
+    n = args.iterations
+    bad = asyncio.run(_async_frames(oled, n))
+    # the emulator counts a frame for every show() too, sent or not
+    sent = len(oled.frames) - n
+    print("show_async: %d frames sent, %d counted, %d with the panel off the swapped frame" % (
+        n, sent, bad))
+    return 1 if bad or sent != n else 0
+
+
+def _random_op(oled, rng):
+    # one primitive with sizes from -2 up and positions partly off-screen
+    c = rng.randint(0, 1)
+    x = rng.randint(-8, 135)
+    y = rng.randint(-8, 71)
+    w = rng.randint(-2, 40)
+    h = rng.randint(-2, 40)
+    op = rng.randrange(8)
+    if op == 0:
+        oled.rect(x, y, w, h, c)
+    elif op == 1:
+        oled.rect(x, y, w, h, c, True)
+    elif op == 2:
+        oled.fill_rect(x, y, w, h, c)
+    elif op == 3:
+        oled.hline(x, y, w, c)
+    elif op == 4:
+        oled.vline(x, y, h, c)
+    elif op == 5:
+        oled.line(x, y, x + w, y + h, c)
+    elif op == 6:
+        oled.pixel(x, y, c)
+    else:
+        oled.text("ab", x, y, c)
+
+
+def check_draw(args):
+    failed = 0
+    for shadow in (False, True):
+        rng = random.Random(1)
+        bad = 0
+        oled = SSD1306_Emulated(128, 64, bus=args.bus, freq=args.freq, shadow=shadow)
+        for _ in range(args.iterations):
+            for _ in range(rng.randint(1, 4)):
+                _random_op(oled, rng)
+            oled.show()
+            if bytes(oled.ctrl.ram) != bytes(oled.buffer):
+                bad += 1
+        print("draw%s: %d frames, %d with the panel off the buffer" % (
+            " (shadow)" if shadow else "", args.iterations, bad))
+        failed += bad
+    return 1 if failed else 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--bus", choices=("i2c", "spi"), default="i2c")
+    ap.add_argument("--freq", type=int, default=400_000, help="bus clock in Hz")
+    ap.add_argument("--iterations", type=int, default=200)
+    ap.add_argument("--shadow", action="store_true", help="enable the driver's shadow buffer")
+    ap.add_argument("--dump", help="directory for PNG/PBM dumps of the last frame")
+    ap.add_argument("--check-async", action="store_true", help="send frames with show_async() while drawing")
+    ap.add_argument("--check-draw", action="store_true", help="compare the panel with the buffer after random drawing")
+    ap.add_argument("workloads", nargs="*", help="subset of: " + ", ".join(n for n, _ in WORKLOADS))
+    args = ap.parse_args()
+    if args.check_async:
+        return check_async(args)
+    if args.check_draw:
+        return check_draw(args)
+    print("bus %s @ %d Hz, %d iterations%s" % (args.bus, args.freq, args.iterations, ", shadow" if args.shadow else ""))
+    print("%-12s %8s %8s %10s %9s" % ("workload", "bytes", "trans", "bus ms", "max it/s"))
+    for name, factory in WORKLOADS:
+        if not args.workloads or name in args.workloads:
+            run(name, factory, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
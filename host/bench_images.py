@@ -0,0 +1,99 @@
+# Benchmark of the ways to put a full-screen logo into the display buffer.
+#
+#   list    bytearray(LIST) + FrameBuffer(MONO_HLSB) + blit, as the scripts
+#           did with their 1024-entry lists
+#   bytes   bytearray(BYTES) + FrameBuffer(MONO_VLSB) + blit
+#   load    oled.load(BYTES), straight copy into the buffer
+#   rle     rle.blit(oled, RLE), PackBits decoded into the buffer
+#
+#   python host/bench_images.py --iterations 2000
+#
+# Reports the stored size (a list costs a 4-byte slot per entry on a 32-bit
+# port), the host time per draw and the peak heap allocated per draw.
+# Host times only rank the paths; the allocation column carries over to
+# the board as is.
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+HOST = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(HOST, "..", "OLED"), os.path.join(HOST, "..", "OLED", "lib")]
+
+import framebuf  # noqa: E402
+import images  # noqa: E402
+import img2py  # noqa: E402
+import rle  # noqa: E402
+from ssd1306_emu import SSD1306_Emulated  # noqa: E402
+
+
+def rows_from_vlsb(data, w, h):
+    return [[(data[(y >> 3) * w + x] >> (y & 7)) & 1 for x in range(w)] for y in range(h)]
+
+
+def cases(name, vlsb):
+    rows = rows_from_vlsb(vlsb, 128, 64)
+    as_list = list(img2py.pack_hlsb(rows, 128, 64))
+    as_rle = img2py.pack_rle(rows, 128, 64)
+
+    def from_list(oled):
+        fb = framebuf.FrameBuffer(bytearray(as_list), 128, 64, framebuf.MONO_HLSB)
+        oled.blit(fb, 0, 0)
+
+    def from_bytes(oled):
+        fb = framebuf.FrameBuffer(bytearray(vlsb), 128, 64, framebuf.MONO_VLSB)
+        oled.blit(fb, 0, 0)
+
+    def load(oled):
+        oled.load(vlsb)
+
+    def from_rle(oled):
+        rle.blit(oled, as_rle)
+
+    return (
+        ("list", 4 * len(as_list), from_list),
+        ("bytes", len(vlsb), from_bytes),
+        ("load", len(vlsb), load),
+        ("rle", len(as_rle), from_rle),
+    )
+
+
+def measure(fn, oled, iterations):
+    fn(oled)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(oled)
+    us = (time.perf_counter() - start) / iterations * 1e6
+    tracemalloc.start()
+    fn(oled)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return us, peak
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Full-screen image drawing benchmark")
+    ap.add_argument("--iterations", type=int, default=500)
+    args = ap.parse_args()
+
+    oled = SSD1306_Emulated(128, 64)
+    print("%-6s %-6s %8s %10s %10s" % ("image", "path", "stored", "host us", "peak heap"))
+    for name in ("logo", "tec"):
+        vlsb = getattr(images, name)
+        ref = None
+        for path, stored, fn in cases(name, vlsb):
+            oled.fill(0)
+            us, peak = measure(fn, oled, args.iterations)
+            # every path must leave the same picture in the buffer
+            if ref is None:
+                ref = bytes(oled.buffer)
+            elif bytes(oled.buffer) != ref:
+                raise SystemExit("%s/%s draws a different image" % (name, path))
+            print("%-6s %-6s %8d %10.1f %10d" % (name, path, stored, us, peak))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
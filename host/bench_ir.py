@@ -0,0 +1,205 @@
+# Benchmark of the IR decoders in infrarojo/ir_rx.py on edge traces.
+#
+# NEC, generated traces:
+#   legacy  the former NEC_ABC.decode: ticks_diff() per edge pair and
+#           RuntimeError as control flow for repeats and errors
+#   table   the current decode: one pass over _times, status codes
+#
+# Every protocol, traces from host/ir_fixtures.txt (see irtrace.py): the
+# protocol's own decoder class and IR_AUTO, which has to pick the protocol
+# from the leader first.
+#
+#   python host/bench_ir.py --frames 2000 --jitter 80
+#   python host/bench_ir.py --fixtures host/ir_fixtures.txt --jitter 100
+#
+# The NEC set mixes data frames, repeat codes (one every ~110 ms while a
+# key is held on the car) and truncated bursts. Each decoder runs on an
+# IR_RX object and its queued events are compared with the expected
+# result, so the tables also report how many bursts each one got right.
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from array import array
+
+HOST = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(HOST, "..", "infrarojo")]
+
+import irtrace  # noqa: E402
+import sim  # noqa: E402
+import utime  # noqa: E402
+from machine import Pin  # noqa: E402
+
+sys.modules["time"] = utime
+import ir_rx  # noqa: E402
+
+
+def legacy_decode(self, _):
+    ticks_diff = utime.ticks_diff
+    try:
+        if self.edge > 68:
+            raise RuntimeError(self.OVERRUN)
+        width = ticks_diff(self._times[1], self._times[0])
+        if width < self._leader:
+            raise RuntimeError(self.BADSTART)
+        width = ticks_diff(self._times[2], self._times[1])
+        if width > 3000:
+            if self.edge < 68:
+                raise RuntimeError(self.BADBLOCK)
+            val = 0
+            for edge in range(3, 68 - 2, 2):
+                val >>= 1
+                if ticks_diff(self._times[edge + 1], self._times[edge]) > 1120:
+                    val |= 0x80000000
+        elif width > 1700:
+            raise RuntimeError(self.REPEAT if self.edge == 4 else self.BADREP)
+        else:
+            raise RuntimeError(self.BADSTART)
+        addr = val & 0xff
+        cmd = (val >> 16) & 0xff
+        if cmd != (val >> 24) ^ 0xff:
+            raise RuntimeError(self.BADDATA)
+        if addr != ((val >> 8) ^ 0xff) & 0xff:
+            if not self._extended:
+                raise RuntimeError(self.BADADDR)
+            addr |= val & 0xff00
+        self._addr = addr
+    except RuntimeError as e:
+        cmd = e.args[0]
+        addr = self._addr if cmd == self.REPEAT else 0
+    self.do_callback(cmd, addr, 0, self.REPEAT)
+
+
+def traces(n, jitter, rng):
+    # (edge times, (expected cmd, expected addr)); repeats carry the
+    # address of the last good frame
+    out = []
+    t = rng.randrange(1 << 30)
+    addr = 0
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.5:
+            addr = rng.choice((0x00, 0x04, 0x1234))
+            cmd = rng.randrange(256)
+            durs = irtrace.nec(addr, cmd)
+            exp = (cmd, addr)
+        elif kind < 0.9:
+            durs = irtrace.nec_repeat()
+            exp = (ir_rx.IR_RX.REPEAT, addr)
+        else:
+            # burst cut short, e.g. the remote moved out of line of sight
+            durs = irtrace.nec(0, rng.randrange(256))[: rng.randrange(8, 60)]
+            exp = (ir_rx.IR_RX.BADBLOCK, 0)
+        out.append((irtrace.edges(durs, t, jitter, rng), exp))
+        t += 110_000
+    return out
+
+
+def timed(pass_):
+    # one untimed pass to warm up, then the timed one with gc off so a
+    # collection does not land on a single decoder's row
+    pass_()
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        ok = pass_()
+        return time.perf_counter() - start, ok
+    finally:
+        gc.enable()
+
+
+def run(ir, decode, cases):
+    times = ir._times
+
+    def pass_():
+        # repeats report the address of the last good frame, start clean
+        ir._addr = 0
+        ok = 0
+        for tr, exp in cases:
+            n = len(tr)
+            times[:n] = array("i", tr)
+            ir.edge = n
+            decode(None)
+            e = ir._pop()
+            if (e[0], e[1]) == exp:
+                ok += 1
+        return ok
+
+    t, ok = timed(pass_)
+    return t / len(cases) * 1e6, ok
+
+
+# fixture protocol -> (decoder class, protocol id reported by IR_AUTO)
+DECODERS = {
+    "nec": (ir_rx.NEC_16, ir_rx.P_NEC),
+    "samsung": (ir_rx.SAMSUNG, ir_rx.P_SAMSUNG),
+    "rc5": (ir_rx.RC5, ir_rx.P_RC5),
+    "rc6": (ir_rx.RC6_M0, ir_rx.P_RC6),
+    "sony12": (ir_rx.SONY_12, ir_rx.P_SONY),
+    "sony15": (ir_rx.SONY_15, ir_rx.P_SONY),
+    "sony20": (ir_rx.SONY_20, ir_rx.P_SONY),
+}
+
+
+def run_fixtures(ir, cases):
+    times = ir._times
+
+    def pass_():
+        ok = 0
+        for tr, exp in cases:
+            n = len(tr)
+            times[:n] = array("i", tr)
+            ir.edge = n
+            ir.decode(None)
+            if ir._pop()[:3] == exp:
+                ok += 1
+        return ok
+
+    t, ok = timed(pass_)
+    return t / len(cases) * 1e6, ok
+
+
+def fixtures(path, jitter, rng):
+    by_proto = {}
+    t = rng.randrange(1 << 30)
+    for name, cmd, addr, ext, durs in irtrace.load(path):
+        by_proto.setdefault(name, []).append((irtrace.edges(durs, t, jitter, rng), (cmd, addr, ext)))
+        t += 110_000
+    print("%-8s %-8s %10s %10s" % ("traces", "decoder", "host us", "correct"))
+    for name, cases in by_proto.items():
+        cls, proto = DECODERS[name]
+        us, ok = run_fixtures(cls(Pin(15, Pin.IN)), cases)
+        print("%-8s %-8s %10.2f %6d/%d" % (name, cls.__name__, us, ok, len(cases)))
+        auto_cases = [(tr, (cmd, addr, ext | proto << 8)) for tr, (cmd, addr, ext) in cases]
+        us, ok = run_fixtures(ir_rx.IR_AUTO(Pin(15, Pin.IN)), auto_cases)
+        print("%-8s %-8s %10.2f %6d/%d" % ("", "IR_AUTO", us, ok, len(cases)))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="IR decode benchmark on edge traces")
+    ap.add_argument("--frames", type=int, default=2000)
+    ap.add_argument("--jitter", type=int, default=0, help="max edge jitter in us")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--fixtures", help="trace file, e.g. host/ir_fixtures.txt")
+    args = ap.parse_args()
+
+    sim.reset()
+    rng = random.Random(args.seed)
+    if args.fixtures:
+        fixtures(args.fixtures, args.jitter, rng)
+        return 0
+    ir = ir_rx.NEC_16(Pin(15, Pin.IN))
+    cases = traces(args.frames, args.jitter, rng)
+    print("%-8s %10s %10s" % ("decoder", "host us", "correct"))
+    for name, decode in (("legacy", lambda _: legacy_decode(ir, _)), ("table", ir.decode)):
+        us, ok = run(ir, decode, cases)
+        print("%-8s %10.2f %6d/%d" % (name, us, ok, len(cases)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
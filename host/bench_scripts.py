@@ -0,0 +1,89 @@
+# Regression benchmark: run the repo's scripts on the simulator and compare
+# host CPU time and display traffic against a saved baseline.
+#
+#   python host/bench_scripts.py --save host/baseline.json
+#   python host/bench_scripts.py --baseline host/baseline.json
+#
+# Host CPU time per simulated second stands in for the device's CPU load;
+# it is noisy, so the check uses a tolerance (default 25%) and ignores
+# differences below --min-delta ms per simulated second. Display bytes
+# are deterministic and must not grow at all.
+
+import argparse
+import json
+import os
+import sys
+
+import run as runner
+import sim
+
+CASES = (
+    ("voltaje", "4graficandoVoltaje.py", 20),
+    ("sensor_luz", "sensorLuz/cod.py", 60),
+    ("foco_ldr", "focoLDR/codigo.py", 60),
+    ("ultrasonic", "sensorUltrasonicoPIR/codigo.py", 30),
+    ("pong", "juego/codigo.py", 10),
+)
+
+
+def measure(script, seconds, repeat):
+    best = None
+    for _ in range(repeat):
+        res = runner.run(os.path.join(runner.ROOT, script), seconds, quiet=True)
+        if res.error:
+            raise RuntimeError("%s: %s" % (script, res.error))
+        if best is None or res.cpu_seconds < best.cpu_seconds:
+            best = res
+    oled = sim.get().i2c_devices.get(0x3C)
+    return {
+        "cpu_per_sim_s": best.cpu_seconds / best.sim_seconds,
+        "display_bytes": (oled.data_bytes + oled.cmd_bytes) if oled else 0,
+        "display_transfers": oled.transfers if oled else 0,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Simulated script benchmarks")
+    ap.add_argument("--save", help="write results to this JSON file")
+    ap.add_argument("--baseline", help="compare against this JSON file")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--min-delta", type=float, default=1.0, help="ms of cpu per simulated second")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per case, best CPU time counts")
+    ap.add_argument("cases", nargs="*", help="subset of: " + ", ".join(c[0] for c in CASES))
+    args = ap.parse_args()
+
+    base = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            base = json.load(f)
+
+    results = {}
+    failed = []
+    print("%-11s %12s %14s %10s" % ("case", "cpu ms/sim s", "display bytes", "transfers"))
+    for name, script, seconds in CASES:
+        if args.cases and name not in args.cases:
+            continue
+        r = results[name] = measure(script, seconds, args.repeat)
+        line = "%-11s %12.2f %14d %10d" % (
+            name, r["cpu_per_sim_s"] * 1000, r["display_bytes"], r["display_transfers"])
+        b = base.get(name)
+        if b:
+            grew = r["cpu_per_sim_s"] - b["cpu_per_sim_s"]
+            if grew > b["cpu_per_sim_s"] * args.tolerance and grew * 1000 > args.min_delta:
+                failed.append("%s: cpu %.2f -> %.2f ms/s" % (
+                    name, b["cpu_per_sim_s"] * 1000, r["cpu_per_sim_s"] * 1000))
+            if r["display_bytes"] > b["display_bytes"]:
+                failed.append("%s: display bytes %d -> %d" % (name, b["display_bytes"], r["display_bytes"]))
+            line += "   (baseline %.2f, %d)" % (b["cpu_per_sim_s"] * 1000, b["display_bytes"])
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    for msg in failed:
+        print("REGRESSION " + msg)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
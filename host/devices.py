@@ -0,0 +1,109 @@
+# Simulated peripherals for the host machine module.
+#
+#   SSD1306Device  I2C OLED at 0x3C, feeds the controller model from
+#                  ssd1306_emu so frames can be dumped or counted
+#   MPU6050        register model at 0x68, accelerations in g and rates in
+#                  deg/s from waveforms
+#   HCSR04Echo     answers trigger pulses on one pin with an echo pulse on
+#                  another, distance in cm from a waveform
+
+import struct
+
+import sim
+from ssd1306_emu import Controller
+
+
+class SSD1306Device:
+    def __init__(self, width=128, height=64):
+        self.ctrl = Controller(width, height)
+        self.transfers = 0
+        self.data_bytes = 0
+        self.cmd_bytes = 0
+
+    def write(self, buf):
+        # control bytes: Co (0x80) = one byte follows, D/C# (0x40) = data
+        self.transfers += 1
+        i = 0
+        n = len(buf)
+        while i < n:
+            ctrl = buf[i]
+            i += 1
+            if ctrl & 0x80:
+                if i < n:
+                    self._byte(ctrl & 0x40, buf[i])
+                i += 1
+                continue
+            for b in buf[i:]:
+                self._byte(ctrl & 0x40, b)
+            break
+
+    def _byte(self, data, b):
+        if data:
+            self.data_bytes += 1
+            self.ctrl.data(b)
+        else:
+            self.cmd_bytes += 1
+            self.ctrl.command(b)
+
+    def read(self, n):
+        return bytes(n)
+
+
+class MPU6050:
+    def __init__(self, ax=0.0, ay=0.0, az=1.0, gx=0.0, gy=0.0, gz=0.0, temp=25.0):
+        self.regs = bytearray(128)
+        self.regs[0x6B] = 0x40  # asleep after power-up
+        self.regs[0x75] = 0x68  # WHO_AM_I
+        self.ptr = 0
+        self.waves = [sim.wave(w) for w in (ax, ay, az, temp, gx, gy, gz)]
+
+    def _update(self):
+        if self.regs[0x6B] & 0x40:
+            return  # sleeping, sample registers keep their old values
+        t = sim.get().clock.now
+        ax, ay, az, temp, gx, gy, gz = (w.at(t) for w in self.waves)
+
+        def s16(v):
+            return max(-32768, min(32767, int(v)))
+
+        struct.pack_into(
+            ">hhhhhhh", self.regs, 0x3B,
+            s16(ax * 16384), s16(ay * 16384), s16(az * 16384),
+            s16((temp - 36.53) * 340),
+            s16(gx * 131), s16(gy * 131), s16(gz * 131),
+        )
+
+    def write(self, buf):
+        if not buf:
+            return
+        self.ptr = buf[0]
+        for i, b in enumerate(buf[1:]):
+            self.regs[(self.ptr + i) & 0x7F] = b
+
+    def read(self, n):
+        self._update()
+        out = bytes(self.regs[(self.ptr + i) & 0x7F] for i in range(n))
+        self.ptr = (self.ptr + n) & 0x7F
+        return out
+
+
+class HCSR04Echo:
+    # Echo high time is 58 us per cm; out of range (None or > 400 cm) holds
+    # the echo high for 38 ms like the real module.
+    def __init__(self, trigger, echo, distance_cm):
+        self.echo = echo
+        self.distance = sim.wave(distance_cm)
+        self._armed = False
+        sim.get().watch(trigger, self._trigger)
+
+    def _trigger(self, st, level):
+        if level:
+            self._armed = True
+            return
+        if not self._armed:
+            return
+        self._armed = False
+        s = sim.get()
+        d = self.distance.at(s.clock.now)
+        width = 38_000 if d is None or d > 400 else int(d * 58)
+        s.pulse(self.echo, s.clock.now + 250, width)
@@ -0,0 +1,41 @@
+# Host stand-in for MicroPython's dht module; values come from the
+# waveforms registered with sim.add_dht(pin, temperature, humidity).
+
+import sim
+
+
+class DHTBase:
+    # a DHT11 read keeps the line busy for about 25 ms
+    READ_US = 25_000
+
+    def __init__(self, pin):
+        self.id = pin.id
+        self._t = 0
+        self._h = 0
+
+    def measure(self):
+        s = sim.get()
+        s.clock.advance(self.READ_US)
+        waves = s.dht_sensors.get(self.id)
+        if waves is None:
+            raise OSError(110)  # ETIMEDOUT, nothing answering on the pin
+        self._t = waves[0].at(s.clock.now)
+        self._h = waves[1].at(s.clock.now)
+
+
+class DHT11(DHTBase):
+    def temperature(self):
+        return int(self._t)
+
+    def humidity(self):
+        return int(self._h)
+
+
+class DHT22(DHTBase):
+    READ_US = 5_000
+
+    def temperature(self):
+        return round(self._t, 1)
+
+    def humidity(self):
+        return round(self._h, 1)
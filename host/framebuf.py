@@ -0,0 +1,176 @@
+# Pure CPython stand-in for MicroPython's framebuf module.
+#
+# Supports the monochrome formats used in this repo (MONO_VLSB for the
+# SSD1306 buffer, MONO_HLSB/MONO_HMSB for logos and PBM icons) and the
+# drawing methods the scripts call. It favours being obviously correct over
+# being fast; use it to check output and count bus traffic, not to time
+# drawing code.
+#
+# text() uses a 5x7 font in an 8x8 cell, so glyphs look close to, but not
+# exactly like, the firmware's built-in font.
+
+import font5x7
+
+MONO_VLSB = 0
+MVLSB = MONO_VLSB
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError("format not supported on host")
+        self._buf = buffer
+        self._w = width
+        self._h = height
+        self._fmt = format
+        self._stride = width if stride is None else stride
+        if format == MONO_VLSB:
+            need = ((height + 7) >> 3) * self._stride
+        else:
+            need = ((self._stride + 7) >> 3) * height
+        if len(buffer) < need:
+            raise ValueError("buffer too small")
+
+    # raw pixel access, no clipping
+
+    def _get(self, x, y):
+        if self._fmt == MONO_VLSB:
+            return (self._buf[(y >> 3) * self._stride + x] >> (y & 7)) & 1
+        i = y * ((self._stride + 7) >> 3) + (x >> 3)
+        if self._fmt == MONO_HLSB:
+            return (self._buf[i] >> (7 - (x & 7))) & 1
+        return (self._buf[i] >> (x & 7)) & 1
+
+    def _set(self, x, y, c):
+        if self._fmt == MONO_VLSB:
+            i = (y >> 3) * self._stride + x
+            bit = 1 << (y & 7)
+        else:
+            i = y * ((self._stride + 7) >> 3) + (x >> 3)
+            if self._fmt == MONO_HLSB:
+                bit = 0x80 >> (x & 7)
+            else:
+                bit = 1 << (x & 7)
+        if c:
+            self._buf[i] |= bit
+        else:
+            self._buf[i] &= ~bit & 0xFF
+
+    def _fill_rect(self, x, y, w, h, c):
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        if x + w > self._w:
+            w = self._w - x
+        if y + h > self._h:
+            h = self._h - y
+        for yy in range(y, y + h):
+            for xx in range(x, x + w):
+                self._set(xx, yy, c)
+
+    def _px(self, x, y, c):
+        if 0 <= x < self._w and 0 <= y < self._h:
+            self._set(x, y, c)
+
+    # drawing methods
+
+    def fill(self, c):
+        self._fill_rect(0, 0, self._w, self._h, c)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        self._fill_rect(x, y, w, h, c)
+
+    def hline(self, x, y, w, c):
+        self._fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self._fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self._fill_rect(x, y, w, h, c)
+            return
+        self._fill_rect(x, y, w, 1, c)
+        self._fill_rect(x, y + h - 1, w, 1, c)
+        self._fill_rect(x, y, 1, h, c)
+        self._fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # Bresenham, both end points included
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self._px(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            g = font5x7.glyph(ch)
+            for col in range(5):
+                bits = g[col]
+                for row in range(7):
+                    if bits >> row & 1:
+                        self._px(x + 1 + col, y + row, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for sy in range(fbuf._h):
+            yy = y + sy
+            if not 0 <= yy < self._h:
+                continue
+            for sx in range(fbuf._w):
+                xx = x + sx
+                if not 0 <= xx < self._w:
+                    continue
+                c = fbuf._get(sx, sy)
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                if c != key:
+                    self._set(xx, yy, c)
+
+    def scroll(self, xstep, ystep):
+        # shifts the contents, the uncovered area keeps its old pixels
+        w = self._w
+        h = self._h
+        if xstep < 0:
+            xs = range(0, w + xstep)
+        else:
+            xs = range(w - 1, xstep - 1, -1)
+        if ystep < 0:
+            ys = range(0, h + ystep)
+        else:
+            ys = range(h - 1, ystep - 1, -1)
+        for yy in ys:
+            for xx in xs:
+                self._set(xx, yy, self._get(xx - xstep, yy - ystep))
+
+
+def FrameBuffer1(buffer, width, height, stride=None):
+    return FrameBuffer(buffer, width, height, MONO_VLSB, stride)
@@ -0,0 +1,296 @@
+# Convert 1-bit images to Python modules of bytes constants for the board.
+#
+#   python host/img2py.py -o raspberry.py RASPBERRY=OLED/logo_raspberry.png
+#   python host/img2py.py -o sensorLuz/logos.py LOGO=sensorLuz/cod.py:LOGO
+#
+# Each NAME=SOURCE pair becomes NAME = b"..." plus NAME_W and NAME_H.
+# SOURCE is a PNG (any colour type, 8 bits or less, not interlaced), a PBM
+# (P1 or P4) or SCRIPT.py:VAR, a list of MONO_HLSB bytes embedded in one of
+# the repo's scripts. Images are scaled to fit --size, centred and
+# thresholded; dark opaque pixels are lit unless --invert is given.
+#
+# The default MONO_VLSB output has the SSD1306 page layout, so a
+# full-screen image goes straight into the display with oled.load(NAME).
+# A bytes constant is one object on the heap instead of a list of ints, and
+# when the module is frozen into the firmware it stays in flash. Note that
+# framebuf.FrameBuffer needs a writable buffer: blitting a smaller image
+# still takes bytearray(NAME) once. --format rle writes PackBits images for
+# rle.blit() (OLED/lib/rle.py), which decodes into the display buffer.
+# --mpy also runs mpy-cross on the output.
+
+import argparse
+import ast
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import zlib
+
+
+def read_png(path):
+    # returns (w, h, rows) with rows of ink 0/1
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("%s: not a PNG" % path)
+    pos = 8
+    idat = []
+    palette = None
+    trns = None
+    while pos < len(data):
+        n, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        chunk = data[pos + 8:pos + 8 + n]
+        pos += 12 + n
+        if kind == b"IHDR":
+            w, h, depth, ctype, _, _, interlace = struct.unpack(">IIBBBBB", chunk)
+        elif kind == b"PLTE":
+            palette = [chunk[i:i + 3] for i in range(0, n, 3)]
+        elif kind == b"tRNS":
+            trns = chunk
+        elif kind == b"IDAT":
+            idat.append(chunk)
+        elif kind == b"IEND":
+            break
+    if interlace or depth > 8:
+        raise ValueError("%s: interlaced or 16-bit PNG not supported" % path)
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[ctype]
+    bpp = max(1, channels * depth // 8)
+    stride = (w * channels * depth + 7) // 8
+    raw = zlib.decompress(b"".join(idat))
+    rows = []
+    prev = bytearray(stride)
+    for y in range(h):
+        i = y * (stride + 1)
+        ftype = raw[i]
+        line = bytearray(raw[i + 1:i + 1 + stride])
+        for x in range(stride):
+            a = line[x - bpp] if x >= bpp else 0
+            b = prev[x]
+            c = prev[x - bpp] if x >= bpp else 0
+            if ftype == 1:
+                line[x] = (line[x] + a) & 0xFF
+            elif ftype == 2:
+                line[x] = (line[x] + b) & 0xFF
+            elif ftype == 3:
+                line[x] = (line[x] + ((a + b) >> 1)) & 0xFF
+            elif ftype == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                line[x] = (line[x] + pred) & 0xFF
+        prev = line
+        rows.append(_png_row(line, w, depth, ctype, channels, palette, trns))
+    return w, h, rows
+
+
+def _png_row(line, w, depth, ctype, channels, palette, trns):
+    # ink is a dark, opaque pixel
+    if depth < 8:
+        per = 8 // depth
+        mask = (1 << depth) - 1
+        vals = [(line[x // per] >> (8 - depth * (x % per + 1))) & mask for x in range(w)]
+    else:
+        vals = None
+    out = []
+    for x in range(w):
+        alpha = 255
+        if ctype == 3:
+            idx = vals[x] if vals else line[x]
+            r, g, b = palette[idx]
+            lum = (r * 299 + g * 587 + b * 114) // 1000
+            if trns is not None and idx < len(trns):
+                alpha = trns[idx]
+        elif ctype in (0, 4):
+            lum = vals[x] * 255 // ((1 << depth) - 1) if vals else line[x * channels]
+            if ctype == 4:
+                alpha = line[x * 2 + 1]
+        else:
+            r, g, b = line[x * channels:x * channels + 3]
+            lum = (r * 299 + g * 587 + b * 114) // 1000
+            if ctype == 6:
+                alpha = line[x * 4 + 3]
+        out.append(1 if alpha >= 128 and lum < 128 else 0)
+    return out
+
+
+def read_pbm(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    tokens = []
+    pos = 0
+    # magic, width, height; comments may appear between them
+    while len(tokens) < 3:
+        while data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b"#":
+            pos = data.index(b"\n", pos)
+            continue
+        end = pos
+        while end < len(data) and not data[end:end + 1].isspace():
+            end += 1
+        tokens.append(data[pos:end])
+        pos = end
+    magic, w, h = tokens[0], int(tokens[1]), int(tokens[2])
+    if magic == b"P4":
+        pos += 1
+        stride = (w + 7) // 8
+        rows = [[(data[pos + y * stride + x // 8] >> (7 - x % 8)) & 1 for x in range(w)] for y in range(h)]
+    elif magic == b"P1":
+        bits = [int(c) for c in data[pos:].decode().split("#")[0] if c in "01"]
+        rows = [bits[y * w:(y + 1) * w] for y in range(h)]
+    else:
+        raise ValueError("%s: only P1 and P4 PBM files are supported" % path)
+    return w, h, rows
+
+
+def read_list(path, name, w, h):
+    # a MONO_HLSB list literal assigned to NAME anywhere in the script
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == name for t in node.targets):
+            data = bytes(ast.literal_eval(node.value))
+            break
+    else:
+        raise ValueError("%s: no list named %s" % (path, name))
+    stride = (w + 7) // 8
+    if len(data) != stride * h:
+        raise ValueError("%s:%s has %d bytes, %dx%d needs %d" % (path, name, len(data), w, h, stride * h))
+    rows = [[(data[y * stride + x // 8] >> (7 - x % 8)) & 1 for x in range(w)] for y in range(h)]
+    return w, h, rows
+
+
+def fit(src, w, h):
+    # box-filter scale into w x h keeping the aspect ratio, centred
+    sw, sh, rows = src
+    if (sw, sh) == (w, h):
+        return rows
+    s = min(w / sw, h / sh)
+    tw, th = max(1, round(sw * s)), max(1, round(sh * s))
+    ox, oy = (w - tw) // 2, (h - th) // 2
+    out = [[0] * w for _ in range(h)]
+    for ty in range(th):
+        y0, y1 = ty * sh // th, max(ty * sh // th + 1, (ty + 1) * sh // th)
+        for tx in range(tw):
+            x0, x1 = tx * sw // tw, max(tx * sw // tw + 1, (tx + 1) * sw // tw)
+            ink = sum(rows[y][x] for y in range(y0, y1) for x in range(x0, x1))
+            out[oy + ty][ox + tx] = 1 if ink * 2 >= (y1 - y0) * (x1 - x0) else 0
+    return out
+
+
+def pack_vlsb(rows, w, h):
+    out = bytearray(w * ((h + 7) // 8))
+    for y in range(h):
+        for x in range(w):
+            if rows[y][x]:
+                out[(y >> 3) * w + x] |= 1 << (y & 7)
+    return bytes(out)
+
+
+def pack_hlsb(rows, w, h):
+    stride = (w + 7) // 8
+    out = bytearray(stride * h)
+    for y in range(h):
+        for x in range(w):
+            if rows[y][x]:
+                out[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+    return bytes(out)
+
+
+def packbits(row):
+    # runs of three or more equal bytes repeat, the rest goes in literals
+    out = bytearray()
+    lit = bytearray()
+    i = 0
+    n = len(row)
+    while i < n:
+        j = i
+        while j < n and j - i < 128 and row[j] == row[i]:
+            j += 1
+        if j - i >= 3:
+            if lit:
+                out += bytes((len(lit) - 1,)) + lit
+                lit = bytearray()
+            out += bytes((257 - (j - i), row[i]))
+            i = j
+        else:
+            lit.append(row[i])
+            i += 1
+            if len(lit) == 128:
+                out += bytes((127,)) + lit
+                lit = bytearray()
+    if lit:
+        out += bytes((len(lit) - 1,)) + lit
+    return bytes(out)
+
+
+def pack_rle(rows, w, h):
+    # format read by OLED/lib/rle.py: w, h, PackBits per page row
+    if w > 255 or h > 255:
+        raise ValueError("RLE images are at most 255x255")
+    vlsb = pack_vlsb(rows, w, h)
+    out = bytearray((w, h))
+    for p in range((h + 7) // 8):
+        out += packbits(vlsb[p * w:(p + 1) * w])
+    return bytes(out)
+
+
+def literal(data, per_line=16):
+    lines = []
+    for i in range(0, len(data), per_line):
+        lines.append('    b"' + "".join("\\x%02x" % b for b in data[i:i + per_line]) + '"')
+    return "(\n" + "\n".join(lines) + "\n)"
+
+
+def load(source, w, h):
+    if ".py:" in source:
+        path, _, var = source.rpartition(":")
+        return read_list(path, var, w, h)
+    if source.lower().endswith(".png"):
+        return read_png(source)
+    return read_pbm(source)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Convert images to bytes constants for MicroPython")
+    ap.add_argument("images", nargs="+", metavar="NAME=SOURCE")
+    ap.add_argument("-o", "--output", required=True)
+    ap.add_argument("--size", default="128x64", help="target WxH, also the size of list sources")
+    ap.add_argument("--format", choices=("vlsb", "hlsb", "rle"), default="vlsb",
+                    help="rle: PackBits for rle.blit() in OLED/lib/rle.py")
+    ap.add_argument("--invert", action="store_true")
+    ap.add_argument("--mpy", action="store_true", help="compile the output with mpy-cross")
+    args = ap.parse_args()
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    pack = {"vlsb": pack_vlsb, "hlsb": pack_hlsb, "rle": pack_rle}[args.format]
+
+    out = [
+        "# Generated by host/img2py.py, do not edit.",
+        "# %dx%d MONO_%s images; full-screen ones go to the display with oled.load(NAME)."
+        % (w, h, args.format.upper()) if args.format != "rle" else
+        "# %dx%d run-length images; draw them with rle.blit(oled, NAME)." % (w, h),
+        "",
+    ]
+    for item in args.images:
+        name, _, source = item.partition("=")
+        rows = fit(load(source, w, h), w, h)
+        if args.invert:
+            rows = [[1 - v for v in row] for row in rows]
+        out.append("# from %s" % os.path.relpath(source))
+        out.append("%s = %s" % (name, literal(pack(rows, w, h))))
+        out.append("%s_W = %d" % (name, w))
+        out.append("%s_H = %d" % (name, h))
+        out.append("")
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+    if args.mpy:
+        tool = shutil.which("mpy-cross")
+        if tool is None:
+            sys.exit("mpy-cross not found on PATH")
+        subprocess.check_call([tool, args.output])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# Replay IR edge traces through infrarojo/ir_rx.py on the simulated clock.
+#
+#   python host/ir_replay.py --trace ir_trace.bin --decoder NEC_16
+#   python host/ir_replay.py --fixtures host/ir_fixtures.txt --pin
+#   python host/ir_replay.py --script carrito/main.py --jitter 0,100,200
+#
+# Traces come from a device (infrarojo/ir_record.py, binary), the fixture
+# file, or by default a generated key sequence (irtrace.keys). The result
+# of each trace decoded as recorded is the reference; every table reports
+# per --jitter value (max edge shift in us) how many bursts still match it.
+#
+# decode  the decoder on the edge times directly, host time per decode
+# --pin   the edges as a waveform on pin 15, with the edge interrupts and
+#         with burst_capture(); latency is simulated time from the last
+#         edge of a burst to its queued event, and a burst only matches if
+#         it queued exactly the reference event
+# --script  runs the script (carrito/main.py) with the waveform on pin 15
+#         and checks the motor pins after every movement key
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HOST = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(HOST, "..", "infrarojo")]
+
+import irtrace  # noqa: E402
+import run as runner  # noqa: E402
+from devices import SSD1306Device  # noqa: E402
+import sim  # noqa: E402
+import utime  # noqa: E402
+from machine import Pin  # noqa: E402
+
+sys.modules["time"] = utime
+import ir_rx  # noqa: E402
+
+_MASK = (1 << 30) - 1
+
+# carrito/main.py: NEC command -> IN1, IN2, IN3, IN4 (pins 27, 26, 33, 32)
+MOTOR_PINS = (27, 26, 33, 32)
+MOVES = {
+    0x18: (1, 0, 1, 0),
+    0x52: (0, 1, 0, 1),
+    0x08: (0, 1, 1, 0),
+    0x5A: (1, 0, 0, 1),
+    0x1C: (0, 0, 0, 0),
+}
+
+
+def load(args):
+    # [edge times] with realistic spacing between bursts
+    if args.trace:
+        return irtrace.read_bin(args.trace)
+    if args.fixtures:
+        cases = irtrace.load(args.fixtures)
+        return [irtrace.edges(c[4], k * 150_000) for k, c in enumerate(cases)]
+    cmds = (0x18, 0x08, 0x5A, 0x52, 0x1C, 0x45, 0x0D) * 4
+    return [irtrace.edges(d, t) for t, d in irtrace.keys(cmds, 0, 500_000, repeats=2)]
+
+
+def jittered(tr, jitter, rng):
+    # every edge after the first moved by up to +-jitter us; stamps stay in
+    # order, as the capture takes them one after the other
+    if not jitter:
+        return tr
+    out = [tr[0]]
+    prev = 0
+    for t in tr[1:]:
+        prev = max(((t - tr[0]) & _MASK) + rng.randint(-jitter, jitter), prev + 1)
+        out.append((tr[0] + prev) & _MASK)
+    return out
+
+
+def decode_all(cls, traces):
+    # one event per trace, decoded from _times as _cb_pin would leave them
+    ir = cls(Pin(14, Pin.IN))
+    out = []
+    times = ir._times
+    start = time.perf_counter()
+    for tr in traces:
+        n = min(len(tr), len(times))
+        for i in range(n):
+            times[i] = tr[i]
+        ir.edge = len(tr) if len(tr) <= len(times) else len(times)
+        ir.decode(None)
+        out.append(ir._pop()[:3])
+    us = (time.perf_counter() - start) / len(traces) * 1e6
+    return out, us
+
+
+def bursts(traces, t0=100_000):
+    # edge times -> (start, durations) on the simulated clock, keeping the
+    # recorded spacing but never overlapping
+    out = []
+    t = t0
+    for k, tr in enumerate(traces):
+        if k:
+            gap = (tr[0] - traces[k - 1][0]) & _MASK
+            # a pause in the recording (or ticks_us wrapping) is shortened
+            t += gap if gap < 10_000_000 else 200_000
+            t = max(t, out[-1][0] + sum(out[-1][1]) + 20_000)
+        out.append((t, irtrace.durations(tr)))
+    return out
+
+
+def replay_pin(cls, traces, burst):
+    # decoder behind pin 15; per burst the events queued from its first
+    # edge to the next burst, and the latency of the last one after the
+    # burst's last edge (None without events)
+    s = sim.reset()
+    ir = cls(Pin(15, Pin.IN))
+    if burst:
+        ir.burst_capture()
+    seq = bursts(traces)
+    done = []
+    queue = ir.do_callback
+
+    def stamp(cmd, addr, ext, thresh=0):
+        queue(cmd, addr, ext, thresh)
+        e = ir._pop()
+        if e is not None:
+            done.append((s.clock.now, e[:3]))
+
+    ir.do_callback = stamp
+    s.digital(15, irtrace.waveform(seq))
+    last = seq[-1][0] + sum(seq[-1][1])
+    s.clock.run_until(last + 200_000)
+    ir.close()
+    out = []
+    for k, (t, durs) in enumerate(seq):
+        stop = seq[k + 1][0] if k + 1 < len(seq) else last + 200_000
+        evs = [(when, e) for when, e in done if t <= when < stop]
+        end = t + sum(durs)
+        out.append(([e for _, e in evs], evs[-1][0] - end if evs else None))
+    return out
+
+
+def run_script(script, traces, ref):
+    # movement keys whose motor state is right once the burst is decoded
+    seq = bursts(traces, 1_000_000)
+
+    def setup(s):
+        s.add_i2c(0x3C, SSD1306Device())
+        s.record_outputs = True
+        s.digital(15, irtrace.waveform(seq))
+
+    last = seq[-1][0] + sum(seq[-1][1])
+    res = runner.run(script, (last + 500_000) / 1e6, setup, quiet=True)
+    s = sim.get()
+    hist = [s.pin(p).history for p in MOTOR_PINS]
+
+    def level(h, t):
+        v = 0
+        for tt, lv in h:
+            if tt > t:
+                break
+            v = lv
+        return v
+
+    ok = total = 0
+    for (t, durs), (cmd, addr, ext) in zip(seq, ref):
+        if cmd in MOVES:
+            total += 1
+            at = t + sum(durs) + 150_000
+            if tuple(level(h, at) for h in hist) == MOVES[cmd]:
+                ok += 1
+    return ok, total, res
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Replay IR traces through ir_rx on the simulator")
+    ap.add_argument("--trace", help="binary trace from infrarojo/ir_record.py")
+    ap.add_argument("--fixtures", help="text trace file, e.g. host/ir_fixtures.txt")
+    ap.add_argument("--decoder", default=None, help="ir_rx class, default IR_AUTO (NEC_16 with --script)")
+    ap.add_argument("--jitter", default="0,50,100,200,300", help="comma separated max edge shifts in us")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--pin", action="store_true", help="also replay on pin 15, both capture modes")
+    ap.add_argument("--script", help="run this script with the traces on pin 15")
+    ap.add_argument("--write", help="save the traces used as a binary trace file")
+    args = ap.parse_args()
+
+    traces = load(args)
+    if args.write:
+        irtrace.write_bin(args.write, traces)
+    name = args.decoder or ("NEC_16" if args.script else "IR_AUTO")
+    cls = getattr(ir_rx, name)
+    jitters = [int(j) for j in args.jitter.split(",")]
+    sim.reset()
+    ref, _ = decode_all(cls, traces)
+    print("%d bursts, decoder %s, %d decoded to data" % (len(traces), name, sum(1 for r in ref if r[0] >= 0)))
+
+    print("\n%-8s %10s %10s" % ("jitter", "host us", "matching"))
+    for j in jitters:
+        rng = random.Random(args.seed)
+        got, us = decode_all(cls, [jittered(tr, j, rng) for tr in traces])
+        ok = sum(1 for a, b in zip(got, ref) if a == b)
+        print("%-8d %10.2f %6d/%d" % (j, us, ok, len(ref)))
+
+    if args.pin:
+        print("\n%-8s %-8s %12s %12s %10s" % ("jitter", "capture", "latency ms", "max ms", "matching"))
+        for j in jitters:
+            for burst in (False, True):
+                rng = random.Random(args.seed)
+                out = replay_pin(cls, [jittered(tr, j, rng) for tr in traces], burst)
+                lat = [d for e, d in out if d is not None]
+                ok = sum(1 for (e, d), r in zip(out, ref) if e == [r])
+                print("%-8d %-8s %12.2f %12.2f %6d/%d" % (
+                    j, "burst" if burst else "edges",
+                    sum(lat) / len(lat) / 1000 if lat else 0, max(lat) / 1000 if lat else 0, ok, len(ref)))
+
+    if args.script:
+        print("\n%-8s %10s" % ("jitter", "moves ok"))
+        for j in jitters:
+            rng = random.Random(args.seed)
+            ok, total, res = run_script(args.script, [jittered(tr, j, rng) for tr in traces], ref)
+            print("%-8d %6d/%d%s" % (j, ok, total, "  stopped by error: " + res.error if res.error else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+# IR edge traces for the decoders in infrarojo/ir_rx.py.
+#
+# A trace is what IR_RX._cb_pin records for one burst: the ticks_us value of
+# every edge. The generators below build the mark/space durations of a
+# frame from the protocol timings; edges() turns durations into edge times
+# (optionally with jitter, as other interrupts would add on the device)
+# and waveform() into a step list for sim.digital(), with the receiver
+# output low during marks.
+#
+#   durs = nec(0x00, 0x18)
+#   ir._times[:68] = array("i", edges(durs, t0=123456, jitter=60, rng=rng))
+#
+# Fixture files hold one burst per line with the values it must decode to:
+#
+#   # protocol cmd addr ext: durations in us, first one a mark
+#   rc5 0x0c 0x00 1: 1000 820 1760 ...
+#
+# python host/irtrace.py --write host/ir_fixtures.txt regenerates the
+# checked-in set: every protocol with the mark stretch and edge jitter of a
+# typical demodulating receiver (TSOP38238 class), seeded.
+#
+# Binary traces are what infrarojo/ir_record.py writes on the device: the
+# magic b"IRT\x01", then per burst a little-endian uint16 edge count, the
+# uint32 ticks_us of the first edge and one uint16 width in us per
+# following edge (capped at 65535). read_bin()/write_bin() convert them to
+# and from lists of edge times.
+
+import random
+import struct
+from array import array
+
+_MASK = (1 << 30) - 1  # ticks_us wraps at 2**30
+
+NEC_MARK = 562
+NEC_ONE = 1687
+NEC_ZERO = 562
+RC5_UNIT = 889
+RC6_UNIT = 444
+SONY_LEADER = 2400
+SONY_SPACE = 600
+SONY_ONE = 1200
+SONY_ZERO = 600
+
+
+def nec(addr, cmd, samsung=False):
+    # 8 bit addr is sent with its complement; a 16 bit addr as is
+    if addr > 0xFF:
+        bits = addr | (cmd << 16) | ((cmd ^ 0xFF) << 24)
+    else:
+        bits = addr | ((addr ^ 0xFF) << 8) | (cmd << 16) | ((cmd ^ 0xFF) << 24)
+    durs = [4500, 4500] if samsung else [9000, 4500]
+    for i in range(32):
+        durs.append(NEC_MARK)
+        durs.append(NEC_ONE if (bits >> i) & 1 else NEC_ZERO)
+    durs.append(NEC_MARK)
+    return durs
+
+
+def nec_repeat():
+    return [9000, 2250, NEC_MARK]
+
+
+def _runs(units, unit):
+    # half-bit levels -> mark/space durations, leading and trailing idle
+    # (0) dropped
+    while units and units[0] == 0:
+        units.pop(0)
+    while units and units[-1] == 0:
+        units.pop()
+    durs = []
+    last = None
+    for u in units:
+        if u == last:
+            durs[-1] += unit
+        else:
+            durs.append(unit)
+            last = u
+    return durs
+
+
+def rc5(addr, cmd, toggle=0):
+    # 14 Manchester bits of 2 x 889 us, 1 = off then on; S2 carries the
+    # inverted 7th command bit
+    bits = [1, 0 if cmd & 0x40 else 1, toggle]
+    bits += [(addr >> i) & 1 for i in range(4, -1, -1)]
+    bits += [(cmd >> i) & 1 for i in range(5, -1, -1)]
+    units = []
+    for b in bits:
+        units += [0, 1] if b else [1, 0]
+    return _runs(units, RC5_UNIT)
+
+
+def rc6(addr, cmd, toggle=0):
+    # mode 0: leader 6 units on and 2 off, start bit 1, mode 000, the
+    # double-length trailer (toggle) bit, then 8 address and 8 command
+    # bits; 1 = on then off
+    units = [1] * 6 + [0] * 2 + [1, 0]
+    units += [0, 1] * 3
+    units += [1, 1, 0, 0] if toggle else [0, 0, 1, 1]
+    for i in range(15, -1, -1):
+        units += [1, 0] if ((addr << 8 | cmd) >> i) & 1 else [0, 1]
+    return _runs(units, RC6_UNIT)
+
+
+def sony(cmd, addr, bits=12, ext=0):
+    # 2.4 ms leader, then per bit a 600 us space and a 1200/600 us mark
+    v = cmd | (addr << 7)
+    if bits == 20:
+        v |= ext << 12
+    durs = [SONY_LEADER]
+    for i in range(bits):
+        durs.append(SONY_SPACE)
+        durs.append(SONY_ONE if (v >> i) & 1 else SONY_ZERO)
+    return durs
+
+
+def edges(durs, t0=0, jitter=0, rng=None):
+    # ticks_us of each edge; jitter moves every edge by up to +-jitter us
+    rng = rng or random
+    out = [t0 & _MASK]
+    t = t0
+    for d in durs:
+        t += d
+        j = rng.randint(-jitter, jitter) if jitter else 0
+        out.append((t + j) & _MASK)
+    return out
+
+
+def receiver(durs, stretch=60, jitter=40, rng=None):
+    # demodulator output: marks come out longer and spaces shorter by
+    # about `stretch` us, plus random jitter per duration
+    rng = rng or random
+    out = []
+    for i, d in enumerate(durs):
+        d += stretch if i % 2 == 0 else -stretch
+        out.append(d + rng.randint(-jitter, jitter))
+    return out
+
+
+# protocol name -> (generator of (durations, cmd, addr, ext), as a
+# function of a random source)
+PROTOCOLS = {
+    "nec": lambda r: _frame(nec, r.randrange(256), r.choice((0x00, 0x04, 0x1234)), 0),
+    "samsung": lambda r: _samsung(r),
+    "rc5": lambda r: _rc(rc5, r, 128, 32),
+    "rc6": lambda r: _rc(rc6, r, 256, 256),
+    "sony12": lambda r: _sony(r, 12, 32),
+    "sony15": lambda r: _sony(r, 15, 256),
+    "sony20": lambda r: _sony(r, 20, 32),
+}
+
+
+def _frame(gen, cmd, addr, ext):
+    return gen(addr, cmd), cmd, addr, ext
+
+
+def _samsung(r):
+    # 16 bit address without complement, 4.5 ms leader
+    cmd = r.randrange(256)
+    return nec(0x0707, cmd, samsung=True), cmd, 0x0707, 0
+
+
+def _rc(gen, r, ncmd, naddr):
+    cmd, addr, toggle = r.randrange(ncmd), r.randrange(naddr), r.randrange(2)
+    return gen(addr, cmd, toggle), cmd, addr, toggle
+
+
+def _sony(r, bits, naddr):
+    cmd, addr, ext = r.randrange(128), r.randrange(naddr), r.randrange(256) if bits == 20 else 0
+    return sony(cmd, addr, bits, ext), cmd, addr, ext
+
+
+def fixtures(per_protocol=40, seed=1, stretch=60, jitter=40):
+    # [(protocol, cmd, addr, ext, durations)]
+    rng = random.Random(seed)
+    out = []
+    for name, gen in PROTOCOLS.items():
+        for _ in range(per_protocol):
+            durs, cmd, addr, ext = gen(rng)
+            out.append((name, cmd, addr, ext, receiver(durs, stretch, jitter, rng)))
+    return out
+
+
+def save(path, cases):
+    with open(path, "w") as f:
+        f.write("# protocol cmd addr ext: durations in us, first one a mark\n")
+        for name, cmd, addr, ext, durs in cases:
+            f.write("%s 0x%02x 0x%02x %d: %s\n" % (name, cmd, addr, ext, " ".join(str(d) for d in durs)))
+
+
+def load(path):
+    cases = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            head, durs = line.split(":")
+            name, cmd, addr, ext = head.split()
+            cases.append((name, int(cmd, 0), int(addr, 0), int(ext), [int(d) for d in durs.split()]))
+    return cases
+
+
+MAGIC = b"IRT\x01"
+
+
+def read_bin(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError("%s: not an IR trace file" % path)
+    traces = []
+    i = 4
+    while i + 6 <= len(data):
+        n, t = struct.unpack_from("<HI", data, i)
+        i += 6
+        w = array("H")
+        w.frombytes(data[i:i + 2 * (n - 1)])
+        i += 2 * (n - 1)
+        if len(w) != n - 1:
+            break  # last burst cut short, e.g. power lost while writing
+        tr = [t]
+        for d in w:
+            t = (t + d) & _MASK
+            tr.append(t)
+        traces.append(tr)
+    return traces
+
+
+def write_bin(path, traces):
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        for tr in traces:
+            f.write(struct.pack("<HI", len(tr), tr[0] & _MASK))
+            f.write(array("H", (min((b - a) & _MASK, 0xFFFF) for a, b in zip(tr, tr[1:]))).tobytes())
+
+
+def durations(tr):
+    # edge times -> mark/space durations
+    return [(b - a) & _MASK for a, b in zip(tr, tr[1:])]
+
+
+def keys(cmds, t0=1_000_000, period=700_000, addr=0x00, repeats=1, rng=None):
+    # bursts for sim.digital: each NEC key press followed by `repeats`
+    # repeat codes 108 ms apart (key held), through the receiver model
+    rng = rng or random.Random(1)
+    bursts = []
+    t = t0
+    for cmd in cmds:
+        bursts.append((t, receiver(nec(addr, cmd), rng=rng)))
+        for k in range(1, repeats + 1):
+            bursts.append((t + k * 108_000, receiver(nec_repeat(), rng=rng)))
+        t += period
+    return bursts
+
+
+def waveform(bursts, idle=1):
+    # bursts: [(t_start_us, durations), ...] -> step list for sim.digital
+    steps = [(0, idle)]
+    for t, durs in bursts:
+        level = 1 - idle
+        for d in durs:
+            steps.append((t, level))
+            t += d
+            level = 1 - level
+        steps.append((t, idle))
+    return steps
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Write the IR trace fixture file")
+    ap.add_argument("--write", required=True)
+    ap.add_argument("--per-protocol", type=int, default=40)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    save(args.write, fixtures(args.per_protocol, args.seed))
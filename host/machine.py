@@ -0,0 +1,263 @@
+# Host stand-in for MicroPython's machine module, backed by sim.py.
+#
+# Pins, ADC inputs, I2C devices and DHT sensors read their values from the
+# waveforms and device models registered on the simulation; bus transfers
+# and sleeps advance the simulated clock.
+
+import errno
+
+import sim
+
+
+def _clock():
+    return sim.get().clock
+
+
+class Pin:
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_UP = 2
+    PULL_DOWN = 1
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._st = sim.get().pin(id)
+        self.init(mode, pull, value)
+
+    def init(self, mode=-1, pull=-1, value=None):
+        st = self._st
+        if mode != -1:
+            st.mode = mode
+        if pull != -1:
+            st.pull = pull
+            if pull == Pin.PULL_UP and st.mode == Pin.IN and not st.writes:
+                st.level = 1
+        if value is not None:
+            self.value(value)
+
+    def value(self, v=None):
+        st = self._st
+        if v is None:
+            return st.level
+        v = 1 if v else 0
+        st.writes += 1
+        s = sim.get()
+        if s.record_outputs:
+            st.history.append((s.clock.now, v))
+        st.set_level(v, external=False)
+        for fn in st.watchers:
+            fn(st, v)
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        st = self._st
+        st.handler = handler
+        st.trigger = trigger
+        st.pin = self
+
+    def __repr__(self):
+        return "Pin(%s)" % self.id
+
+
+class Signal(Pin):
+    pass
+
+
+class ADC:
+    ATTN_0DB = 0
+    ATTN_2_5DB = 1
+    ATTN_6DB = 2
+    ATTN_11DB = 3
+    WIDTH_9BIT = 0
+    WIDTH_10BIT = 1
+    WIDTH_11BIT = 2
+    WIDTH_12BIT = 3
+
+    def __init__(self, pin, atten=None):
+        self.id = pin.id if isinstance(pin, Pin) else pin
+        self._bits = 12
+
+    def atten(self, a):
+        pass
+
+    def width(self, w):
+        self._bits = 9 + w
+
+    def _volts(self):
+        s = sim.get()
+        # an ESP32 conversion takes about 40 us
+        s.clock.advance(40)
+        w = s.analog_inputs.get(self.id)
+        v = w.at(s.clock.now) if w is not None else 0
+        return min(max(v, 0.0), 3.3)
+
+    def read(self):
+        return int(self._volts() / 3.3 * ((1 << self._bits) - 1))
+
+    def read_u16(self):
+        return int(self._volts() / 3.3 * 65535)
+
+    def read_uv(self):
+        return int(self._volts() * 1_000_000)
+
+
+class I2C:
+    # Transfers are dispatched to the device models registered with
+    # sim.add_i2c(); each one advances the clock by its wire time (9 clocks
+    # per byte plus the address byte and START/STOP).
+    def __init__(self, id=-1, scl=None, sda=None, freq=400_000, timeout=50_000):
+        self.freq = freq
+        self.bytes = 0
+        self.transactions = 0
+
+    def init(self, scl=None, sda=None, freq=400_000):
+        self.freq = freq
+
+    def _dev(self, addr, n):
+        self.transactions += 1
+        self.bytes += n + 1
+        _clock().advance((9 * (n + 1) + 2) * 1_000_000 / self.freq)
+        dev = sim.get().i2c_devices.get(addr)
+        if dev is None:
+            raise OSError(errno.ENODEV)
+        return dev
+
+    def scan(self):
+        return sorted(sim.get().i2c_devices)
+
+    def writeto(self, addr, buf, stop=True):
+        self._dev(addr, len(buf)).write(bytes(buf))
+        return 1
+
+    def writevto(self, addr, vector, stop=True):
+        data = b"".join(bytes(b) for b in vector)
+        self._dev(addr, len(data)).write(data)
+        return 1
+
+    def readfrom(self, addr, nbytes, stop=True):
+        return bytes(self._dev(addr, nbytes).read(nbytes))
+
+    def readfrom_into(self, addr, buf, stop=True):
+        buf[:] = self.readfrom(addr, len(buf))
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        self._dev(addr, len(buf) + 1).write(bytes((memaddr,)) + bytes(buf))
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        dev = self._dev(addr, nbytes + 2)
+        dev.write(bytes((memaddr,)))
+        return bytes(dev.read(nbytes))
+
+    def readfrom_mem_into(self, addr, memaddr, buf, addrsize=8):
+        buf[:] = self.readfrom_mem(addr, memaddr, len(buf))
+
+
+class SoftI2C(I2C):
+    pass
+
+
+class SPI:
+    def __init__(self, id=-1, baudrate=1_000_000, **kw):
+        self.baudrate = baudrate
+        self.bytes = 0
+        self.inits = 0
+
+    def init(self, baudrate=None, **kw):
+        self.inits += 1
+        if baudrate:
+            self.baudrate = baudrate
+
+    def write(self, buf):
+        self.bytes += len(buf)
+        _clock().advance(8 * len(buf) * 1_000_000 / self.baudrate)
+
+    def deinit(self):
+        pass
+
+
+class SoftSPI(SPI):
+    pass
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kw):
+        self.id = id
+        self._ev = None
+        if kw:
+            self.init(**kw)
+
+    def init(self, mode=PERIODIC, period=-1, callback=None, freq=None):
+        self.deinit()
+        if freq:
+            period_us = 1_000_000 // freq
+        else:
+            period_us = period * 1000
+        self._mode = mode
+        self._period = period_us
+        self._callback = callback
+        self._ev = _clock().schedule(_clock().now + period_us, self._fire)
+
+    def _fire(self):
+        if self._mode == Timer.PERIODIC:
+            self._ev = _clock().schedule(_clock().now + self._period, self._fire)
+        else:
+            self._ev = None
+        if self._callback is not None:
+            self._callback(self)
+
+    def deinit(self):
+        if self._ev is not None:
+            _clock().cancel(self._ev)
+            self._ev = None
+
+
+def time_pulse_us(pin, pulse_level, timeout_us=1_000_000):
+    # -2: timed out waiting for the pulse to start, -1: while measuring it
+    clk = _clock()
+    st = pin._st
+    clk.charge_cpu()
+    if not clk.run_until(clk.now + timeout_us, lambda: st.level == pulse_level):
+        return -2
+    start = clk.now
+    if not clk.run_until(start + timeout_us, lambda: st.level != pulse_level):
+        return -1
+    return clk.now - start
+
+
+def freq(f=None):
+    return 240_000_000
+
+
+def idle():
+    nxt = _clock().next_event()
+    _clock().advance((nxt - _clock().now) if nxt is not None else 1000)
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state=0):
+    pass
+
+
+def reset():
+    raise sim.StopSimulation()
+
+
+def unique_id():
+    return b"\x24\x0a\xc4\x00\x00\x01"
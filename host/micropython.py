@@ -0,0 +1,34 @@
+# Host stand-in for the micropython module.
+
+import sim
+
+
+def const(x):
+    return x
+
+
+def schedule(func, arg):
+    # run as soon as the simulated clock is next advanced, like the
+    # firmware runs scheduled callbacks outside interrupt context
+    c = sim.get().clock
+    c.schedule(c.now, func, arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
+
+
+def opt_level(level=None):
+    return 0
+
+
+def mem_info(verbose=False):
+    print("mem: host")
@@ -0,0 +1,156 @@
+# Run one of the repo's MicroPython scripts headless on the host.
+#
+#   python host/run.py sensorUltrasonicoPIR/codigo.py --seconds 30
+#   python host/run.py juego/codigo.py --seconds 10 --dump pong.png
+#   python host/run.py focoLDR/codigo.py --profile --quiet
+#
+# The script runs with the host machine/utime/dht/framebuf modules on the
+# path and the scenario from scenarios.py (or --scenario) providing its
+# inputs, until the simulated clock reaches --seconds.
+
+import argparse
+import builtins
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import runpy
+import sys
+import time as _time
+
+HOST = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.normpath(os.path.join(HOST, ".."))
+
+for p in (os.path.join(ROOT, "OLED"), os.path.join(ROOT, "OLED", "lib"), HOST):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+# ir_rx is copied to the board next to carrito/main.py; after the script's
+# own directory so infrarojo/infra.py still gets the copy beside it
+IR_LIB = os.path.join(ROOT, "infrarojo")
+if IR_LIB not in sys.path:
+    sys.path.append(IR_LIB)
+
+import sim  # noqa: E402
+import scenarios  # noqa: E402
+
+
+def _scenario(name, script):
+    if callable(name):
+        return name
+    if name is None:
+        rel = os.path.relpath(os.path.abspath(script), ROOT).replace(os.sep, "/")
+        return scenarios.BY_SCRIPT.get(rel, scenarios.default)
+    if name.endswith(".py"):
+        return runpy.run_path(name)["setup"]
+    return getattr(scenarios, name)
+
+
+class Result:
+    def __init__(self):
+        self.sim_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.error = None
+        self.output = ""
+
+
+def run(script, seconds=10.0, scenario=None, cpu_scale=0, quiet=False, profile=None):
+    # Returns a Result; the Simulation stays available via sim.get() for
+    # inspection (display device, pin histories) until the next run.
+    s = sim.reset()
+    s.clock.limit = int(seconds * 1_000_000)
+    s.clock.cpu_scale = cpu_scale
+    _scenario(scenario, script)(s)
+
+    import utime
+
+    saved_time = sys.modules.get("time")
+    saved_input = builtins.input
+    script_dir = os.path.dirname(os.path.abspath(script))
+    sys.path.insert(0, script_dir)
+
+    def sim_input(prompt=""):
+        if not s.inputs:
+            raise sim.StopSimulation()
+        answer = s.inputs.pop(0)
+        print(prompt + answer)
+        return answer
+
+    res = Result()
+    out = io.StringIO()
+    sys.modules["time"] = utime
+    # the driver binds `time` at import, load it fresh on the simulated clock
+    sys.modules.pop("ssd1306", None)
+    builtins.input = sim_input
+    start = _time.process_time()
+    try:
+        with contextlib.redirect_stdout(out) if quiet else contextlib.nullcontext():
+            if profile is not None:
+                profile.enable()
+            try:
+                runpy.run_path(script, run_name="__main__")
+            except sim.StopSimulation:
+                pass
+            except Exception as e:  # report, the numbers up to here still count
+                res.error = "%s: %s" % (type(e).__name__, e)
+            finally:
+                if profile is not None:
+                    profile.disable()
+    finally:
+        res.cpu_seconds = _time.process_time() - start
+        builtins.input = saved_input
+        sys.modules["time"] = saved_time
+        sys.path.remove(script_dir)
+        # modules next to the script (ir_rx, hcsr04, images) are per run
+        for name, mod in list(sys.modules.items()):
+            f = getattr(mod, "__file__", None) or ""
+            if os.path.dirname(f) in (script_dir, IR_LIB) or name == "ssd1306":
+                del sys.modules[name]
+    res.sim_seconds = s.clock.now / 1e6
+    res.output = out.getvalue()
+    return res
+
+
+def summary(res):
+    s = sim.get()
+    lines = [
+        "simulated: %.3f s, host cpu: %.3f s" % (res.sim_seconds, res.cpu_seconds),
+    ]
+    if res.error:
+        lines.append("stopped by error: " + res.error)
+    oled = s.i2c_devices.get(0x3C)
+    if oled is not None:
+        lines.append("display: %d transfers, %d data bytes, %d command bytes" % (
+            oled.transfers, oled.data_bytes, oled.cmd_bytes))
+    outs = [(st.id, st.writes) for st in s.pins.values() if st.writes]
+    if outs:
+        lines.append("pin writes: " + ", ".join("%s=%d" % o for o in sorted(outs, key=str)))
+    return "\n".join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run a MicroPython script on the simulator")
+    ap.add_argument("script")
+    ap.add_argument("--seconds", type=float, default=10.0, help="simulated time limit")
+    ap.add_argument("--scenario", help="name in scenarios.py or a file defining setup(sim)")
+    ap.add_argument("--cpu-scale", type=float, default=0,
+                    help="charge host CPU time times this factor to the simulated clock")
+    ap.add_argument("--quiet", action="store_true", help="hide the script's own output")
+    ap.add_argument("--profile", action="store_true", help="print the hottest functions")
+    ap.add_argument("--dump", help="write the final display frame to this PNG")
+    args = ap.parse_args()
+
+    prof = cProfile.Profile() if args.profile else None
+    res = run(args.script, args.seconds, args.scenario, args.cpu_scale, args.quiet, prof)
+    print(summary(res))
+    if args.dump:
+        oled = sim.get().i2c_devices.get(0x3C)
+        if oled is not None:
+            oled.ctrl.save_png(args.dump, scale=4)
+    if prof is not None:
+        pstats.Stats(prof).sort_stats("cumulative").print_stats(20)
+    return 1 if res.error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# Input scenarios for running the repo's scripts under the simulator.
+#
+# Each function receives the Simulation and registers the devices and
+# waveforms a script expects. run.py picks one from the script path or
+# --scenario NAME; a scenario can also be any file defining setup(sim).
+
+import math
+
+import irtrace
+from devices import SSD1306Device, MPU6050, HCSR04Echo
+
+
+def _oled(s):
+    return s.add_i2c(0x3C, SSD1306Device())
+
+
+def default(s):
+    _oled(s)
+
+
+def voltaje(s):
+    # 4graficandoVoltaje.py, OLED/oled_ex2.py: potentiometer on pin 4
+    _oled(s)
+    s.analog(4, lambda t: 1.65 + 1.5 * math.sin(t / 2e6))
+
+
+def sensor_luz(s):
+    # sensorLuz/cod.py: LDR on pin 4, DHT11 on pin 18, one menu option per
+    # 20 s round
+    _oled(s)
+    s.analog(4, lambda t: 1.2 + math.sin(t / 3e6))
+    s.add_dht(18, lambda t: 25 + 4 * math.sin(t / 5e6), lambda t: 50 + 30 * math.sin(t / 7e6))
+    s.inputs = ["1", "2", "3", "5"]
+
+
+def foco_ldr(s):
+    # focoLDR/codigo.py: LDR on pin 36 going through dusk and dawn
+    s.analog(36, lambda t: 1.65 + 1.6 * math.cos(t / 4e6))
+
+
+def ultrasonic(s):
+    # sensorUltrasonicoPIR/codigo.py: HC-SR04 trigger 2 / echo 15, PIR on 19
+    _oled(s)
+    HCSR04Echo(2, 15, lambda t: 150 + 140 * math.sin(t / 3e6))
+    for k in range(1, 10):
+        s.pulse(19, k * 9_000_000, 200_000)
+
+
+def pong(s):
+    # juego/codigo.py: MPU6050 tilt for player 1, joystick on pin 2
+    _oled(s)
+    s.add_i2c(0x68, MPU6050(ay=lambda t: 0.9 * math.sin(t / 7e5)))
+    s.analog(2, lambda t: 1.65 + 1.6 * math.cos(t / 1.1e6))
+    s.digital(18, [(0, 1)])
+
+
+def infrarojo(s):
+    # infrarojo/infra.py, carrito/main.py: NEC remote on pin 15, one key
+    # every 0.7 s with a repeat code after each (menu 2, zoom in and out,
+    # back; on the car forward, turns, back, stop)
+    _oled(s)
+    keys = (0x46, 0x18, 0x18, 0x08, 0x5A, 0x52, 0x0D, 0x1C, 0x47, 0x0D, 0x45)
+    s.digital(15, irtrace.waveform(irtrace.keys(keys)))
+
+
+# default scenario per script, by path relative to the repo root
+BY_SCRIPT = {
+    "4graficandoVoltaje.py": voltaje,
+    "OLED/oled_ex2.py": voltaje,
+    "sensorLuz/cod.py": sensor_luz,
+    "focoLDR/codigo.py": foco_ldr,
+    "sensorUltrasonicoPIR/codigo.py": ultrasonic,
+    "juego/codigo.py": pong,
+    "juego/codigoDocumentado.py": pong,
+    "infrarojo/infra.py": infrarojo,
+    "carrito/main.py": infrarojo,
+    "carrito/main2.py": infrarojo,
+}
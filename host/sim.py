@@ -0,0 +1,229 @@
+# Discrete-event simulation core behind the host machine/utime/dht modules.
+#
+# Simulated time only moves when a script sleeps, waits on a pulse or uses
+# a bus (transfers cost their wire time), so scripts with `while True`
+# loops run as fast as the host allows and stop at a time limit. Pin
+# interrupts, Timer callbacks and micropython.schedule() callbacks are
+# events on the same clock and run while time is being advanced.
+#
+# Inputs are waveforms: a step list [(t_us, value), ...], a callable
+# f(t_us) -> value, or a recording loaded with Waveform.from_csv().
+#
+#   import sim
+#   sim.digital(15, [(0, 1), (5_000, 0), (14_000, 1)])
+#   sim.analog(4, lambda t: 1.65 + 1.5 * math.sin(t / 1e6))
+#   sim.add_i2c(0x68, MPU6050(ay=lambda t: 0.5))
+
+import heapq
+import time as _time
+
+
+class StopSimulation(BaseException):
+    # BaseException so that `except Exception:` in a script cannot eat it
+    pass
+
+
+class Waveform:
+    def __init__(self, source, default=0):
+        self.default = default
+        if callable(source):
+            self.fn = source
+            self.steps = None
+        elif isinstance(source, (int, float)):
+            self.fn = None
+            self.steps = [(0, source)]
+        else:
+            self.fn = None
+            self.steps = sorted(source)
+
+    @classmethod
+    def from_csv(cls, path, scale_t=1):
+        # lines of "t_us,value"; `scale_t` converts other time units to us
+        steps = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] == "#":
+                    continue
+                t, v = line.split(",")[:2]
+                steps.append((int(float(t) * scale_t), float(v)))
+        return cls(steps)
+
+    def at(self, t):
+        if self.fn is not None:
+            return self.fn(t)
+        value = self.default
+        for ts, v in self.steps:
+            if ts > t:
+                break
+            value = v
+        return value
+
+    def edges(self):
+        # (t_us, value) transitions of a step waveform
+        if self.steps is None:
+            return []
+        out = []
+        last = None
+        for t, v in self.steps:
+            if v != last:
+                out.append((t, v))
+                last = v
+        return out
+
+
+def wave(source, default=0):
+    return source if isinstance(source, Waveform) else Waveform(source, default)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0  # microseconds
+        self.limit = None
+        self._events = []
+        self._seq = 0
+        # when set, host CPU time between simulator calls is charged to the
+        # simulated clock, multiplied by this factor (device slowdown)
+        self.cpu_scale = 0
+        self._cpu_mark = _time.perf_counter()
+
+    def schedule(self, t, fn, *args):
+        self._seq += 1
+        ev = [t, self._seq, fn, args, True]
+        heapq.heappush(self._events, ev)
+        return ev
+
+    @staticmethod
+    def cancel(ev):
+        ev[4] = False
+
+    def next_event(self):
+        while self._events and not self._events[0][4]:
+            heapq.heappop(self._events)
+        return self._events[0][0] if self._events else None
+
+    def charge_cpu(self):
+        mark = _time.perf_counter()
+        if self.cpu_scale:
+            self.advance(int((mark - self._cpu_mark) * 1e6 * self.cpu_scale), charge=False)
+        self._cpu_mark = _time.perf_counter()
+
+    def advance(self, us, charge=True):
+        if charge:
+            self.charge_cpu()
+        self.run_until(self.now + max(0, int(us)))
+
+    def run_until(self, t, done=None):
+        # process events up to time t, or until done() returns True; returns
+        # True if it stopped because of done()
+        while True:
+            if done is not None and done():
+                return True
+            nxt = self.next_event()
+            if nxt is None or nxt > t:
+                break
+            ev = heapq.heappop(self._events)
+            self._set_now(ev[0])
+            ev[2](*ev[3])
+        self._set_now(t)
+        return done is not None and done()
+
+    def _set_now(self, t):
+        if self.limit is not None and t > self.limit:
+            self.now = self.limit
+            raise StopSimulation()
+        if t > self.now:
+            self.now = t
+
+
+class PinState:
+    def __init__(self, pin_id):
+        self.id = pin_id
+        self.level = 0
+        self.mode = None
+        self.pull = None
+        self.handler = None
+        self.trigger = 0
+        self.writes = 0
+        self.history = []  # (t_us, level) of output writes, if recording
+        self.watchers = []  # fn(pin_state, level) called on output writes
+
+    def set_level(self, level, external=True):
+        level = 1 if level else 0
+        old = self.level
+        self.level = level
+        if external and old != level and self.handler is not None:
+            # IRQ_RISING = 1, IRQ_FALLING = 2, as on the ESP32 port
+            if self.trigger & (1 if level else 2):
+                self.handler(self.pin)
+
+
+class Simulation:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.clock = Clock()
+        self.pins = {}
+        self.analog_inputs = {}
+        self.i2c_devices = {}
+        self.dht_sensors = {}
+        self.record_outputs = False
+        self.inputs = []  # answers for input()
+
+    def pin(self, pin_id):
+        st = self.pins.get(pin_id)
+        if st is None:
+            st = self.pins[pin_id] = PinState(pin_id)
+            st.pin = None
+        return st
+
+    # scenario setup
+
+    def digital(self, pin_id, source):
+        # drive an input pin with a step waveform; each transition is an
+        # event that can fire the pin's IRQ handler
+        st = self.pin(pin_id)
+        for t, v in wave(source).edges():
+            if t <= self.clock.now:
+                st.level = 1 if v else 0
+            else:
+                self.clock.schedule(t, st.set_level, v)
+
+    def analog(self, pin_id, source):
+        # volts, 0 to 3.3
+        self.analog_inputs[pin_id] = wave(source)
+
+    def add_i2c(self, addr, device):
+        self.i2c_devices[addr] = device
+        return device
+
+    def add_dht(self, pin_id, temperature, humidity):
+        self.dht_sensors[pin_id] = (wave(temperature), wave(humidity))
+
+    def watch(self, pin_id, fn):
+        # fn(pin_state, level) on every write to an output pin
+        self.pin(pin_id).watchers.append(fn)
+
+    def pulse(self, pin_id, start, length, level=1):
+        # schedule a single pulse on an input pin
+        st = self.pin(pin_id)
+        self.clock.schedule(start, st.set_level, level)
+        self.clock.schedule(start + length, st.set_level, 1 - level)
+
+
+_sim = Simulation()
+
+
+def get():
+    return _sim
+
+
+def reset():
+    _sim.reset()
+    return _sim
+
+
+def __getattr__(name):
+    # sim.clock, sim.digital(...) etc. act on the current simulation
+    return getattr(_sim, name)
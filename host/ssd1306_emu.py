@@ -0,0 +1,268 @@
+# Host-side SSD1306 backend for benchmarking the driver in OLED/lib.
+#
+# SSD1306_Emulated is a drop-in replacement for SSD1306_I2C/SSD1306_SPI that
+# runs under CPython (with the framebuf stand-in in this directory). Every
+# command and data transfer is recorded, the bytes and transactions that
+# would go over the bus are counted and turned into a transfer time for the
+# configured bus clock, and the command stream is interpreted into a model
+# of the controller's display RAM, so a frame dump shows what the panel
+# would actually display after partial updates.
+#
+#   oled = SSD1306_Emulated(128, 64, bus="i2c", freq=400_000)
+#   ... draw, oled.show() ...
+#   print(oled.report())
+#   oled.save_png("frame.png", scale=4)
+
+import os
+import sys
+import zlib
+import struct
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "OLED", "lib"))
+
+from ssd1306 import SSD1306  # noqa: E402
+
+# number of argument bytes that follow each multi-byte command
+_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x81: 1, 0x8D: 1, 0xA8: 1, 0xD3: 1, 0xD5: 1,
+    0xD9: 1, 0xDA: 1, 0xDB: 1, 0xA3: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5,
+}
+
+
+class Bus:
+    # Transfer time model. I2C moves 9 clocks per byte (8 bits + ACK) with
+    # the address byte and START/STOP on top of every transaction; SPI moves
+    # 8 clocks per byte.
+    def __init__(self, kind="i2c", freq=400_000):
+        if kind not in ("i2c", "spi"):
+            raise ValueError("bus must be 'i2c' or 'spi'")
+        self.kind = kind
+        self.freq = freq
+
+    def clocks(self, nbytes):
+        if self.kind == "i2c":
+            return 9 * (nbytes + 1) + 2
+        return 8 * nbytes
+
+    def seconds(self, nbytes):
+        return self.clocks(nbytes) / self.freq
+
+
+class FrameStats:
+    def __init__(self):
+        self.transactions = 0
+        self.cmd_bytes = 0
+        self.data_bytes = 0
+        self.bus_bytes = 0
+        self.bus_time = 0.0
+
+    def add(self, other):
+        self.transactions += other.transactions
+        self.cmd_bytes += other.cmd_bytes
+        self.data_bytes += other.data_bytes
+        self.bus_bytes += other.bus_bytes
+        self.bus_time += other.bus_time
+
+
+class Controller:
+    # Model of the SSD1306 command interpreter and display RAM, shared by
+    # SSD1306_Emulated and the simulated I2C device in devices.py.
+    def __init__(self, width=128, height=64):
+        self.width = width
+        self.height = height
+        self.ram = bytearray(128 * 8)
+        self._pending = []
+        self._need = 0
+        self.col_start, self.col_end = 0, 127
+        self.page_start, self.page_end = 0, 7
+        self.col, self.page = 0, 0
+        self.start_line = 0
+        self.inverted = False
+        self.display_on = False
+        self.scrolling = False
+
+    def command(self, b):
+        if self._need:
+            self._pending.append(b)
+            self._need -= 1
+            if not self._need:
+                self._apply(self._pending)
+            return
+        if b in _ARGS:
+            self._pending = [b]
+            self._need = _ARGS[b]
+            return
+        self._apply([b])
+
+    def _apply(self, c):
+        op = c[0]
+        if op == 0x21:
+            self.col_start, self.col_end = c[1] & 0x7F, c[2] & 0x7F
+            self.col = self.col_start
+        elif op == 0x22:
+            self.page_start, self.page_end = c[1] & 7, c[2] & 7
+            self.page = self.page_start
+        elif 0x40 <= op <= 0x7F:
+            self.start_line = op & 0x3F
+        elif op in (0xA6, 0xA7):
+            self.inverted = op == 0xA7
+        elif op in (0xAE, 0xAF):
+            self.display_on = op == 0xAF
+        elif op == 0x2E:
+            self.scrolling = False
+        elif op == 0x2F:
+            self.scrolling = True
+
+    def data(self, b):
+        # horizontal addressing mode, as set up by init_display()
+        self.ram[self.page * 128 + self.col] = b
+        if self.col < self.col_end:
+            self.col += 1
+            return
+        self.col = self.col_start
+        self.page = self.page + 1 if self.page < self.page_end else self.page_start
+
+    def panel(self):
+        # rows of 0/1 as shown on the panel
+        off = 32 if self.width == 64 else 0
+        rows = []
+        for y in range(self.height):
+            r = (y + self.start_line) % 64
+            row = []
+            for x in range(self.width):
+                v = (self.ram[(r >> 3) * 128 + x + off] >> (r & 7)) & 1
+                row.append(v ^ self.inverted)
+            rows.append(row)
+        return rows
+
+    def save_pbm(self, path):
+        rows = self.panel()
+        out = bytearray()
+        for row in rows:
+            for i in range(0, self.width, 8):
+                b = 0
+                for j in range(8):
+                    if i + j < self.width and row[i + j]:
+                        b |= 0x80 >> j
+                out.append(b)
+        with open(path, "wb") as f:
+            f.write(b"P4\n%d %d\n" % (self.width, self.height))
+            f.write(out)
+
+    def save_png(self, path, scale=1):
+        rows = self.panel()
+        w = self.width * scale
+        raw = bytearray()
+        for row in rows:
+            line = bytearray((0,))
+            for v in row:
+                line += (b"\xff" if v else b"\x00") * scale
+            raw += line * scale
+        h = self.height * scale
+
+        def chunk(tag, data):
+            body = tag + data
+            return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 0, 0, 0, 0)))
+            f.write(chunk(b"IDAT", zlib.compress(bytes(raw), 9)))
+            f.write(chunk(b"IEND", b""))
+
+
+class SSD1306_Emulated(SSD1306):
+    def __init__(self, width=128, height=64, bus="i2c", freq=400_000, external_vcc=False,
+                 shadow=False, double_buffer=False, record=False):
+        self.bus = Bus(bus, freq)
+        self.record = record
+        self.log = []
+        self.frames = []
+        self.total = FrameStats()
+        self._frame = FrameStats()
+        self.ctrl = Controller(width, height)
+        super().__init__(width, height, external_vcc, shadow, double_buffer)
+        self.reset_stats()
+
+    # bus backend
+
+    def _transaction(self, payload, ncmd, ndata):
+        # payload includes the I2C control byte, it is not sent over SPI
+        n = payload if self.bus.kind == "i2c" else payload - 1
+        f = self._frame
+        f.transactions += 1
+        f.cmd_bytes += ncmd
+        f.data_bytes += ndata
+        f.bus_bytes += n
+        f.bus_time += self.bus.seconds(n)
+
+    def write_cmd(self, cmd):
+        self._transaction(2, 1, 0)
+        if self.record:
+            self.log.append(("cmd", bytes((cmd,))))
+        self.ctrl.command(cmd)
+
+    def write_cmds(self, cmds):
+        cmds = bytes(cmds)
+        self._transaction(1 + len(cmds), len(cmds), 0)
+        if self.record:
+            self.log.append(("cmd", cmds))
+        for cmd in cmds:
+            self.ctrl.command(cmd)
+
+    def write_data(self, buf):
+        buf = bytes(buf)
+        self._transaction(1 + len(buf), 0, len(buf))
+        if self.record:
+            self.log.append(("data", buf))
+        for b in buf:
+            self.ctrl.data(b)
+
+    def panel(self):
+        return self.ctrl.panel()
+
+    # statistics
+
+    def frame(self):
+        # close the current frame; show() and _sent() (the end of send() and
+        # send_async()) call this
+        self.frames.append(self._frame)
+        self.total.add(self._frame)
+        self._frame = FrameStats()
+
+    def show(self):
+        super().show()
+        self.frame()
+
+    def _sent(self, sent):
+        super()._sent(sent)
+        self.frame()
+
+    def reset_stats(self):
+        self.frames = []
+        self.total = FrameStats()
+        self._frame = FrameStats()
+        self.log = []
+        self.reset_counters()
+
+    def report(self):
+        n = len(self.frames) or 1
+        t = self.total
+        per = t.bus_time / n
+        lines = [
+            "bus: %s @ %d Hz" % (self.bus.kind, self.bus.freq),
+            "frames: %d" % len(self.frames),
+            "transactions/frame: %.1f" % (t.transactions / n),
+            "bytes/frame: %.1f (cmd %.1f, data %.1f)" % (t.bus_bytes / n, t.cmd_bytes / n, t.data_bytes / n),
+            "bus time/frame: %.3f ms" % (per * 1000),
+            "max fps (bus bound): %s" % ("%.1f" % (1 / per) if per else "inf"),
+        ]
+        return "\n".join(lines)
+
+    # frame dumps
+
+    def save_pbm(self, path):
+        self.ctrl.save_pbm(path)
+
+    def save_png(self, path, scale=1):
+        self.ctrl.save_png(path, scale)
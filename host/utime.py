@@ -0,0 +1,63 @@
+# Host stand-in for MicroPython's utime/time module on the simulated clock.
+#
+# run.py also installs it as `time` while a script runs; anything not
+# defined here (perf_counter, strftime, ...) falls through to CPython's
+# time module.
+
+import time as _time
+
+import sim
+
+_PERIOD = 1 << 30  # ticks wrap like on the device
+_MASK = _PERIOD - 1
+
+
+def _clock():
+    return sim.get().clock
+
+
+def ticks_us():
+    _clock().charge_cpu()
+    return _clock().now & _MASK
+
+
+def ticks_ms():
+    _clock().charge_cpu()
+    return (_clock().now // 1000) & _MASK
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & _MASK
+
+
+def ticks_diff(end, start):
+    d = (end - start) & _MASK
+    return d - _PERIOD if d >= _PERIOD >> 1 else d
+
+
+def sleep_us(us):
+    _clock().advance(us)
+
+
+def sleep_ms(ms):
+    _clock().advance(ms * 1000)
+
+
+def sleep(s):
+    _clock().advance(s * 1_000_000)
+
+
+def time():
+    return _clock().now // 1_000_000
+
+
+def time_ns():
+    return _clock().now * 1000
+
+
+def __getattr__(name):
+    return getattr(_time, name)
@@ -0,0 +1,88 @@
+# ir_record.py
+# Grabación de ráfagas IR crudas para reproducirlas en el host
+# (host/ir_replay.py, formato en host/irtrace.py)
+#
+#   ir_sensor = NEC_16(Pin(15, Pin.IN))
+#   rec = IRRecorder(ir_sensor, "ir_trace.bin")
+#   while True:
+#       for data, addr, ctrl, t in ir_sensor.events():
+#           ...
+#       rec.flush()
+#       time.sleep_ms(20)
+#
+# The recorder wraps the receiver's decode: before each burst is decoded
+# its edge times are copied into a preallocated ring, so the Timer callback
+# (or burst_capture()) does no file I/O and allocates nothing. flush()
+# writes the copied bursts from the main loop; bursts that arrive while the
+# ring is full are decoded as usual but counted in `dropped`. remove()
+# restores the receiver.
+
+import struct
+from array import array
+from micropython import const
+
+MAGIC = b"IRT\x01"
+_TMASK = const(0x3FFFFFFF)
+
+
+class IRRecorder:
+    def __init__(self, ir, path="ir_trace.bin", slots=4):
+        self.ir = ir
+        self.path = path
+        self.slots = slots
+        self.recorded = 0
+        self.dropped = 0
+        # per slot: edge count, then the edge times
+        self._n = len(ir._times)
+        self._buf = array("i", (0 for _ in range((self._n + 1) * slots)))
+        self._head = 0
+        self._tail = 0
+        self._w = array("H", (0 for _ in range(self._n)))
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+        self._decode = ir.decode
+        ir.decode = self._record
+        ir.cb = self._record
+
+    def _record(self, arg):
+        ir = self.ir
+        head = self._head
+        nxt = (head + 1) % self.slots
+        if nxt == self._tail:
+            self.dropped += 1
+        else:
+            n = min(ir.edge, self._n)
+            buf = self._buf
+            times = ir._times
+            base = head * (self._n + 1)
+            buf[base] = n
+            for i in range(n):
+                buf[base + 1 + i] = times[i]
+            self._head = nxt
+        self._decode(arg)
+
+    def flush(self):
+        # from the main loop; returns the number of bursts written
+        if self._tail == self._head:
+            return 0
+        count = 0
+        buf = self._buf
+        w = self._w
+        with open(self.path, "ab") as f:
+            while self._tail != self._head:
+                base = self._tail * (self._n + 1)
+                n = buf[base]
+                if n:
+                    for i in range(n - 1):
+                        w[i] = min((buf[base + 2 + i] - buf[base + 1 + i]) & _TMASK, 0xFFFF)
+                    f.write(struct.pack("<HI", n, buf[base + 1] & _TMASK))
+                    f.write(memoryview(w)[:n - 1])
+                    count += 1
+                self._tail = (self._tail + 1) % self.slots
+        self.recorded += count
+        return count
+
+    def remove(self):
+        self.flush()
+        del self.ir.decode
+        self.ir.cb = self.ir.decode
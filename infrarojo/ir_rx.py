@@ -1,10 +1,28 @@
 # ir_rx.py
-# Librería unificada con IR_RX base, NEC y función print_error
+# Librería unificada con IR_RX base, decodificadores NEC, RC5, RC6, Sony y
+# detección automática, y función print_error
 # Autor original: Peter Hinch (MIT license)
 
-from machine import Timer, Pin
+from machine import Timer, Pin, time_pulse_us
 from array import array
-from utime import ticks_us, ticks_diff
+from utime import ticks_us
+from micropython import const
+import micropython
+
+# Decoded bursts are queued as (cmd, addr, ext, ticks_us of the first edge)
+# in a preallocated ring instead of running user code in the Timer
+# callback. With callback=None the main program takes them with events()
+# or await next_event(); with a callback it is called from a scheduled
+# task after the decode has returned. Either way a slow consumer (show(),
+# print) never delays the capture of the next burst. When the ring is full
+# new events are dropped and counted in `dropped`.
+_QUEUE = const(8)  # power of 2
+
+# Widths are differences of ticks_us values, which wrap at 2**30 on every
+# port: ((b - a + _THALF) & _TMASK) - _THALF is ticks_diff(b, a) without
+# the call, negative when jitter swapped two edges.
+_TMASK = const(0x3FFFFFFF)
+_THALF = const(0x20000000)
 
 # -------------------------------
 # Clase base IR_RX (antes __init__.py)
@@ -20,7 +38,7 @@ class IR_RX:
     BADDATA = -6
     BADADDR = -7
 
-    def __init__(self, pin, nedges, tblock, callback, *args):  # Optional args for callback
+    def __init__(self, pin, nedges, tblock, callback=None, *args):  # Optional args for callback
         self._pin = pin
         self._nedges = nedges
         self._tblock = tblock
@@ -28,6 +46,17 @@ class IR_RX:
         self.args = args
         self._errf = lambda _: None
         self.verbose = False
+        # event ring, 5 ints per event (cmd, addr, ext, ticks and the
+        # callback threshold); written only by do_callback (head)
+        # and read only by the consumer (tail)
+        self._ev = array("i", (0 for _ in range(5 * _QUEUE)))
+        self._head = 0
+        self._tail = 0
+        self._thresh = 0  # of the event last taken by _pop()
+        self.dropped = 0
+        self._pending = False
+        self._dispatch_ref = self._dispatch  # bound once, schedule() allocates nothing
+        self._flag = None
 
         self._times = array("i", (0 for _ in range(nedges + 1)))  # +1 for overrun
         pin.irq(handler=self._cb_pin, trigger=(Pin.IRQ_FALLING | Pin.IRQ_RISING))
@@ -46,11 +75,152 @@ class IR_RX:
             self.edge += 1
 
     def do_callback(self, cmd, addr, ext, thresh=0):
+        # queue the result and return; runs in the Timer callback
+        t = self._times[0]
         self.edge = 0
-        if cmd >= thresh:
-            self.callback(cmd, addr, ext, *self.args)
+        head = self._head
+        nxt = (head + 1) & (_QUEUE - 1)
+        if nxt == self._tail:
+            self.dropped += 1
+            return
+        i = head * 5
+        ev = self._ev
+        ev[i] = cmd
+        ev[i + 1] = addr
+        ev[i + 2] = ext
+        ev[i + 3] = t
+        ev[i + 4] = thresh
+        self._head = nxt
+        if self._flag is not None:
+            self._flag.set()
+        if self.callback is not None and not self._pending:
+            try:
+                micropython.schedule(self._dispatch_ref, None)
+                self._pending = True
+            except RuntimeError:
+                pass  # scheduler queue full, dispatched with the next event
+
+    def _pop(self):
+        tail = self._tail
+        if tail == self._head:
+            return None
+        i = tail * 5
+        ev = self._ev
+        e = (ev[i], ev[i + 1], ev[i + 2], ev[i + 3])
+        self._thresh = ev[i + 4]
+        self._tail = (tail + 1) & (_QUEUE - 1)
+        return e
+
+    def _dispatch(self, _):
+        # scheduled by do_callback: the user callback, outside the Timer
+        self._pending = False
+        while True:
+            e = self._pop()
+            if e is None:
+                return
+            if e[0] >= self._thresh:
+                self.callback(e[0], e[1], e[2], *self.args)
+            else:
+                self._errf(e[0])
+
+    def events(self):
+        # queued (cmd, addr, ext, ticks) in arrival order, without waiting;
+        # cmd < 0 is REPEAT or an error code
+        while True:
+            e = self._pop()
+            if e is None:
+                return
+            yield e
+
+    async def next_event(self, poll_ms=10):
+        # wait for the next event in an asyncio task
+        try:
+            import uasyncio as asyncio
+        except ImportError:
+            import asyncio
+        while True:
+            e = self._pop()
+            if e is not None:
+                return e
+            if hasattr(asyncio, "ThreadSafeFlag"):
+                if self._flag is None:
+                    self._flag = asyncio.ThreadSafeFlag()
+                await self._flag.wait()
+            elif hasattr(asyncio, "sleep_ms"):
+                await asyncio.sleep_ms(poll_ms)
+            else:  # CPython's asyncio, on the host
+                await asyncio.sleep(poll_ms / 1000)
+
+    def _result(self, r):
+        # queue a decoder's status: 0 with (cmd, addr, ext) in self._res, or
+        # a negative error code
+        if r == 0:
+            res = self._res
+            self.do_callback(res[0], res[1], res[2])
         else:
-            self._errf(cmd)
+            self.do_callback(r, 0, 0)
+
+    # -------------------------------
+    # Captura de ráfaga completa
+    # -------------------------------
+    # burst_capture() replaces the interrupt per edge with one per burst:
+    # the first falling edge disables the pin IRQ and its handler, a soft
+    # IRQ that runs scheduled and so may block, times the rest of the
+    # burst with machine.time_pulse_us, a C loop on the pin, until the line
+    # has been idle for `gap` us. Other IRQs (PIR, Timer) no longer delay
+    # the stamp of single edges, at the cost of holding the main program
+    # while the burst lasts (~70 ms for NEC). gap must exceed the longest
+    # level after the leader mark (4.5 ms NEC space) and stay under the
+    # pause between frames (~6 ms after a 20 bit Sony frame). The first
+    # mark has to outlast the scheduling latency, which the NEC, Sony and
+    # RC6 leaders do; for RC5 keep the edge interrupts.
+    #
+    # A hardware capture (an RMT receive channel on a port that has one:
+    # stock esp32.RMT only transmits) hands its mark/space durations to
+    # feed(). Both end in the same decode().
+    def burst_capture(self, gap=5500):
+        self._gap = gap
+        self._pin.irq(handler=self._grab, trigger=Pin.IRQ_FALLING)
+
+    def _grab(self, line):
+        t = ticks_us()
+        pin = self._pin
+        pin.irq(handler=None)
+        times = self._times
+        times[0] = t
+        if pin.value():  # first mark over before we got here
+            self.do_callback(self.BADSTART, 0, 0)
+        else:
+            gap = self._gap
+            n = self._nedges
+            e = 1
+            level = 0
+            # time_pulse_us returns when the level ends; past n edges the
+            # burst is only drained and edge n + 1 records the overrun.
+            # The leader mark (9 ms NEC) may be longer than gap.
+            timeout = 20000
+            while time_pulse_us(pin, level, timeout) >= 0:
+                if e <= n:
+                    times[e] = ticks_us()
+                e += 1
+                level ^= 1
+                timeout = gap
+            self.edge = min(e, n + 1)
+            self.decode(None)
+        pin.irq(handler=self._grab, trigger=Pin.IRQ_FALLING)
+
+    def feed(self, durs, n=-1, t0=None):
+        # a burst as mark/space durations in us, first one a mark
+        if n < 0:
+            n = len(durs)
+        times = self._times
+        t = ticks_us() if t0 is None else t0
+        times[0] = t
+        for i in range(min(n, self._nedges)):
+            t = (t + durs[i]) & _TMASK
+            times[i + 1] = t
+        self.edge = min(n + 1, self._nedges + 1)
+        self.decode(None)
 
     def error_function(self, func):
         self._errf = func
@@ -80,61 +250,337 @@ def print_error(data):
 # -------------------------------
 # nec.py
 # -------------------------------
+# NEC timing limits in us: a 1 bit has a 1.6875 ms space, a 0 a 562.5 us
+# one; the space after the leader mark is 4.5 ms for data, 2.25 ms for a
+# repeat code.
+_NEC_ONE = const(1120)
+_NEC_DATA = const(3000)
+_NEC_REPEAT = const(1700)
+
+
+@micropython.native
+def _nec(times, edges, leader, out):
+    # One pass over the edge times of a burst. Returns 0 and the four
+    # frame bytes in out, or a negative IR_RX code; nothing is allocated
+    # and no exception is raised.
+    if edges > 68:
+        return -5  # OVERRUN
+    if ((times[1] - times[0] + _THALF) & _TMASK) - _THALF < leader:
+        return -2  # BADSTART
+    w = ((times[2] - times[1] + _THALF) & _TMASK) - _THALF
+    if w > _NEC_DATA:
+        if edges < 68:
+            return -3  # BADBLOCK
+        # spaces only, marks are always 562.5 us; bits are LSB first
+        e = 3
+        for b in range(4):
+            v = 0
+            m = 1
+            for _ in range(8):
+                if ((times[e + 1] - times[e] + _THALF) & _TMASK) - _THALF > _NEC_ONE:
+                    v |= m
+                m <<= 1
+                e += 2
+            out[b] = v
+        return 0
+    if w > _NEC_REPEAT:
+        # a repeat code has exactly 4 edges
+        return -1 if edges == 4 else -4  # REPEAT or BADREP
+    return -2  # BADSTART
+
+
 class NEC_ABC(IR_RX):
-    def __init__(self, pin, extended, samsung, callback, *args):
+    def __init__(self, pin, extended, samsung, callback=None, *args):
         # Block lasts <= 80ms (extended mode) and has 68 edges
         super().__init__(pin, 68, 80, callback, *args)
         self._extended = extended
         self._addr = 0
         self._leader = 2500 if samsung else 4000  # 4.5ms for Samsung else 9ms
+        self._bytes = bytearray(4)
 
     def decode(self, _):
-        try:
-            if self.edge > 68:
-                raise RuntimeError(self.OVERRUN)
-            width = ticks_diff(self._times[1], self._times[0])
-            if width < self._leader:  # 9ms leading mark for all valid data
-                raise RuntimeError(self.BADSTART)
-            width = ticks_diff(self._times[2], self._times[1])
-            if width > 3000:  # 4.5ms space for normal data
-                if self.edge < 68:  # Haven't received the correct number of edges
-                    raise RuntimeError(self.BADBLOCK)
-                # Time spaces only (marks are always 562.5µs)
-                # Space is 1.6875ms (1) or 562.5µs (0)
-                # Skip last bit which is always 1
-                val = 0
-                for edge in range(3, 68 - 2, 2):
-                    val >>= 1
-                    if ticks_diff(self._times[edge + 1], self._times[edge]) > 1120:
-                        val |= 0x80000000
-            elif width > 1700:  # 2.5ms space for a repeat code. Should have exactly 4 edges.
-                raise RuntimeError(self.REPEAT if self.edge == 4 else self.BADREP)
+        cmd = _nec(self._times, self.edge, self._leader, self._bytes)
+        if cmd == 0:
+            b = self._bytes
+            addr = b[0]  # 8 bit addr
+            cmd = b[2]
+            if cmd != b[3] ^ 0xff:
+                cmd = self.BADDATA
+                addr = 0
+            elif addr != b[1] ^ 0xff:  # 8 bit addr doesn't match check
+                if self._extended:
+                    addr |= b[1] << 8  # pass assumed 16 bit address to callback
+                    self._addr = addr
+                else:
+                    cmd = self.BADADDR
+                    addr = 0
             else:
-                raise RuntimeError(self.BADSTART)
-            addr = val & 0xff  # 8 bit addr
-            cmd = (val >> 16) & 0xff
-            if cmd != (val >> 24) ^ 0xff:
-                raise RuntimeError(self.BADDATA)
-            if addr != ((val >> 8) ^ 0xff) & 0xff:  # 8 bit addr doesn't match check
-                if not self._extended:
-                    raise RuntimeError(self.BADADDR)
-                addr |= val & 0xff00  # pass assumed 16 bit address to callback
-            self._addr = addr
-        except RuntimeError as e:
-            cmd = e.args[0]
+                self._addr = addr
+        else:
             addr = self._addr if cmd == self.REPEAT else 0  # REPEAT uses last address
-        # Set up for new data burst and run user callback
+        # Set up for new data burst and queue the result
         self.do_callback(cmd, addr, 0, self.REPEAT)
 
 class NEC_8(NEC_ABC):
-    def __init__(self, pin, callback, *args):
+    def __init__(self, pin, callback=None, *args):
         super().__init__(pin, False, False, callback, *args)
 
 class NEC_16(NEC_ABC):
-    def __init__(self, pin, callback, *args):
+    def __init__(self, pin, callback=None, *args):
         super().__init__(pin, True, False, callback, *args)
 
 class SAMSUNG(NEC_ABC):
-    def __init__(self, pin, callback, *args):
+    def __init__(self, pin, callback=None, *args):
         super().__init__(pin, True, True, callback, *args)
 
+
+# -------------------------------
+# philips.py (RC5, RC6 modo 0)
+# -------------------------------
+# Both are Manchester coded. The intervals between edges are expanded into
+# a level per half-bit unit (889 us for RC5, 444 us for RC6) and the bits
+# are read from the unit pairs, which also covers the double-length RC6
+# trailer bit without special cases.
+
+@micropython.native
+def _units(times, edges, start, unit, level, buf, n):
+    # levels from edge `start` on into buf[n:], the rest of buf is idle (0);
+    # returns the end index or -1 for a width that is not 1-4 units
+    size = len(buf)
+    half = unit >> 1
+    for e in range(start, edges - 1):
+        w = ((times[e + 1] - times[e] + _THALF) & _TMASK) - _THALF
+        k = (w + half) // unit
+        if k < 1 or k > 4 or n + k > size:
+            return -1
+        for _ in range(k):
+            buf[n] = level
+            n += 1
+        level ^= 1
+    end = n
+    while n < size:
+        buf[n] = 0
+        n += 1
+    return end
+
+
+@micropython.native
+def _rc5(times, edges, buf, out):
+    # 14 bits S1 S2 T A4..A0 C5..C0, 1 = off then on; the capture starts
+    # at the mark in the middle of S1, so its first half is the idle level
+    if edges > 28:
+        return -5  # OVERRUN
+    if edges < 14:
+        return -2  # BADSTART
+    buf[0] = 0
+    if _units(times, edges, 0, 889, 1, buf, 1) < 0:
+        return -3  # BADBLOCK
+    v = 0
+    for u in range(0, 28, 2):
+        if buf[u] == buf[u + 1]:
+            return -3  # BADBLOCK
+        v = (v << 1) | buf[u + 1]
+    # S2 is the inverted 7th command bit (RC5X)
+    out[0] = (v & 0x3F) | (0 if (v >> 12) & 1 else 0x40)
+    out[1] = (v >> 6) & 0x1F
+    out[2] = (v >> 11) & 1
+    return 0
+
+
+@micropython.native
+def _rc6(times, edges, buf, out):
+    # leader 2666 us on, 889 us off, then in 444 us units: start bit (1),
+    # 3 mode bits, the trailer (toggle) bit of 2 + 2 units and 16 data
+    # bits; 1 = on then off
+    if edges > 46:
+        return -5  # OVERRUN
+    if edges < 12:
+        return -2  # BADSTART
+    w = ((times[1] - times[0] + _THALF) & _TMASK) - _THALF
+    if not 2000 < w < 3300:
+        return -2  # BADSTART
+    w = ((times[2] - times[1] + _THALF) & _TMASK) - _THALF
+    if not 600 < w < 1200:
+        return -2  # BADSTART
+    if _units(times, edges, 2, 444, 1, buf, 0) < 0:
+        return -3  # BADBLOCK
+    if buf[0] != 1 or buf[1] != 0:
+        return -2  # BADSTART
+    for u in range(2, 8, 2):
+        if buf[u] != 0 or buf[u + 1] != 1:
+            return -6  # BADDATA, only mode 0 is decoded
+    if buf[8] != buf[9] or buf[10] != buf[11] or buf[8] == buf[10]:
+        return -3  # BADBLOCK
+    v = 0
+    for u in range(12, 44, 2):
+        if buf[u] == buf[u + 1]:
+            return -3  # BADBLOCK
+        v = (v << 1) | buf[u]
+    out[0] = v & 0xFF
+    out[1] = v >> 8
+    out[2] = buf[8]
+    return 0
+
+
+class RC5(IR_RX):
+    def __init__(self, pin, callback=None, *args):
+        # Block lasts <= 25ms and has <= 28 edges
+        super().__init__(pin, 28, 30, callback, *args)
+        self._buf = bytearray(28)
+        self._res = array("i", (0, 0, 0))
+
+    def decode(self, _):
+        self._result(_rc5(self._times, self.edge, self._buf, self._res))
+
+
+class RC6_M0(IR_RX):
+    def __init__(self, pin, callback=None, *args):
+        # Block lasts 23ms nominal and has <= 46 edges
+        super().__init__(pin, 46, 30, callback, *args)
+        self._buf = bytearray(44)
+        self._res = array("i", (0, 0, 0))
+
+    def decode(self, _):
+        self._result(_rc6(self._times, self.edge, self._buf, self._res))
+
+
+# -------------------------------
+# sony.py (SIRC 12, 15 y 20 bits)
+# -------------------------------
+@micropython.native
+def _sony(times, edges, bits, out):
+    # 2.4 ms leader mark, then per bit a 600 us space and a 1200 us (1) or
+    # 600 us (0) mark, LSB first: 7 command bits, then 5 address bits (12),
+    # 8 address bits (15) or 5 address and 8 extended bits (20).
+    # bits = 0 accepts any of the three lengths.
+    if edges > 42:
+        return -5  # OVERRUN
+    n = (edges - 2) >> 1
+    if n != bits and (bits or (n != 12 and n != 15 and n != 20)):
+        return -3  # BADBLOCK
+    w = ((times[1] - times[0] + _THALF) & _TMASK) - _THALF
+    if not 1800 < w < 3000:
+        return -2  # BADSTART
+    v = 0
+    m = 1
+    e = 2
+    for _ in range(n):
+        if ((times[e + 1] - times[e] + _THALF) & _TMASK) - _THALF > 900:
+            v |= m
+        m <<= 1
+        e += 2
+    out[0] = v & 0x7F
+    if n == 20:
+        out[1] = (v >> 7) & 0x1F
+        out[2] = v >> 12
+    else:
+        out[1] = v >> 7
+        out[2] = 0
+    return 0
+
+
+class SONY_ABC(IR_RX):
+    def __init__(self, pin, bits, callback=None, *args):
+        # Block lasts <= 3 + 1.8 * bits ms and has 2 + 2 * bits edges;
+        # frames repeat every 45ms while a key is held
+        super().__init__(pin, 2 + 2 * bits, 6 + bits * 9 // 5, callback, *args)
+        self._bits = bits
+        self._res = array("i", (0, 0, 0))
+
+    def decode(self, _):
+        self._result(_sony(self._times, self.edge, self._bits, self._res))
+
+class SONY_12(SONY_ABC):
+    def __init__(self, pin, callback=None, *args):
+        super().__init__(pin, 12, callback, *args)
+
+class SONY_15(SONY_ABC):
+    def __init__(self, pin, callback=None, *args):
+        super().__init__(pin, 15, callback, *args)
+
+class SONY_20(SONY_ABC):
+    def __init__(self, pin, callback=None, *args):
+        super().__init__(pin, 20, callback, *args)
+
+
+# -------------------------------
+# auto.py
+# -------------------------------
+# One receiver for mixed remotes. The burst is captured into a single
+# _times buffer sized for NEC; once three edges are in, the leader mark and
+# the space after it pick the protocol and the block timer is shortened to
+# that protocol's length. decode() then runs the matching decoder. The
+# protocol is returned in ext >> 8 (ext & 0xFF is the decoder's own ext,
+# e.g. the RC5/RC6 toggle bit).
+P_NEC = const(1)
+P_SAMSUNG = const(2)
+P_SONY = const(3)
+P_RC5 = const(4)
+P_RC6 = const(5)
+
+
+class IR_AUTO(NEC_ABC):
+    def __init__(self, pin, callback=None, *args):
+        super().__init__(pin, True, False, callback, *args)
+        self._buf = bytearray(44)
+        self._res = array("i", (0, 0, 0))
+        self._proto = 0
+
+    def _cb_pin(self, line):
+        t = ticks_us()
+        if self.edge <= self._nedges:
+            if not self.edge:
+                self.tim.init(period=self._tblock, mode=Timer.ONE_SHOT, callback=self.cb)
+            self._times[self.edge] = t
+            self.edge += 1
+            if self.edge == 3:
+                block = self._classify()
+                if block:
+                    self.tim.init(period=block, mode=Timer.ONE_SHOT, callback=self.cb)
+
+    def _classify(self):
+        # protocol from the first mark and space; returns the rest of its
+        # block in ms, counted from the first edge, or 0 if the 80 ms NEC
+        # block already fits
+        times = self._times
+        mark = ((times[1] - times[0] + _THALF) & _TMASK) - _THALF
+        space = ((times[2] - times[1] + _THALF) & _TMASK) - _THALF
+        if mark > 7000:
+            self._proto = P_NEC
+            self._leader = 4000
+            return 0
+        if mark > 3500:
+            self._proto = P_SAMSUNG
+            self._leader = 2500
+            return 0
+        block = 30
+        # RC5 starts with one or two half bits on (889/1778 us), RC6 and
+        # Sony with a 2666/2400 us leader and an 889/600 us space
+        if mark > 2100:
+            if space > 700:
+                self._proto = P_RC6
+            else:
+                self._proto = P_SONY
+                block = 42  # up to 20 bits
+        else:
+            self._proto = P_RC5
+        return block - (mark + space) // 1000
+
+    def decode(self, _):
+        if not self._proto and self.edge >= 3:
+            self._classify()  # burst_capture() or feed(), no _cb_pin
+        p = self._proto
+        if p == P_NEC or p == P_SAMSUNG:
+            NEC_ABC.decode(self, _)
+        elif p == P_SONY:
+            self._result(_sony(self._times, self.edge, 0, self._res))
+        elif p == P_RC5:
+            self._result(_rc5(self._times, self.edge, self._buf, self._res))
+        elif p == P_RC6:
+            self._result(_rc6(self._times, self.edge, self._buf, self._res))
+        else:
+            self.do_callback(self.BADSTART, 0, 0)
+        self._proto = 0
+
+    def do_callback(self, cmd, addr, ext, thresh=0):
+        super().do_callback(cmd, addr, ext | (self._proto << 8), thresh)
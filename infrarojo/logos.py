@@ -0,0 +1,72 @@
+# Generated by host/img2py.py, do not edit.
+# 128x64 MONO_VLSB images; full-screen ones go to the display with oled.load(NAME).
+
+# from infrarojo/infra.py:LOGO (the former list of ints)
+LOGO = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xfe\xfe\xfe\xfe\xfe\xfe"
+    b"\xee\xce\x9e\xee\x8e\xfe\xee\xfe\xfe\xfe\xfe\xfe\xbe\xfe\xfe\xfe"
+    b"\xfe\xbe\xae\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe"
+    b"\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\xfe\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff"
+    b"\xff\xff\xff\xff\x7f\x7f\x7f\x7f\x7f\x7b\x7b\x63\x7f\x7f\xff\xff"
+    b"\xf3\xe7\xf3\xff\xf7\xef\xff\xff\xff\xf7\xff\xef\xef\xf7\xfb\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\x9f\xcf\xe7\xf3\xfb\xf9"
+    b"\xfd\xfc\xfe\xf2\xfe\xfe\xff\xff\xff\xff\xff\xef\xe6\xfe\xfe\xfe"
+    b"\xfc\xfd\xf9\x7b\x33\xa7\x4f\x9f\x3f\x7f\xff\xfb\xfc\xf8\xff\xff"
+    b"\xfb\xff\xff\xff\xff\xfb\xfb\xfc\xfc\xf9\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\xc0\xf0\xfc\xff\xff\xff\xfb\xff\xff\xff"
+    b"\xff\xff\xff\xff\x0f\x03\x07\x03\x03\x01\x01\x01\x00\x00\x00\x01"
+    b"\x1f\x3f\x3f\xff\xef\xff\xfe\xff\xbc\xb0\xf1\xc3\x1f\xff\xff\xff"
+    b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x80\x80\x80\x00\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff"
+    b"\x06\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\xf7\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x81\x03"
+    b"\x07\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x03\x13\x09\x03\x08\x33\xcf\x3f\x7f\xff\xff\xff\xff\xff\xff"
+    b"\x20\x80\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x80\x80"
+    b"\xc0\xc0\xc0\x80\x00\xc0\xc0\xe1\xff\x3f\xcf\x63\x1c\x03\x81\x23"
+    b"\x87\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x01\x00\x00\x04\x23\x46\x7d\xfb\xf7\x27\x6f\x5f"
+    b"\xdf\xbf\xbf\x3f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x3f\xbf"
+    b"\xbf\x9f\x5f\x6f\x66\xb6\x3b\x0d\x06\x43\x80\xc0\xe4\xf3\xdc\xfe"
+    b"\xff\xdf\xdf\xff\xff\xdf\xff\xff\xdf\xff\xdf\xdf\xff\xff\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x7e\x7d\x7c\x7b\x78\x74"
+    b"\x70\x72\x68\x69\x61\x61\x61\x71\x63\x73\x71\x71\x69\x60\x68\x68"
+    b"\x78\x74\x77\x7a\x7a\x7d\x7d\x7e\x7e\x7f\x7f\x7d\x7f\x7f\x7d\x7f"
+    b"\x7f\x7f\x7d\x7d\x7f\x7f\x7d\x7f\x7f\x7f\x7f\x7f\x7f\x7f\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
+LOGO_W = 128
+LOGO_H = 64
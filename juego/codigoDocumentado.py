@@ -40,7 +40,8 @@ Interfaz OLED con indicadores de estado ("P1 POWER!", "P2 POWER!").
 
 from machine import Pin, I2C, ADC
 import time
-from ssd1306 import SSD1306_I2C
+from ssd1306 import SSD1306_I2C, FramePacer, BusStats
+from font import Font
 
 # --- Mini driver MPU6050 ---
 class MPU6050Mini:
@@ -97,6 +98,10 @@ button_p2 = Pin(18, Pin.IN, Pin.PULL_UP)    # Activo en LOW
 # --- Constantes del juego ---
 WIDTH = 128
 HEIGHT = 64
+# marcador al doble de tamaño: digitos pre-dibujados, sin str() por cuadro
+MARCADOR = Font(2, "0123456789 ")
+# True: mide el tiempo de bus de la pantalla e imprime un resumen cada 100 cuadros
+MEDIR_BUS = False
 
 
 class Pong:
@@ -221,14 +226,14 @@ class Pong:
         """
         o = self.oled
         o.fill(0)
+        # Marcador (antes que paddles y pelota, que quedan encima)
+        MARCADOR.number(o, self.score1, 24, 0, 2)
+        MARCADOR.number(o, self.score2, 84, 0, 2)
         # Paddles
         o.fill_rect(0, self.p1_y, self.paddle_w, self.paddle1_h, 1)
         o.fill_rect(WIDTH - self.paddle_w, self.p2_y, self.paddle_w, self.paddle2_h, 1)
         # Pelota
         o.pixel(self.ball_x, self.ball_y, 1)
-        # Marcador
-        o.text(str(self.score1), 30, 0)
-        o.text(str(self.score2), 90, 0)
         # Power-Up activo
         if self.paddle1_powered:
             o.text("P1 POWER!", 5, 56)
@@ -239,12 +244,18 @@ class Pong:
     def loop(self):
         """
         Bucle principal del juego.
+        El pacer mantiene 25 cuadros por segundo descontando el tiempo
+        de dibujo y de envío a la pantalla.
         """
+        pacer = FramePacer(25)
+        stats = BusStats(self.oled) if MEDIR_BUS else None
         while True:
             self.update_paddles()
             self.update_ball()
             self.draw()
-            time.sleep_ms(40)
+            if stats and stats.frames % 100 == 0:
+                stats.report()
+            pacer.wait()
 
 
 # --- Pantalla de inicio ---
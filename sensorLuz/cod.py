@@ -14,7 +14,7 @@ import utime
 from time import sleep
 import dht
 import time
-import framebuf
+from stripchart import StripChart, MultiChart
 
 
 
@@ -28,162 +28,47 @@ oled_ancho = 128
 oled_alto = 64
 oled = ssd1306.SSD1306_I2C(oled_ancho,oled_alto, i2c)
 
-LOGO = [
-0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0x25, 0xff, 0xdf, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0x97, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xd7, 0xf7, 0x9f, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0x8f, 0x5f, 0xfd, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xef, 0x17, 0xbb, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xef, 0xbb, 0xe7, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xf0, 0x03, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0x83, 0xf0, 0x7f, 0xf3, 0xfe, 0x7c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7e, 0x3f, 0xff, 0x1f, 0xf3, 0xfe, 0x3c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x78, 0xef, 0xff, 0xc7, 0xeb, 0x79, 0xbc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x73, 0xef, 0xf7, 0xf3, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x67, 0xff, 0xe7, 0xf9, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x4f, 0xff, 0xff, 0xfc, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x1f, 0xff, 0xff, 0xf2, 0x7f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x3f, 0xff, 0xff, 0xe5, 0x3f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xf1, 0xfd, 0x3f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0x80, 0xff, 0x1f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0xf7, 0xfa, 0x00, 0xff, 0x8f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0xff, 0xf8, 0x00, 0xff, 0x8f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x01, 0xff, 0xf0, 0x00, 0xf7, 0xef, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x01, 0xff, 0xf0, 0x00, 0x7f, 0xe7, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0xf0, 0x00, 0x1f, 0x37, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0xf0, 0x00, 0x1f, 0xf7, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xfb, 0x00, 0x00, 0x1f, 0xf3, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0xc0, 0x00, 0x1f, 0xf1, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0x80, 0x00, 0x1f, 0xf0, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0x00, 0x00, 0x0f, 0xf0, 0x7f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0x00, 0x00, 0x1f, 0xf0, 0x7f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0x00, 0x00, 0x1f, 0xf0, 0x3f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x03, 0xff, 0x00, 0x00, 0x1f, 0xf0, 0x3f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x3b, 0xff, 0x00, 0x00, 0x1f, 0xf2, 0x3f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x7b, 0xff, 0x00, 0x00, 0x01, 0xf7, 0xbf, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x6b, 0xff, 0x00, 0x00, 0x00, 0xf5, 0xbf, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x01, 0xff, 0x00, 0x00, 0x00, 0xe8, 0xbf, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x15, 0xff, 0x00, 0x00, 0x00, 0xe8, 0x3f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x22, 0xff, 0x00, 0x00, 0x00, 0xc8, 0x7f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x02, 0xff, 0x80, 0x00, 0x01, 0xd1, 0x7f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x01, 0x7f, 0x3f, 0xfc, 0xe7, 0xb0, 0x7f, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x01, 0x3f, 0x7f, 0xff, 0xf7, 0xa2, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x08, 0xbf, 0xff, 0xff, 0xf3, 0x44, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0xdf, 0xff, 0xff, 0xfe, 0xc5, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x01, 0x6f, 0xff, 0xff, 0xfd, 0x8b, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x33, 0xff, 0xff, 0xf3, 0x03, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x39, 0xff, 0xff, 0xe6, 0x07, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0xbe, 0x7f, 0xff, 0x9e, 0x0d, 0x9b, 0x4c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7b, 0x8f, 0xfc, 0x38, 0x5f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x18, 0xe0, 0x01, 0xc4, 0x3f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x54, 0x1f, 0xf8, 0x26, 0x7f, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x64, 0x40, 0xc0, 0x39, 0xed, 0xcd, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x79, 0x00, 0x00, 0x67, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7e, 0x30, 0x0b, 0x9f, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xc1, 0x70, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-
-def plot_time(yp, t, x, y, var = [0.0,3.3], vpts=[25, 16, 40], hpts = [25, 55, 112]):
-    """"
-    Graph function of the Cartesian plane in relation to time:
-    by: Sergio Andres Castaño Giraldo
-    
-    plot_time(yp, t, x, y, var = [0.0,3.3], vpts=[25, 16, 40], hpts = [25, 55, 112]):
-
-    yp: dependent variable
-    t: time (used while the Cartesian plane is not complete)
-    x: List of two positions of variable x, x[0] is the position in past x and x[1] position of current x.
-    y: List of two positions of the variable y, y[0] is the position in y past and y[1] position of current x.
-    var = [0.0,3.3]: Magnitude of the variable (default voltage)
-    vpts = [25, 16, 40]: points on the vertical y axis.
-    hpts = [25, 55, 112]: points on the vertical x axis.
-
-    Example:
-    #Global Variables
-    t = 0
-    y = [55, 55]
-    x = [25, 25]
-    #Function:
-    volts = pot.read_u16 () * FACTOR
-    t, x, y = plot_time (volts, t, x, y)
-    sleep_ms (500)
-    """
-    #Axis
-    oled.vline(vpts[0], vpts[1], vpts[2], 1) #x, y, h
-    oled.hline(hpts[0], hpts[1], hpts[2], 1) #x, y, w
-    oled.text(str(round(var[0],1)), vpts[0]-25, hpts[1]-5)
-    oled.text(str(round(var[1],1)), vpts[0]-25, vpts[1])
-    #y - axis
-    y[1] = int((yp-var[0])/(var[1]-var[0]) * (vpts[1]-hpts[1]) + hpts[1]) #Interpolation
-    if t < hpts[2] - hpts[0]:
-        x[1] = x[0]+1
-    else:
-        x[1] = hpts[2]
-
-    #Plot the line
-    oled.line(x[0],y[0],x[1],y[1],1)
-    oled.show()
-    
-    #Update past values
-    y[0] = y[1]
-    x[0] = x[1]
-    
-    #If you have already reached the end of the graph then ...
-    if t > hpts[2] - hpts[0]:
-        #Erases the first few pixels of the graph and the y-axis.
-        oled.fill_rect(vpts[0],vpts[1],2,vpts[2],0) 
-        #Clears the entire y-axis scale
-        oled.fill_rect(vpts[0]-25, vpts[1],vpts[0],vpts[2]+5,0)
-        #shifts the graph one pixel to the left
-        oled.scroll(-1,0)
-        #Axis
-        oled.vline(vpts[0], vpts[1], vpts[2], 1) #x, y, h
-        oled.hline(hpts[0], hpts[1], hpts[2], 1) #x, y, w
-        oled.text(str(round(var[0],1)), vpts[0]-25, hpts[1]-5)
-        oled.text(str(round(var[1],1)), vpts[0]-25, vpts[1])
-    else:
-        t += 1
-    
-    return t,x,y
-
-#variables para graficar
-t = 0
-y = [55, 55]
-x = [25, 25] 
+# logo del tec comprimido por corridas (logos.py, generado con
+# host/img2py.py --format rle): ocupa 338 bytes en lugar de 1 KB y
+# rle.blit() lo descomprime directo en el buffer del display
+from logos import LOGO
+import rle
+from textlayout import Marquee
+
+
+# una grafica por variable (reemplazan a plot_time), cada una guarda su historial.
+# temperatura y humedad ajustan su escala a los datos (autoscale) en lugar de
+# usar un rango fijo que recortaba la grafica; los limites se muestran como etiquetas
+grafTemp = StripChart(oled, 20, 30, autoscale=True)
+grafHum = StripChart(oled, 40, 60, autoscale=True)
+grafLuz = StripChart(oled, 0, 1024, ("0.0", "1024"))
+# opcion 5: las tres variables encimadas, cada una con su propio rango;
+# luz en linea continua, temperatura con guiones y humedad con puntos.
+# cada columna junta 10 lecturas (0.5 s) y dibuja su minimo y maximo.
+# las escalas se ajustan solas, las etiquetas son las de la luz
+grafTodas = MultiChart(oled, ((0, 1024), (20, 30), (40, 60)), per_column=10, autoscale=True)
+graficas = {"1": grafLuz, "2": grafTemp, "3": grafHum, "5": grafTodas}
 sensordht = dht.DHT11(machine.Pin(18))
+# ultima lectura del DHT11 para la opcion 5
+temp = 20
+hum = 0
+ultimoDHT = utime.ticks_ms() - 1000
 
   
 def mostrarTemperatura():
-    global t, x, y
     # Leer temperatura y humedad del sensor DHT11
     sensordht.measure()
     #extraemos la temperatura
     temp = sensordht.temperature()
     #graficamos
-    t,x,y = plot_time(temp,t,x,y,var = [20.0,30.0])
-    oled.fill_rect(0,0,120,15,0)
-    oled.show()
+    grafTemp.plot(temp)
     sleep(1)
     print("Temperatura:", temp, "°C")
 
 def mostrarHumedad():
-    global t, x, y
     sensordht.measure()
     hum = sensordht.humidity()
-    t,x,y = plot_time(hum,t,x,y, var = [0.0,100.0])
-    oled.fill_rect(0,0,120,15,0)
-    oled.show()
+    grafHum.plot(hum)
     sleep(1)
     print("Humedad:", hum, "%")
 
@@ -194,42 +79,58 @@ def mostrar_menu():
     print("2. Temperatura")
     print("3. Humedad")
     print("4. Integrantes")
+    print("5. Todas (luz continua, temperatura guiones, humedad puntos)")
 
 # Configurar pin 4 como entrada analógica (ADC)
 ldr = machine.ADC(machine.Pin(4))
 ldr.atten(machine.ADC.ATTN_11DB)   # Permite leer hasta 3.3V aprox.
 ldr.width(machine.ADC.WIDTH_10BIT) # Resolución de 10 bits (0–1023)
 def mostrarLuminosidad():
-    global t, x, y
     valor = ldr.read()   # Lee el valor ADC (0–1023)
     print("Luz:", valor)
-    t,x,y = plot_time(valor,t,x,y, var = [0.0,1024])
-    oled.fill_rect(0,0,120,15,0)
-    oled.show()
+    grafLuz.plot(valor)
     time.sleep(0.5)
+
+def mostrarTodas():
+    global temp, hum, ultimoDHT
+    # el DHT11 da una lectura por segundo como maximo, la luz se lee cada 50 ms
+    if utime.ticks_diff(utime.ticks_ms(), ultimoDHT) >= 1000:
+        sensordht.measure()
+        temp = sensordht.temperature()
+        hum = sensordht.humidity()
+        ultimoDHT = utime.ticks_ms()
+    grafTodas.add(ldr.read(), temp, hum)
+    utime.sleep_ms(50)
     
 def mostrarLOGONombres():
-    oled.fill(0)
-    #recorremos la matriz del logo y lo dibujamos en la pantalla
-    buffer = bytearray(LOGO)
-    fb = framebuf.FrameBuffer(buffer,oled_ancho,oled_alto,framebuf.MONO_HLSB)
-    oled.fill(0)
-    oled.blit(fb,0,0)
+    #descomprimimos el logo en el buffer del display y lo mostramos
+    rle.blit(oled, LOGO)
     oled.show()
     sleep(9)
-    #borramos y mostramos los nombres
+    #borramos y mostramos los nombres como marquesinas: cada cuadro recorre
+    #un pixel las tres franjas y solo se envian esas franjas
     oled.fill(0)
-    oled.text('Rodríguez Martínez Cristopher Giovanni', 0, 0)
-    oled.text('Juan Pablo Aranda Sánchez', 0, 10)
-    oled.text('Marcos Mauricio Becerra Delgado', 0, 20)
-    oled.show()
-    sleep(9)
+    nombres = (Marquee(oled, 'Rodríguez Martínez Cristopher Giovanni', y=8),
+               Marquee(oled, 'Juan Pablo Aranda Sánchez', y=24),
+               Marquee(oled, 'Marcos Mauricio Becerra Delgado', y=40))
+    pacer = ssd1306.FramePacer(50)
+    for _ in range(9 * 50):
+        for m in nombres:
+            m.step()
+        oled.show()
+        pacer.wait()
     
 
 while True:
     inicio = utime.ticks_ms()
     mostrar_menu()
-    opcion = input("Selecciona una opción (1-4): ")
+    opcion = input("Selecciona una opción (1-5): ")
+    # al cambiar de opcion se dibuja de nuevo la grafica elegida con su historial
+    if opcion in graficas:
+        oled.fill(0)
+        if opcion == "5":
+            oled.text("Luz Temp Hum", 0, 0)
+        graficas[opcion].redraw()
     while utime.ticks_diff(utime.ticks_ms(), inicio) < 20000:
         if opcion == "1":
             mostrarLuminosidad()
@@ -239,6 +140,8 @@ while True:
             mostrarHumedad()
         elif opcion == "4":
             mostrarLOGONombres()
+        elif opcion == "5":
+            mostrarTodas()
         else:
             print("Opción no válida. Intenta de nuevo.")
     print()  # Línea en blanco para separar
\ No newline at end of file
@@ -0,0 +1,30 @@
+# Generated by host/img2py.py, do not edit.
+# 128x64 run-length images; draw them with rle.blit(oled, NAME).
+
+# from sensorLuz/cod.py:LOGO (the former list of ints)
+LOGO = (
+    b"\x80\x40\xf8\x00\xfa\xfe\x06\xee\xce\x9e\xee\x8e\xfe\xee\xfc\xfe"
+    b"\x00\xbe\xfd\xfe\x01\xbe\xae\xe6\xfe\xbf\x00\xf8\x00\xf6\xff\xfc"
+    b"\x7f\x0c\x7b\x7b\x63\x7f\x7f\xff\xff\xf3\xe7\xf3\xff\xf7\xef\xfe"
+    b"\xff\x05\xf7\xff\xef\xef\xf7\xfb\xf2\xff\xbf\x00\xf8\x00\x0c\x3f"
+    b"\x9f\xcf\xe7\xf3\xfb\xf9\xfd\xfc\xfe\xf2\xfe\xfe\xfc\xff\x01\xef"
+    b"\xe6\xfe\xfe\x10\xfc\xfd\xf9\x7b\x33\xa7\x4f\x9f\x3f\x7f\xff\xfb"
+    b"\xfc\xf8\xff\xff\xfb\xfd\xff\x04\xfb\xfb\xfc\xfc\xf9\xfd\xff\xbf"
+    b"\x00\xfb\x00\x02\xc0\xf0\xfc\xfe\xff\x00\xfb\xfa\xff\x04\x0f\x03"
+    b"\x07\x03\x03\xfe\x01\xfe\x00\x0d\x01\x1f\x3f\x3f\xff\xef\xff\xfe"
+    b"\xff\xbc\xb0\xf1\xc3\x1f\xf0\xff\xbf\x00\x01\x00\x00\xfe\x80\x00"
+    b"\x00\xfa\xff\x04\xfe\xff\xff\x06\x02\xf0\x00\x00\xf7\xf9\xff\x05"
+    b"\x00\x00\x81\x03\x07\x1f\xf5\xff\xbf\x00\x09\x00\x03\x13\x09\x03"
+    b"\x08\x33\xcf\x3f\x7f\xfb\xff\x01\x20\x80\xf5\xc0\x01\x80\x80\xfe"
+    b"\xc0\x0e\x80\x00\xc0\xc0\xe1\xff\x3f\xcf\x63\x1c\x03\x81\x23\x87"
+    b"\xf0\xf5\xff\xbf\x00\xfd\x00\x0f\x01\x00\x00\x04\x23\x46\x7d\xfb"
+    b"\xf7\x27\x6f\x5f\xdf\xbf\xbf\x3f\xf7\x7f\x1f\x3f\xbf\xbf\x9f\x5f"
+    b"\x6f\x66\xb6\x3b\x0d\x06\x43\x80\xc0\xe4\xf3\xdc\xfe\xff\xdf\xdf"
+    b"\xff\xff\xdf\xff\xff\xdf\xff\xdf\xdf\xff\xff\xbf\x00\xf8\x00\x0a"
+    b"\x7f\x7e\x7d\x7c\x7b\x78\x74\x70\x72\x68\x69\xfe\x61\x17\x71\x63"
+    b"\x73\x71\x71\x69\x60\x68\x68\x78\x74\x77\x7a\x7a\x7d\x7d\x7e\x7e"
+    b"\x7f\x7f\x7d\x7f\x7f\x7d\xfe\x7f\x04\x7d\x7d\x7f\x7f\x7d\xfa\x7f"
+    b"\xbf\x00"
+)
+LOGO_W = 128
+LOGO_H = 64